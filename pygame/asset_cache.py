@@ -0,0 +1,418 @@
+import os
+import json
+import pygame
+from compiled_cache import CompiledAssetCache
+
+# Manifest written by build_atlas.py
+ATLAS_MANIFEST_PATH = 'assets/atlas/atlas.json'
+
+
+class AssetCache:
+    """
+    Process-wide image cache shared by all entity instances.
+
+    Each image is loaded from disk, converted and scaled once per
+    (path, size, alpha) key; every later request returns the same Surface.
+    Sprite sheet frames are sliced once per (path, frame rect, size) key,
+    and GIF animations are decoded once per (path, size) key.
+    Callers must treat the returned surfaces as read-only.
+
+    When a texture atlas has been loaded (see load_atlas), these entries are
+    pre-registered as subsurfaces of a few atlas pages, so no per-sprite
+    files are read at all. Otherwise scaled images, frames and GIF
+    animations are kept in the on-disk compiled cache between launches.
+    """
+    def __init__(self):
+        self.images = {}      # Format: {(path, size, alpha): Surface}
+        self.frames = {}      # Format: {(path, (x, y, w, h), size): Surface}
+        self.animations = {}  # Format: {(path, size): [Surface, ...]}
+        self.flipped = {}     # Format: {id(surface): (surface, flipped_surface)}
+        
+        # Source image sizes known without loading the image (from the atlas)
+        self.source_sizes = {}  # Format: {path: (width, height)}
+        
+        # Decoded pixels persisted across launches (see compiled_cache.py)
+        self.compiled = CompiledAssetCache()
+        
+        # Atlas pages and their named frames, once load_atlas() has run
+        self.atlas_pages = []
+        self.atlas_frames = {}  # Format: {name: Surface}
+        self.atlas_pivots = {}  # Format: {name: (x, y)}
+        
+        # When True, decoding a GIF also writes a pre-decoded strip next to it
+        # so later launches can skip PIL entirely (see get_gif_frames)
+        self.bake_gif_strips = False
+
+        # Counters to confirm the cache is warm (hits) vs. doing I/O (misses)
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0  # Image files actually read from disk
+
+    def get_image(self, path, size=None, alpha=True):
+        """
+        Get an image, loading and scaling it on first use
+
+        Args:
+            path: Path to the image file
+            size: Optional (width, height) to scale the image to
+            alpha: Use convert_alpha() (True) or convert() (False)
+
+        Returns:
+            A shared pygame Surface
+
+        Raises:
+            pygame.error / FileNotFoundError if the image cannot be loaded,
+            so callers can fall back to their own placeholder sprites
+        """
+        key = (path, tuple(size) if size else None, alpha)
+
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+
+        if key[1] is not None:
+            compiled = self.compiled.load(path, 'image', key[1]) if alpha else None
+            if compiled:
+                image = compiled[0]
+            else:
+                # Scale from the cached unscaled original so the file is read once
+                source = self.get_image(path, None, alpha)
+                image = pygame.transform.scale(source, key[1])
+                if alpha:
+                    self.compiled.store(path, 'image', key[1], [image])
+        else:
+            image = pygame.image.load(path)
+            image = image.convert_alpha() if alpha else image.convert()
+            self.loads += 1
+
+        self.images[key] = image
+        return image
+
+    def get_frame(self, path, rect, size=None):
+        """
+        Get a single frame sliced from a sprite sheet, slicing it on first use
+
+        Unscaled frames are subsurface views into the resident sheet (no pixel
+        copy); scaled frames are one shared scaled copy per size.
+
+        Args:
+            path: Path to the sprite sheet image
+            rect: (x, y, width, height) of the frame in the sheet
+            size: Optional (width, height) to scale the frame to
+
+        Returns:
+            A shared pygame Surface
+        """
+        key = (path, tuple(rect), tuple(size) if size else None)
+
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+
+        if key[2] is None or key[2] == (rect[2], rect[3]):
+            frame = self.slice_sheet(path, rect)
+        else:
+            variant = f"frame:{key[1]}"
+            compiled = self.compiled.load(path, variant, key[2])
+            if compiled:
+                frame = compiled[0]
+            else:
+                # Scale straight from the view, without an intermediate copy
+                frame = pygame.transform.scale(self.slice_sheet(path, rect), key[2])
+                self.compiled.store(path, variant, key[2], [frame])
+
+        self.frames[key] = frame
+        return frame
+
+    def slice_sheet(self, path, rect):
+        """Get a subsurface view of a frame in a resident sprite sheet"""
+        sheet = self.get_image(path)
+        try:
+            return sheet.subsurface(rect)
+        except ValueError:
+            # Frame hangs over the sheet edge: copy the part that exists
+            x, y, width, height = rect
+            frame = pygame.Surface((width, height), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), (x, y, width, height))
+            return frame
+
+    def get_frames(self, path, rects, size=None):
+        """Get a list of shared frames sliced from a sprite sheet"""
+        return [self.get_frame(path, rect, size) for rect in rects]
+
+    def get_flipped(self, surface):
+        """
+        Get a horizontally mirrored copy of a shared surface, flipping it on first use
+
+        Args:
+            surface: A surface returned by this cache (or any long-lived surface)
+
+        Returns:
+            A shared, mirrored pygame Surface
+        """
+        entry = self.flipped.get(id(surface))
+        if entry is not None and entry[0] is surface:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+
+        # Keep a reference to the source so its id() cannot be reused
+        flipped = pygame.transform.flip(surface, True, False)
+        self.flipped[id(surface)] = (surface, flipped)
+        return flipped
+
+    def get_image_size(self, path):
+        """Get the unscaled size of an image, without loading it when the atlas knows it"""
+        size = self.source_sizes.get(path)
+        if size is None:
+            size = self.get_image(path).get_size()
+            self.source_sizes[path] = size
+        return size
+
+    def has_image(self, path):
+        """Check whether an image is available (in the atlas or on disk)"""
+        return path in self.source_sizes or os.path.exists(path)
+
+    def get_gif_strip_path(self, path, size):
+        """Get the path of the pre-decoded strip for a GIF at a given size"""
+        base, _ = os.path.splitext(path)
+        return f"{base}_strip_{size[0]}x{size[1]}.png"
+
+    def get_gif_frames(self, path, size):
+        """
+        Get the decoded, scaled frames of an animated GIF
+
+        Frames are read from a pre-decoded strip (frames laid out left to right
+        at the target size) when one exists and is newer than the GIF;
+        otherwise the GIF is decoded with PIL.
+
+        Args:
+            path: Path to the GIF file
+            size: (width, height) to scale each frame to
+
+        Returns:
+            A shared list of pygame Surfaces
+        """
+        key = (path, tuple(size))
+
+        frames = self.animations.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+
+        frames = self.load_gif_strip(path, key[1])
+        if frames is None:
+            frames = self.compiled.load(path, 'gif', key[1])
+        if frames is None:
+            frames = self.decode_gif(path, key[1])
+            self.compiled.store(path, 'gif', key[1], frames)
+            if self.bake_gif_strips:
+                self.save_gif_strip(path, key[1], frames)
+
+        self.animations[key] = frames
+        return frames
+
+    def load_gif_strip(self, path, size):
+        """Load frames from a pre-decoded strip, or None if missing or stale"""
+        strip_path = self.get_gif_strip_path(path, size)
+        if not os.path.exists(strip_path):
+            return None
+        if os.path.exists(path) and os.path.getmtime(strip_path) < os.path.getmtime(path):
+            print(f"Ignoring stale GIF strip {strip_path}")
+            return None
+
+        strip = pygame.image.load(strip_path)
+        self.loads += 1
+        if pygame.display.get_surface():
+            strip = strip.convert_alpha()
+
+        frame_width, frame_height = size
+        frame_count = strip.get_width() // frame_width
+        return [strip.subsurface((i * frame_width, 0, frame_width, frame_height))
+                for i in range(frame_count)]
+
+    def decode_gif(self, path, size):
+        """Decode every frame of a GIF with PIL and scale it"""
+        # PIL is only needed when no pre-decoded strip is available
+        from PIL import Image, ImageSequence
+
+        gif = Image.open(path)
+        self.loads += 1
+
+        frames = []
+        for frame in ImageSequence.Iterator(gif):
+            # Convert PIL image to pygame surface
+            frame_rgba = frame.convert("RGBA")
+            py_frame = pygame.image.fromstring(frame_rgba.tobytes(), frame_rgba.size, frame_rgba.mode)
+
+            # Scale the frame to the requested dimensions
+            frames.append(pygame.transform.scale(py_frame, size))
+
+        return frames
+
+    def save_gif_strip(self, path, size, frames=None):
+        """Write the decoded frames of a GIF as a strip image next to it"""
+        if frames is None:
+            frames = self.decode_gif(path, size)
+
+        strip = pygame.Surface((size[0] * len(frames), size[1]), pygame.SRCALPHA)
+        for i, frame in enumerate(frames):
+            strip.blit(frame, (i * size[0], 0))
+
+        strip_path = self.get_gif_strip_path(path, size)
+        pygame.image.save(strip, strip_path)
+        print(f"Saved GIF strip {strip_path} ({len(frames)} frames)")
+        return strip_path
+
+    def load_atlas(self, manifest_path=ATLAS_MANIFEST_PATH):
+        """
+        Register every frame of a pre-built texture atlas (see build_atlas.py)
+
+        Each frame becomes a subsurface of its atlas page and is stored under
+        the same key the entities request, so later lookups are plain hits.
+
+        Args:
+            manifest_path: Path to the atlas JSON manifest
+
+        Returns:
+            True if the atlas was loaded, False if it is missing or out of date
+        """
+        if not os.path.exists(manifest_path):
+            print(f"No texture atlas at {manifest_path}, loading sprites individually")
+            return False
+
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+
+            # An atlas built from different source files would show stale sprites.
+            # Same check as the compiled cache: mtime and size first, then sha1
+            for path, source in manifest['sources'].items():
+                if not self.compiled.is_fresh(path, source['mtime'], source['bytes'], bytes.fromhex(source['sha1'])):
+                    print(f"Texture atlas is out of date ({path} changed), loading sprites individually")
+                    return False
+
+            base_dir = os.path.dirname(manifest_path)
+            pages = []
+            for page_file in manifest['pages']:
+                page = pygame.image.load(os.path.join(base_dir, page_file))
+                if pygame.display.get_surface():
+                    page = page.convert_alpha()
+                pages.append(page)
+                self.loads += 1
+
+            animations = {}
+            for entry in manifest['frames']:
+                page = pages[entry['page']]
+                surface = page.subsurface(entry['rect'])
+                size = tuple(entry['size']) if entry['size'] else None
+
+                if entry['kind'] == 'image':
+                    self.images[(entry['path'], size, True)] = surface
+                elif entry['kind'] == 'frame':
+                    self.frames[(entry['path'], tuple(entry['source_rect']), size)] = surface
+                elif entry['kind'] == 'animation':
+                    animations.setdefault((entry['path'], size), {})[entry['index']] = surface
+
+                if 'flipped_rect' in entry:
+                    self.flipped[id(surface)] = (surface, page.subsurface(entry['flipped_rect']))
+
+                self.atlas_frames[entry['name']] = surface
+                self.atlas_pivots[entry['name']] = tuple(entry['pivot'])
+
+            for key, frames in animations.items():
+                self.animations[key] = [frames[i] for i in sorted(frames)]
+
+            for path, source in manifest['sources'].items():
+                if 'size' in source:
+                    self.source_sizes[path] = tuple(source['size'])
+
+            self.atlas_pages = pages
+            print(f"Loaded texture atlas: {len(manifest['frames'])} frames on {len(pages)} page(s)")
+            return True
+
+        except Exception as e:
+            print(f"Error loading texture atlas {manifest_path}: {e}")
+            return False
+
+    def get_atlas_frame(self, name):
+        """Get a named frame from the loaded atlas, or None"""
+        return self.atlas_frames.get(name)
+
+    def get_surface_bytes(self, surface):
+        """Get the pixel bytes a surface owns (0 for subsurface views)"""
+        if surface.get_parent() is not None:
+            return 0
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get_memory_report(self):
+        """
+        Get the pixel memory held by the cache
+
+        Returns:
+            Dict with surface/view counts and owned pixel bytes; views share
+            their sheet's (or atlas page's) pixels and own nothing
+        """
+        surfaces = {}
+        for surface in self.images.values():
+            surfaces[id(surface)] = surface
+        for surface in self.frames.values():
+            surfaces[id(surface)] = surface
+        for frames in self.animations.values():
+            for surface in frames:
+                surfaces[id(surface)] = surface
+        for _, flipped in self.flipped.values():
+            surfaces[id(flipped)] = flipped
+        for page in self.atlas_pages:
+            surfaces[id(page)] = page
+
+        views = sum(1 for surface in surfaces.values() if surface.get_parent() is not None)
+        return {
+            'surfaces': len(surfaces),
+            'views': views,
+            'owned_bytes': sum(self.get_surface_bytes(surface) for surface in surfaces.values())
+        }
+
+    def get_stats(self):
+        """Get hit/miss counters for the cache"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'loads': self.loads,
+            'compiled_hits': self.compiled.hits,
+            'compiled_misses': self.compiled.misses,
+            'entries': len(self.images) + len(self.frames) + len(self.animations),
+            'hit_rate': (self.hits / total) if total > 0 else 0.0
+        }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters without dropping cached images"""
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def clear(self):
+        """Drop all cached images (e.g. after the display mode changes)"""
+        self.images.clear()
+        self.frames.clear()
+        self.animations.clear()
+        self.flipped.clear()
+        self.source_sizes.clear()
+        self.atlas_pages = []
+        self.atlas_frames.clear()
+        self.atlas_pivots.clear()
+        self.reset_stats()
+
+
+# Singleton instance
+asset_cache = AssetCache()
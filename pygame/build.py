@@ -22,6 +22,36 @@ def clean_build_dirs():
             print(f"Cleaning {dir_name} directory...")
             shutil.rmtree(dir_name)
 
+def bake_gif_strips():
+    """Pre-decode animated GIFs into strips so the packaged game can skip PIL"""
+    # Imported lazily so the build still works when pygame/PIL are missing
+    try:
+        from asset_cache import asset_cache
+    except ImportError as e:
+        print(f"Skipping GIF strip baking: {e}")
+        return
+    
+    # (path, size) pairs requested by entities at runtime
+    gif_animations = [
+        ('assets/slime_idle.gif', (32, 24)),
+        ('assets/slime_move.gif', (32, 24)),
+    ]
+    
+    for path, size in gif_animations:
+        try:
+            asset_cache.save_gif_strip(path, size)
+        except Exception as e:
+            print(f"Could not bake GIF strip for {path}: {e}")
+
+def build_texture_atlas():
+    """Pack all game sprites into the texture atlas loaded at startup"""
+    # Run in a separate process since the builder needs its own (dummy) display
+    cmd = [sys.executable, "build_atlas.py"]
+    print("Running command:", " ".join(cmd))
+    result = subprocess.run(cmd)
+    if result.returncode != 0:
+        print("Warning: texture atlas build failed, sprites will load individually")
+
 def create_windows_build():
     """Create a Windows executable using the .spec file"""
     print("Building for Windows...")
@@ -116,6 +146,12 @@ def main():
     # Clean up previous builds
     clean_build_dirs()
     
+    # Bake pre-decoded GIF strips into the assets folder before packaging
+    bake_gif_strips()
+    
+    # Pack sprites into the texture atlas before packaging
+    build_texture_atlas()
+    
     # Build for the current platform
     try:
         if current_platform == "windows":
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Texture atlas builder.
+
+Loads every sprite the game uses through the asset cache (the same code paths
+the entities use at runtime), packs the resulting frames, GIF frames and
+pre-flipped variants into one or a few atlas pages, and writes a JSON manifest
+describing each named frame. At startup AssetCache.load_atlas() reads the
+pages once and registers every frame as a subsurface.
+
+Run from the pygame directory:
+    python build_atlas.py
+"""
+
+import os
+import sys
+import json
+import time
+
+# Sprites are converted with convert_alpha(), which needs a display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from asset_cache import asset_cache, ATLAS_MANIFEST_PATH
+from loading_screen import get_preload_steps
+
+# Largest atlas page; frames that do not fit start a new page
+PAGE_SIZE = 2048
+# Transparent gap between frames so filtering never bleeds into neighbours
+PADDING = 1
+
+
+def clear_sprite_banks():
+    """Drop the class-level sprite banks so entities request their frames again"""
+    from entities.enemy.skeleton import Skeleton
+    from entities.enemy.slime import Slime
+    from entities.bonfire import Bonfire
+    from entities.player.sword_angles import SwordAngleTable
+    from items.item_registry import item_registry
+    from ground import ground_renderer
+
+    Skeleton.sprite_banks.clear()
+    Slime.sprite_banks.clear()
+    Bonfire.sprite_banks.clear()
+    SwordAngleTable.tables.clear()
+    item_registry.sprites.clear()
+    item_registry.types.clear()
+    item_registry.item_classes_loaded = False
+    ground_renderer.tiles = None
+    ground_renderer.clear()
+
+
+def load_game_sprites():
+    """Run the game's preload steps so the asset cache holds every frame"""
+    for label, step in get_preload_steps(include_atlas=False):
+        step()
+
+
+def collect_entries():
+    """
+    Turn the cache contents into atlas entries
+
+    Unscaled source images are skipped: they are only used to slice and scale
+    the frames, which are packed themselves.
+
+    Returns:
+        List of entry dicts, each with a 'surface' to pack
+    """
+    entries = []
+    names = {}
+
+    def add_entry(kind, path, surface, **fields):
+        base = os.path.splitext(os.path.basename(path))[0]
+        names[base] = names.get(base, -1) + 1
+        entry = {
+            'name': f"{base}_{names[base]}",
+            'kind': kind,
+            'path': path,
+            'surface': surface,
+        }
+        entry.update(fields)
+        entries.append(entry)
+
+    for (path, size, alpha), surface in asset_cache.images.items():
+        if size is not None and alpha:
+            add_entry('image', path, surface, size=list(size))
+
+    for (path, rect, size), surface in asset_cache.frames.items():
+        add_entry('frame', path, surface, source_rect=list(rect), size=list(size) if size else None)
+
+    for (path, size), frames in asset_cache.animations.items():
+        for index, surface in enumerate(frames):
+            add_entry('animation', path, surface, index=index, size=list(size))
+
+    # Attach the pre-flipped variant to the frame it mirrors
+    by_surface = {id(entry['surface']): entry for entry in entries}
+    for source, flipped in asset_cache.flipped.values():
+        entry = by_surface.get(id(source))
+        if entry is not None:
+            entry['flipped_surface'] = flipped
+
+    return entries
+
+
+def pack_entries(entries):
+    """
+    Shelf-pack every frame (and its flipped variant) into atlas pages
+
+    Returns:
+        List of page sizes; each entry gets 'page', 'rect' and 'flipped_rect'
+    """
+    # Each packed image: (entry, field name, surface)
+    images = []
+    for entry in entries:
+        images.append((entry, 'rect', entry['surface']))
+        if 'flipped_surface' in entry:
+            images.append((entry, 'flipped_rect', entry['flipped_surface']))
+
+    # Tallest first keeps shelves tight
+    images.sort(key=lambda item: (item[2].get_height(), item[2].get_width()), reverse=True)
+
+    page_sizes = []
+    page = -1
+    shelf_x = shelf_y = shelf_height = 0
+
+    for entry, field, surface in images:
+        width, height = surface.get_size()
+
+        # Start a new shelf when the current one is full
+        if shelf_x + width > PAGE_SIZE:
+            shelf_x = 0
+            shelf_y += shelf_height + PADDING
+            shelf_height = 0
+
+        # Start a new page when there is none yet or the shelf does not fit
+        if page < 0 or shelf_y + height > PAGE_SIZE:
+            page += 1
+            page_sizes.append([0, 0])
+            shelf_x = shelf_y = shelf_height = 0
+
+        entry['page'] = page
+        entry[field] = [shelf_x, shelf_y, width, height]
+
+        page_sizes[page][0] = max(page_sizes[page][0], shelf_x + width)
+        page_sizes[page][1] = max(page_sizes[page][1], shelf_y + height)
+
+        shelf_x += width + PADDING
+        shelf_height = max(shelf_height, height)
+
+    return page_sizes
+
+
+def write_atlas(entries, page_sizes, manifest_path=ATLAS_MANIFEST_PATH):
+    """Render the atlas pages and write the manifest next to them"""
+    atlas_dir = os.path.dirname(manifest_path)
+    os.makedirs(atlas_dir, exist_ok=True)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for entry in entries:
+        pages[entry['page']].blit(entry['surface'], entry['rect'][:2])
+        if 'flipped_surface' in entry:
+            pages[entry['page']].blit(entry['flipped_surface'], entry['flipped_rect'][:2])
+
+    page_files = []
+    for i, page in enumerate(pages):
+        page_file = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(atlas_dir, page_file))
+        page_files.append(page_file)
+
+    frames = []
+    for entry in entries:
+        width, height = entry['surface'].get_size()
+        frame = {key: value for key, value in entry.items() if not key.endswith('surface')}
+        # Default pivot: bottom centre (where the sprite stands)
+        frame['pivot'] = [width // 2, height]
+        frames.append(frame)
+
+    # Source files, so the runtime can spot a stale atlas and knows image
+    # sizes without loading them
+    sources = {}
+    for entry in entries:
+        path = entry['path']
+        if path in sources or not os.path.exists(path):
+            continue
+        mtime, size, sha1 = asset_cache.compiled.get_source_digest(path)
+        sources[path] = {'mtime': mtime, 'bytes': size, 'sha1': sha1.hex()}
+        if entry['kind'] != 'animation':
+            sources[path]['size'] = list(asset_cache.get_image_size(path))
+
+    manifest = {
+        'pages': page_files,
+        'sources': sources,
+        'frames': frames,
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+
+    return page_files
+
+
+def main():
+    """Build the atlas and report the cold-start difference"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    # Compare true cold starts: neither run may read the compiled sprite cache
+    asset_cache.compiled.enabled = False
+
+    # Silence the entities' debug output while loading
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        start = time.perf_counter()
+        load_game_sprites()
+        individual_time = time.perf_counter() - start
+        individual_loads = asset_cache.loads
+
+        entries = collect_entries()
+        page_sizes = pack_entries(entries)
+        page_files = write_atlas(entries, page_sizes)
+
+        # Cold start again, this time from the atlas
+        asset_cache.clear()
+        clear_sprite_banks()
+        start = time.perf_counter()
+        asset_cache.load_atlas()
+        load_game_sprites()
+        atlas_time = time.perf_counter() - start
+        atlas_loads = asset_cache.loads
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"Packed {len(entries)} frames into {len(page_files)} page(s): "
+          + ", ".join(f"{name} {w}x{h}" for name, (w, h) in zip(page_files, page_sizes)))
+    print(f"Manifest written to {ATLAS_MANIFEST_PATH}")
+    print(f"Cold start without atlas: {individual_loads} image loads, {individual_time * 1000:.1f} ms")
+    print(f"Cold start with atlas:    {atlas_loads} image loads, {atlas_time * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,22 @@
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from text_cache import text_cache
+from font_manager import font_manager
+
+MARGIN = 30  # Distance from the screen edge to the sheet border
+ATTRIBUTES_X = SCREEN_WIDTH // 2  # Attributes and abilities column
+ATTRIBUTES_Y = 90
+ITEM_INSTRUCTIONS = "Press E/Button A to use selected item"
+SKILL_INSTRUCTIONS = "Click on a skill to view details and unlock it"
+
+# Abilities listed on the attributes tab once their skill is unlocked
+ABILITIES = [
+    {"id": "basic_sword", "name": "Sword Attack", "desc": "Basic sword attack (SPACE/Button 2)"},
+    {"id": "sprint", "name": "Sprint", "desc": "Temporary speed boost (SHIFT/Button 4)"},
+    {"id": "dash", "name": "Dash", "desc": "Quick directional burst (CTRL)"},
+    {"id": "extended_sword", "name": "Extended Sword", "desc": "Increased sword reach"},
+    {"id": "blink", "name": "Blink", "desc": "Short-range teleport (B/Button 1)"}
+]
 
 class CharacterScreen:
     def __init__(self, player):
@@ -42,11 +59,11 @@ class CharacterScreen:
         self.item_feedback_timer = 0
         
         # Fonts
-        self.title_font = pygame.font.SysFont('Arial', 26, bold=True)
-        self.stat_font = pygame.font.SysFont('Arial', 22, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 18)
-        self.button_font = pygame.font.SysFont('Arial', 16)
-        self.desc_font = pygame.font.SysFont('Arial', 16)
+        self.title_font = font_manager.get_font(26, bold=True)
+        self.stat_font = font_manager.get_font(22, bold=True)
+        self.text_font = font_manager.get_font(18)
+        self.button_font = font_manager.get_font(16)
+        self.desc_font = font_manager.get_font(16)
         
         # Load portrait
         self.portrait = self.load_portrait()
@@ -80,6 +97,21 @@ class CharacterScreen:
         # Add cursor position for tooltip rendering
         self.cursor_pos = (0, 0)  # Default position for cursor-based tooltips
         
+        # Semi-transparent overlay drawn over the game world, created once
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay.fill(self.colors['background'])
+        
+        # Screen layout: positions and hit rectangles of everything on the sheet,
+        # computed once and shared by draw() and handle_event()
+        self.build_layout()
+        
+        # Cached panel surfaces, re-rendered only when the state they show changes
+        # Format: {panel_name: (Surface, state_key)}
+        self.panels = {}
+        # Cached item tooltips
+        # Format: {(item_name, description): Surface}
+        self.tooltips = {}
+        
     def load_portrait(self):
         """Load Link portrait from file with fallback to placeholder"""
         portrait_size = 220
@@ -146,17 +178,176 @@ class CharacterScreen:
         button_width = 30
         button_height = 30
         
-        # These buttons will now be positioned relative to the attribute section
-        # Will be used in draw() method to position them correctly
+        # Buttons sit to the right of the attribute names (see build_layout)
         stats = ['str', 'con', 'dex', 'int']
         for i, stat in enumerate(stats):
-            # Just initialize with temporary positions, we'll update them in draw()
             self.buttons[f'inc_{stat}'] = {
-                'rect': pygame.Rect(0, 0, button_width, button_height),
+                'rect': pygame.Rect(ATTRIBUTES_X + 200, ATTRIBUTES_Y + 35 + i * 40, button_width, button_height),
                 'text': '+',
                 'action': lambda s=stat: self.player.increase_stat(s)
             }
     
+    def build_layout(self):
+        """Compute the position of every panel, button, item slot and skill node"""
+        # Tabs at the bottom of the character sheet
+        tab_width = 150
+        tab_height = 30
+        tab_y = SCREEN_HEIGHT - MARGIN - tab_height - 10  # 10px padding from the bottom margin
+        self.tab_rects = {
+            "attributes": pygame.Rect(SCREEN_WIDTH // 2 - tab_width - 5, tab_y, tab_width, tab_height),
+            "skills": pygame.Rect(SCREEN_WIDTH // 2 + 5, tab_y, tab_width, tab_height)
+        }
+        self.separator_y = tab_y - 10
+        
+        # Portrait with the character stats to its right, items grid below it
+        self.portrait_pos = (MARGIN + 50, MARGIN + 80)
+        portrait_size = self.portrait.get_width()
+        self.stats_x = self.portrait_pos[0] + portrait_size + 30
+        items_y = self.portrait_pos[1] + portrait_size + 30
+        
+        # Item grid cells, indexed like the inventory
+        grid_width = self.cell_size * self.grid_cols + self.grid_padding * (self.grid_cols + 1)
+        grid_height = self.cell_size * self.grid_rows + self.grid_padding * (self.grid_rows + 1)
+        self.grid_rect = pygame.Rect(self.portrait_pos[0], items_y + 35, grid_width, grid_height)
+        self.item_cell_rects = [
+            pygame.Rect(self.grid_rect.x + col * (self.cell_size + self.grid_padding) + self.grid_padding,
+                        self.grid_rect.y + row * (self.cell_size + self.grid_padding) + self.grid_padding,
+                        self.cell_size, self.cell_size)
+            for row in range(self.grid_rows) for col in range(self.grid_cols)
+        ]
+        
+        # Skill tree nodes and the detail panel below them
+        self.build_skill_layout()
+        self.detail_rect = pygame.Rect(MARGIN + 50, SCREEN_HEIGHT - MARGIN - 150 - tab_height - 20,
+                                       SCREEN_WIDTH - MARGIN * 2 - 100, 120)
+        self.unlock_button_rect = pygame.Rect(self.detail_rect.right - 120, self.detail_rect.bottom - 40, 100, 30)
+        
+        # Screen area of each cached panel
+        instructions_width = self.text_font.size(ITEM_INSTRUCTIONS)[0]
+        self.panel_rects = {
+            'tabs': pygame.Rect(MARGIN + 10, self.separator_y, SCREEN_WIDTH - MARGIN * 2 - 19, tab_y + tab_height - self.separator_y),
+            'profile': pygame.Rect(self.portrait_pos[0], self.portrait_pos[1], portrait_size + 30 + 260, max(portrait_size, 230)),
+            'attributes': pygame.Rect(ATTRIBUTES_X, ATTRIBUTES_Y, 300, 200),
+            'abilities': pygame.Rect(ATTRIBUTES_X, ATTRIBUTES_Y + 210, SCREEN_WIDTH - ATTRIBUTES_X - MARGIN - 10, 360),
+            'items': pygame.Rect(self.portrait_pos[0], items_y, max(grid_width, 100 + instructions_width), 35 + grid_height),
+            'skills': self.skill_tree_rect,
+            'skill_detail': self.detail_rect
+        }
+    
+    def build_skill_layout(self):
+        """Place the skill tree: branch headers, then each skill below its parent"""
+        branches = self.player.skill_tree.get_skills_by_branch()
+        branch_names = ["Mind", "Body", "Magic Sword"]
+        branch_ids = ["mind", "body", "magic_sword"]
+        
+        screen_width = SCREEN_WIDTH - MARGIN * 2 - 100
+        branch_width = screen_width // 3
+        start_y = MARGIN + 170  # Branch headers sit below the instructions
+        diamond_size = 20
+        level_spacing = 110  # Vertical spacing between levels
+        skill_spacing = 170  # Horizontal spacing between siblings
+        
+        self.skill_tree_top = start_y
+        # Format: [(branch_name, branch_x)]
+        self.branch_headers = []
+        # Skills in drawing order with the start of the line leading to them
+        # Format: [(skill_id, (x, y), (line_start_x, line_start_y))]
+        self.skill_nodes = []
+        # Mouse hitboxes, larger than the diamonds for easier selection
+        # Format: {skill_id: Rect}
+        self.skill_rects = {}
+        
+        skill_positions = {}
+        for branch_idx, branch_id in enumerate(branch_ids):
+            skills = branches[branch_id]
+            branch_x = MARGIN + 50 + branch_idx * branch_width + branch_width // 2
+            self.branch_headers.append((branch_names[branch_idx], branch_x))
+            
+            # First level skills (direct children of the branch), spread horizontally
+            first_level_skills = [skill for skill in skills if not skill.parent]
+            first_level_count = len(first_level_skills)
+            for i, skill in enumerate(first_level_skills):
+                skill_x = branch_x
+                if first_level_count > 1:
+                    skill_x += (i - (first_level_count - 1) / 2) * skill_spacing
+                skill_y = start_y + 80
+                self.skill_nodes.append((skill.id, (skill_x, skill_y), (branch_x, start_y + diamond_size * 2)))
+                skill_positions[skill.id] = (skill_x, skill_y)
+            
+            # Group the remaining skills by parent
+            skill_levels = {}
+            for skill in skills:
+                if skill.parent:
+                    skill_levels.setdefault(skill.parent, []).append(skill)
+            
+            # Place children under their parents, one level at a time
+            done = False
+            while not done:
+                done = True
+                for parent_id in list(skill_levels.keys()):
+                    if parent_id in skill_positions:
+                        parent_x, parent_y = skill_positions[parent_id]
+                        children = skill_levels.pop(parent_id)
+                        done = False
+                        
+                        child_count = len(children)
+                        for i, child in enumerate(children):
+                            child_x = parent_x
+                            if child_count > 1:
+                                child_x += (i - (child_count - 1) / 2) * skill_spacing
+                            child_y = parent_y + level_spacing
+                            self.skill_nodes.append((child.id, (child_x, child_y), (parent_x, parent_y + 18)))
+                            skill_positions[child.id] = (child_x, child_y)
+        
+        # Hitboxes, and the area the tree panel covers (headers, diamonds and labels)
+        hitbox_size = 50
+        skills = self.player.skill_tree.skills
+        self.skill_tree_rect = pygame.Rect(MARGIN + 50, MARGIN + 90, *self.text_font.size(SKILL_INSTRUCTIONS))
+        self.skill_tree_rect.height += 30
+        for branch_name, branch_x in self.branch_headers:
+            name_width, name_height = self.text_font.size(branch_name)
+            self.skill_tree_rect.union_ip(pygame.Rect(branch_x - name_width // 2, start_y - name_height - 5, name_width, name_height))
+            self.skill_tree_rect.union_ip(pygame.Rect(branch_x - diamond_size, start_y, diamond_size * 2, diamond_size * 2))
+        for skill_id, (x, y), line_start in self.skill_nodes:
+            self.skill_rects[skill_id] = pygame.Rect(x - hitbox_size//2, y - hitbox_size//2, hitbox_size, hitbox_size)
+            for text, text_y in ((skills[skill_id].name, -1), (f"Level {skills[skill_id].level_required}+", 1)):
+                text_width, text_height = self.text_font.size(text)
+                label_y = y - 18 - text_height - 5 if text_y < 0 else y + 18 + 5
+                self.skill_tree_rect.union_ip(pygame.Rect(x - text_width // 2, label_y, text_width, text_height))
+        self.skill_tree_rect.inflate_ip(8, 8)
+    
+    def get_tab_at(self, pos):
+        """Get the tab under a screen position, or None"""
+        for tab_id, tab_rect in self.tab_rects.items():
+            if tab_rect.collidepoint(pos):
+                return tab_id
+        return None
+    
+    def get_button_at(self, pos):
+        """Get the stat button under a screen position, or None"""
+        for button_id, button in self.buttons.items():
+            if button['rect'].collidepoint(pos):
+                return button_id
+        return None
+    
+    def get_item_index_at(self, pos):
+        """Get the item grid slot under a screen position, or -1"""
+        return pygame.Rect(pos, (1, 1)).collidelist(self.item_cell_rects)
+    
+    def get_skill_at(self, pos):
+        """Get the skill node under a screen position, or None"""
+        for skill_id, skill_rect in self.skill_rects.items():
+            if skill_rect.collidepoint(pos):
+                return skill_id
+        return None
+    
+    def can_unlock_selected(self):
+        """Check if the selected skill can be unlocked right now (shows the Unlock button)"""
+        if not self.skill_selected or self.skill_selected not in self.player.skill_tree.skills:
+            return False
+        skill = self.player.skill_tree.skills[self.skill_selected]
+        return not skill.unlocked and skill.can_unlock(self.player) and self.player.attributes.skill_points > 0
+    
     def toggle(self):
         """Toggle the character screen visibility"""
         self.visible = not self.visible
@@ -336,20 +527,9 @@ class CharacterScreen:
         if self.current_section != "inventory" or self.selected_item_index < 0:
             return
             
-        # Calculate the position of the currently selected item
-        row = self.selected_item_index // self.grid_cols
-        col = self.selected_item_index % self.grid_cols
-        
-        # Calculate grid starting position (must match draw_items_grid)
-        portrait_x = 50 + 30  # Margin + portrait offset
-        portrait_y = 80 + 30  # Margin + portrait offset
-        grid_start_y = portrait_y + self.portrait.get_height() + 30 + 35  # Below portrait + title
-        
-        cell_x = portrait_x + col * (self.cell_size + self.grid_padding) + self.grid_padding
-        cell_y = grid_start_y + row * (self.cell_size + self.grid_padding) + self.grid_padding
-        
-        # Update cursor position for tooltip
-        self.cursor_pos = (cell_x + self.cell_size + 10, cell_y)
+        # Place the tooltip to the right of the selected slot
+        cell_rect = self.item_cell_rects[self.selected_item_index]
+        self.cursor_pos = (cell_rect.right + 10, cell_rect.y)
     
     def use_selected_item(self):
         """Use the currently selected inventory item"""
@@ -388,7 +568,7 @@ class CharacterScreen:
                             
     def navigate_skills(self, direction):
         """Navigate through the skill tree with controller/keyboard"""
-        if not hasattr(self, 'skill_rects') or not self.skill_rects:
+        if not self.skill_rects:
             return False
             
         branches = self.player.skill_tree.get_skills_by_branch()
@@ -463,85 +643,69 @@ class CharacterScreen:
             mouse_pos = pygame.mouse.get_pos()
             
             # Check tab clicks
-            if hasattr(self, 'tab_rects'):
-                for tab_id, tab_rect in self.tab_rects.items():
-                    if tab_rect.collidepoint(mouse_pos):
-                        self.current_tab = tab_id
-                        self.skill_selected = None  # Reset selected skill
-                        return True
+            tab_id = self.get_tab_at(mouse_pos)
+            if tab_id:
+                self.current_tab = tab_id
+                self.skill_selected = None  # Reset selected skill
+                return True
             
             # Handle tab-specific clicks
             if self.current_tab == "attributes":
                 # Check button clicks
-                for button_id, button in self.buttons.items():
-                    if button['rect'].collidepoint(mouse_pos):
-                        # Only allow clicking if player has stat points
-                        if self.player.attributes.stat_points > 0:
-                            result = button['action']()
-                            return True
+                button_id = self.get_button_at(mouse_pos)
+                if button_id:
+                    # Only allow clicking if player has stat points
+                    if self.player.attributes.stat_points > 0:
+                        result = self.buttons[button_id]['action']()
+                        return True
                 
                 # Check inventory item clicks
                 if hasattr(self.player, 'inventory'):
                     inventory_items = self.player.inventory.get_items_and_counts()
+                    idx = self.get_item_index_at(mouse_pos)
                     
-                    # Find the hovered item
-                    for idx, item_data in enumerate(inventory_items):
-                        row = idx // self.grid_cols
-                        col = idx % self.grid_cols
-                        
-                        # Calculate cell position
-                        portrait_x = 50 + 30  # Same as in draw_items_grid
-                        portrait_y = 80 + 30  # Same as in draw_items_grid
-                        cell_x = portrait_x + col * (self.cell_size + self.grid_padding) + self.grid_padding
-                        cell_y = portrait_y + self.portrait.get_height() + 30 + 35 + row * (self.cell_size + self.grid_padding) + self.grid_padding
+                    if 0 <= idx < len(inventory_items):
+                        item = inventory_items[idx]['item']
                         
-                        # Create a rect for the cell
-                        cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                        
-                        if cell_rect.collidepoint(mouse_pos):
-                            item = item_data['item']
-                            
-                            # Toggle selection of this item
-                            if self.selected_item_index == idx:
-                                # If already selected, use the item
-                                if item and hasattr(item, 'use'):
-                                    use_result = item.use(self.player)
-                                    # Check the type of result
-                                    if isinstance(use_result, str):
-                                        # Show feedback message instead of using
-                                        self.item_feedback_message = use_result
-                                        self.item_feedback_timer = 120
-                                    elif use_result is True:
-                                        # Only remove if True was returned
-                                        actual_index = self.player.inventory.items.index(item)
-                                        self.player.inventory.remove_item(actual_index)
+                        # Toggle selection of this item
+                        if self.selected_item_index == idx:
+                            # If already selected, use the item
+                            if item and hasattr(item, 'use'):
+                                use_result = item.use(self.player)
+                                # Check the type of result
+                                if isinstance(use_result, str):
+                                    # Show feedback message instead of using
+                                    self.item_feedback_message = use_result
+                                    self.item_feedback_timer = 120
+                                elif use_result is True:
+                                    # Only remove if True was returned
+                                    actual_index = self.player.inventory.items.index(item)
+                                    self.player.inventory.remove_item(actual_index)
 
-                            else:
-                                # Select this item
-                                self.selected_item_index = idx
-                                self.grid_selected_row = row
-                                self.grid_selected_col = col
-                                self.current_section = "inventory"
-                                
-                                # Update cursor position for tooltip
-                                self.update_selected_item_position()
+                        else:
+                            # Select this item
+                            self.selected_item_index = idx
+                            self.grid_selected_row = idx // self.grid_cols
+                            self.grid_selected_col = idx % self.grid_cols
+                            self.current_section = "inventory"
                             
-                            return True
+                            # Update cursor position for tooltip
+                            self.update_selected_item_position()
+                        
+                        return True
             
             elif self.current_tab == "skills":
                 # Check skill clicks
-                if hasattr(self, 'skill_rects'):
-                    for skill_id, skill_rect in self.skill_rects.items():
-                        if skill_rect.collidepoint(mouse_pos):
-                            self.skill_selected = skill_id
-                            return True
+                skill_id = self.get_skill_at(mouse_pos)
+                if skill_id:
+                    self.skill_selected = skill_id
+                    return True
                 
-                # Check unlock button click
-                if hasattr(self, 'unlock_button_rect') and self.unlock_button_rect and self.unlock_button_rect.collidepoint(mouse_pos):
-                    if self.skill_selected:
-                        # Try to unlock the selected skill
-                        self.player.skill_tree.unlock_skill(self.skill_selected)
-                        return True
+                # Check unlock button click (only shown while the selected skill can be unlocked)
+                if self.can_unlock_selected() and self.unlock_button_rect.collidepoint(mouse_pos):
+                    # Try to unlock the selected skill
+                    self.player.skill_tree.unlock_skill(self.skill_selected)
+                    return True
         
         # Mouse movement for item hovering
         elif event.type == pygame.MOUSEMOTION:
@@ -554,28 +718,12 @@ class CharacterScreen:
             
             if hasattr(self.player, 'inventory'):
                 inventory_items = self.player.inventory.get_items_and_counts()
+                idx = self.get_item_index_at(mouse_pos)
                 
-                # Calculate grid starting position (must match draw_items_grid)
-                portrait_x = 50 + 30  # Margin + portrait offset
-                portrait_y = 80 + 30  # Margin + portrait offset
-                grid_start_y = portrait_y + self.portrait.get_height() + 30 + 35  # Below portrait + title
-                
-                for idx, item_data in enumerate(inventory_items):
-                    row = idx // self.grid_cols
-                    col = idx % self.grid_cols
-                    
-                    # Calculate cell position
-                    cell_x = portrait_x + col * (self.cell_size + self.grid_padding) + self.grid_padding
-                    cell_y = grid_start_y + row * (self.cell_size + self.grid_padding) + self.grid_padding
-                    
-                    # Create a rect for the cell
-                    cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                    
-                    if cell_rect.collidepoint(mouse_pos):
-                        self.hovered_item_index = idx
-                        self.tooltip_visible = True
-                        self.tooltip_item = item_data['item']
-                        break
+                if 0 <= idx < len(inventory_items):
+                    self.hovered_item_index = idx
+                    self.tooltip_visible = True
+                    self.tooltip_item = inventory_items[idx]['item']
         
         # Controller button handling
         elif event.type == pygame.JOYBUTTONDOWN:
@@ -715,34 +863,31 @@ class CharacterScreen:
         if not self.visible:
             return
             
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(self.colors['background'])
-        surface.blit(overlay, (0, 0))
+        # Draw the semi-transparent overlay
+        surface.blit(self.overlay, (0, 0))
         
         # Draw border
         border_width = 4
-        margin = 30
         pygame.draw.rect(surface, self.colors['border'], 
-                        (margin, margin, SCREEN_WIDTH - margin*2, SCREEN_HEIGHT - margin*2), 
+                        (MARGIN, MARGIN, SCREEN_WIDTH - MARGIN*2, SCREEN_HEIGHT - MARGIN*2), 
                         border_width)
         
         # Draw title
-        title = self.title_font.render("CHARACTER SHEET", True, self.colors['title'])
-        surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, margin + 20))
+        title = text_cache.render(self.title_font, "CHARACTER SHEET", True, self.colors['title'])
+        surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, MARGIN + 20))
         
         # Draw close instructions with controller info
-        close_text = self.text_font.render("Press ENTER or START to close", True, self.colors['text'])
-        surface.blit(close_text, (SCREEN_WIDTH - close_text.get_width() - margin - 10, margin + 20))
+        close_text = text_cache.render(self.text_font, "Press ENTER or START to close", True, self.colors['text'])
+        surface.blit(close_text, (SCREEN_WIDTH - close_text.get_width() - MARGIN - 10, MARGIN + 20))
         
         # Draw tabs at the bottom of the character sheet
-        self.draw_tabs(surface, margin)
+        self.draw_panel(surface, 'tabs', (self.current_tab,), self.render_tabs)
         
         # Draw the appropriate tab content
         if self.current_tab == "attributes":
-            self.draw_attributes_tab(surface, margin)
+            self.draw_attributes_tab(surface)
         elif self.current_tab == "skills":
-            self.draw_skills_tab(surface, margin)
+            self.draw_skills_tab(surface)
         
         # Draw item tooltip if needed - only once (for attributes tab)
         if self.current_tab == "attributes" and self.tooltip_visible and self.tooltip_item:
@@ -751,65 +896,90 @@ class CharacterScreen:
             tooltip_pos = pygame.mouse.get_pos() if self.hovered_item_index >= 0 else self.cursor_pos
             self.draw_item_tooltip(surface, self.tooltip_item, tooltip_pos)
 
-    def draw_tabs(self, surface, margin):
-        """Draw tabs for switching between attributes and skills at the bottom of the screen"""
-        tab_width = 150
-        tab_height = 30
-        
-        # Position tabs at the bottom of the character sheet
-        tab_y = SCREEN_HEIGHT - margin - tab_height - 10  # 10px padding from the bottom margin
-        
-        # Attributes tab
-        attr_tab_x = SCREEN_WIDTH // 2 - tab_width - 5
-        attr_tab_rect = pygame.Rect(attr_tab_x, tab_y, tab_width, tab_height)
-        attr_color = self.colors['button_hover'] if self.current_tab == "attributes" else self.colors['button']
-        pygame.draw.rect(surface, attr_color, attr_tab_rect)
-        pygame.draw.rect(surface, self.colors['border'], attr_tab_rect, 1)
-        
-        attr_text = self.button_font.render("ATTRIBUTES", True, self.colors['text'])
-        surface.blit(attr_text, (attr_tab_x + (tab_width - attr_text.get_width()) // 2, 
-                            tab_y + (tab_height - attr_text.get_height()) // 2))
-        
-        # Skills tab
-        skills_tab_x = SCREEN_WIDTH // 2 + 5
-        skills_tab_rect = pygame.Rect(skills_tab_x, tab_y, tab_width, tab_height)
-        skills_color = self.colors['button_hover'] if self.current_tab == "skills" else self.colors['button']
-        pygame.draw.rect(surface, skills_color, skills_tab_rect)
-        pygame.draw.rect(surface, self.colors['border'], skills_tab_rect, 1)
-        
-        skills_text = self.button_font.render("SKILLS", True, self.colors['text'])
-        surface.blit(skills_text, (skills_tab_x + (tab_width - skills_text.get_width()) // 2, 
-                            tab_y + (tab_height - skills_text.get_height()) // 2))
-        
-        # Store tab rects for click detection
-        self.tab_rects = {
-            "attributes": attr_tab_rect,
-            "skills": skills_tab_rect
-        }
+    def draw_panel(self, surface, name, state_key, render):
+        """Blit a cached panel, re-rendering it first if the state it shows has changed"""
+        rect = self.panel_rects[name]
+        cached = self.panels.get(name)
+        if cached is None or cached[1] != state_key:
+            panel = cached[0] if cached else pygame.Surface(rect.size, pygame.SRCALPHA)
+            panel.fill((0, 0, 0, 0))
+            render(panel, rect.x, rect.y)
+            self.panels[name] = cached = (panel, state_key)
+        surface.blit(cached[0], rect.topleft)
+
+    def render_tabs(self, panel, origin_x, origin_y):
+        """Render the tabs for switching between attributes and skills"""
+        for tab_id, label in (("attributes", "ATTRIBUTES"), ("skills", "SKILLS")):
+            tab_rect = self.tab_rects[tab_id].move(-origin_x, -origin_y)
+            tab_color = self.colors['button_hover'] if self.current_tab == tab_id else self.colors['button']
+            pygame.draw.rect(panel, tab_color, tab_rect)
+            pygame.draw.rect(panel, self.colors['border'], tab_rect, 1)
+            
+            tab_text = text_cache.render(self.button_font, label, True, self.colors['text'])
+            panel.blit(tab_text, (tab_rect.x + (tab_rect.width - tab_text.get_width()) // 2, 
+                                  tab_rect.y + (tab_rect.height - tab_text.get_height()) // 2))
         
         # Draw a separator line above the tabs
-        sep_y = tab_y - 10
-        pygame.draw.line(surface, self.colors['border'], (margin + 10, sep_y), (SCREEN_WIDTH - margin - 10, sep_y), 1)
+        sep_y = self.separator_y - origin_y
+        pygame.draw.line(panel, self.colors['border'], (0, sep_y), (panel.get_width() - 1, sep_y), 1)
 
-    def draw_attributes_tab(self, surface, margin):
+    def draw_attributes_tab(self, surface):
         """Draw the attributes tab with character stats and inventory"""
-        # Draw portrait section
-        portrait_x = margin + 50
-        portrait_y = margin + 80
-        surface.blit(self.portrait, (portrait_x, portrait_y))
+        attributes = self.player.attributes
+        
+        # Portrait, level, stats and resource bars
+        profile_state = (attributes.level, attributes.stat_points,
+                         attributes.str, attributes.con, attributes.dex, attributes.int,
+                         attributes.current_health, attributes.max_health,
+                         attributes.current_mana, attributes.max_mana)
+        self.draw_panel(surface, 'profile', profile_state, self.render_profile)
+        
+        # Attribute rows with their increase buttons
+        hovered_button = self.get_button_at(pygame.mouse.get_pos()) if attributes.stat_points > 0 else None
+        selected_button = self.button_order[self.selected_index] if self.current_section == "stats" else None
+        self.draw_panel(surface, 'attributes', (attributes.stat_points > 0, hovered_button, selected_button),
+                        self.render_attribute_rows)
+        
+        # Abilities section based on unlocked skills
+        abilities_state = tuple(self.player.skill_tree.is_skill_unlocked(ability["id"]) for ability in ABILITIES)
+        self.draw_panel(surface, 'abilities', abilities_state, self.render_abilities_section)
+        
+        # Items grid below the portrait
+        inventory_items = self.player.inventory.get_items_and_counts() if hasattr(self.player, 'inventory') else []
+        inventory_state = tuple((item_data['item'].name, item_data['count']) for item_data in inventory_items)
+        items_state = (inventory_state, self.selected_item_index, self.hovered_item_index, self.current_section)
+        self.draw_panel(surface, 'items', items_state, self.render_items_grid)
+        
+        # Tooltip for the item selected with keyboard/controller
+        if self.current_section == "inventory" and 0 <= self.selected_item_index < len(inventory_items):
+            # Only if it's not already being rendered due to mouse hover
+            if self.hovered_item_index != self.selected_item_index:
+                cell_rect = self.item_cell_rects[self.selected_item_index]
+                self.tooltip_visible = True
+                self.tooltip_item = inventory_items[self.selected_item_index]['item']
+                # Store cursor position for tooltip placement
+                self.cursor_pos = (cell_rect.right + 10, cell_rect.y)
+        
+        # Draw feedback message BELOW the grid if active
+        if self.item_feedback_message and self.item_feedback_timer > 0:
+            self.item_feedback_timer -= 1
+            self.draw_item_feedback(surface, self.grid_rect.x + 100, self.grid_rect.bottom + 10)  # 10px below the grid
+
+    def render_profile(self, panel, origin_x, origin_y):
+        """Render the portrait with level, stat points, attributes and resource bars to its right"""
+        panel.blit(self.portrait, (self.portrait_pos[0] - origin_x, self.portrait_pos[1] - origin_y))
         
-        # Draw character stats to the RIGHT of the portrait instead of below it
-        stats_x = portrait_x + self.portrait.get_width() + 30
-        stats_y = portrait_y
+        stats_x = self.stats_x - origin_x
+        stats_y = self.portrait_pos[1] - origin_y
         
         # Draw level info next to portrait
-        level_text = self.stat_font.render(f"Level: {self.player.attributes.level}", True, self.colors['stat_text'])
-        surface.blit(level_text, (stats_x, stats_y))
+        level_text = text_cache.render(self.stat_font, f"Level: {self.player.attributes.level}", True, self.colors['stat_text'])
+        panel.blit(level_text, (stats_x, stats_y))
         
         # Draw stat points
         stat_points_y = stats_y + 30
-        stat_points_text = self.stat_font.render(f"Stat Points: {self.player.attributes.stat_points}", True, self.colors['title'])
-        surface.blit(stat_points_text, (stats_x, stat_points_y))
+        stat_points_text = text_cache.render(self.stat_font, f"Stat Points: {self.player.attributes.stat_points}", True, self.colors['title'])
+        panel.blit(stat_points_text, (stats_x, stat_points_y))
         
         # Draw attribute values next to portrait
         attributes_text = [
@@ -820,20 +990,17 @@ class CharacterScreen:
         ]
         
         for i, text in enumerate(attributes_text):
-            attr_text = self.text_font.render(text, True, self.colors['stat_text'])
-            surface.blit(attr_text, (stats_x, stat_points_y + 30 + i * 25))
+            attr_text = text_cache.render(self.text_font, text, True, self.colors['stat_text'])
+            panel.blit(attr_text, (stats_x, stat_points_y + 30 + i * 25))
         
         # Draw health and mana bars next to portrait
-        self.draw_resource_bars(surface, stats_x, stat_points_y + 150)
-        
-        # Draw attributes section
-        attributes_x = SCREEN_WIDTH // 2
-        attributes_y = 90
-        
-        attribute_title = self.stat_font.render("ATTRIBUTES", True, self.colors['title'])
-        surface.blit(attribute_title, (attributes_x, attributes_y))
+        self.draw_resource_bars(panel, stats_x, stat_points_y + 150)
+
+    def render_attribute_rows(self, panel, origin_x, origin_y):
+        """Render the attribute names with their increase buttons"""
+        attribute_title = text_cache.render(self.stat_font, "ATTRIBUTES", True, self.colors['title'])
+        panel.blit(attribute_title, (ATTRIBUTES_X - origin_x, ATTRIBUTES_Y - origin_y))
         
-        # Draw attributes with buttons
         attribute_data = [
             {"name": "Strength", "key": "str"},
             {"name": "Constitution", "key": "con"},
@@ -841,90 +1008,80 @@ class CharacterScreen:
             {"name": "Intelligence", "key": "int"}
         ]
         
+        has_points = self.player.attributes.stat_points > 0
+        hovered_button = self.get_button_at(pygame.mouse.get_pos()) if has_points else None
+        
         for i, attr in enumerate(attribute_data):
-            y_pos = attributes_y + 40 + i * 40
+            y_pos = ATTRIBUTES_Y + 40 + i * 40 - origin_y
             
             # Attribute name
-            name_text = self.text_font.render(attr["name"], True, self.colors['text'])
-            surface.blit(name_text, (attributes_x, y_pos))
+            name_text = text_cache.render(self.text_font, attr["name"], True, self.colors['text'])
+            panel.blit(name_text, (ATTRIBUTES_X - origin_x, y_pos))
             
-            # Update button position (to the right of the attribute name)
             button_id = f'inc_{attr["key"]}'
             button = self.buttons[button_id]
-            
-            # Position button to the right of the attributes section
-            button_x = attributes_x + 200  # Fixed position on the right
-            button_y = y_pos - 5  # Align vertically with attribute name
-            button['rect'].x = button_x
-            button['rect'].y = button_y
+            button_rect = button['rect'].move(-origin_x, -origin_y)
             
             button_color = self.colors['button_disabled']
-            if self.player.attributes.stat_points > 0:
+            if has_points:
                 button_color = self.colors['button']
                 # Check hover
-                if button['rect'].collidepoint(pygame.mouse.get_pos()):
+                if button_id == hovered_button:
                     button_color = self.colors['button_hover']
             
             # Check if this is the selected button with controller
             is_selected = self.current_section == "stats" and self.button_order[self.selected_index] == button_id
             
             # Draw button with potentially highlighted background
-            pygame.draw.rect(surface, button_color, button['rect'])
+            pygame.draw.rect(panel, button_color, button_rect)
             
             # Draw selection cursor if this button is selected
             if is_selected:
-                highlight_rect = button['rect'].inflate(6, 6)
-                pygame.draw.rect(surface, self.colors['cursor'], highlight_rect, 2)
+                highlight_rect = button_rect.inflate(6, 6)
+                pygame.draw.rect(panel, self.colors['cursor'], highlight_rect, 2)
                 
                 # Show "A" prompt if points available
-                if self.player.attributes.stat_points > 0:
-                    a_text = self.button_font.render("A", True, self.colors['cursor'])
-                    a_x = button['rect'].right + 10
-                    a_y = button['rect'].centery - a_text.get_height() // 2
-                    surface.blit(a_text, (a_x, a_y))
+                if has_points:
+                    a_text = text_cache.render(self.button_font, "A", True, self.colors['cursor'])
+                    a_x = button_rect.right + 10
+                    a_y = button_rect.centery - a_text.get_height() // 2
+                    panel.blit(a_text, (a_x, a_y))
             
             # Button border
-            pygame.draw.rect(surface, self.colors['border'], button['rect'], 1)
+            pygame.draw.rect(panel, self.colors['border'], button_rect, 1)
             
             # Button text
-            button_text = self.button_font.render(button['text'], True, self.colors['text'])
-            text_x = button['rect'].x + (button['rect'].width - button_text.get_width()) // 2
-            text_y = button['rect'].y + (button['rect'].height - button_text.get_height()) // 2
-            surface.blit(button_text, (text_x, text_y))
-        
-        # Draw abilities section based on level
-        self.draw_abilities_section(surface, attributes_x, attributes_y + 210)
-        
-        # Draw items grid below the portrait
-        self.draw_items_grid(surface, portrait_x, portrait_y + self.portrait.get_height() + 30)
+            button_text = text_cache.render(self.button_font, button['text'], True, self.colors['text'])
+            text_x = button_rect.x + (button_rect.width - button_text.get_width()) // 2
+            text_y = button_rect.y + (button_rect.height - button_text.get_height()) // 2
+            panel.blit(button_text, (text_x, text_y))
 
-    def draw_skills_tab(self, surface, margin):
+    def draw_skills_tab(self, surface):
         """Draw the skills tab with skill tree"""
+        skill_tree = self.player.skill_tree
+        skill_state = (self.player.attributes.skill_points, self.player.attributes.level,
+                       tuple(skill.unlocked for skill in skill_tree.skills.values()), self.skill_selected)
+        self.draw_panel(surface, 'skills', skill_state, self.render_skill_tree)
+        
+        # If a skill is selected, draw its details
+        if self.skill_selected and self.skill_selected in skill_tree.skills:
+            self.draw_panel(surface, 'skill_detail', skill_state, self.render_skill_detail)
+
+    def render_skill_tree(self, panel, origin_x, origin_y):
+        """Render the skill points, branch headers and skill nodes at their layout positions"""
         # Header and skill points display
-        skill_points_text = self.stat_font.render(f"Skill Points: {self.player.attributes.skill_points}", True, self.colors['title'])
-        surface.blit(skill_points_text, (margin + 50, margin + 90))
+        skill_points_text = text_cache.render(self.stat_font, f"Skill Points: {self.player.attributes.skill_points}", True, self.colors['title'])
+        panel.blit(skill_points_text, (MARGIN + 50 - origin_x, MARGIN + 90 - origin_y))
         
         # Instructions
-        instructions = self.text_font.render("Click on a skill to view details and unlock it", True, self.colors['text'])
-        surface.blit(instructions, (margin + 50, margin + 120))
-        
-        # Get skill data
-        branches = self.player.skill_tree.get_skills_by_branch()
-        
-        # Define branch positions and names
-        branch_names = ["Mind", "Body", "Magic Sword"]
-        branch_ids = ["mind", "body", "magic_sword"]
-        
-        screen_width = SCREEN_WIDTH - margin * 2 - 100
-        branch_width = screen_width // 3
-        start_y = margin + 170  # Move branch headers down to avoid collision with instructions
+        instructions = text_cache.render(self.text_font, SKILL_INSTRUCTIONS, True, self.colors['text'])
+        panel.blit(instructions, (MARGIN + 50 - origin_x, MARGIN + 120 - origin_y))
         
         # Draw branch headers (diamond shapes)
-        for i, branch_name in enumerate(branch_names):
-            branch_x = margin + 50 + i * branch_width + branch_width // 2
-            
-            # Draw diamond for branch header
-            diamond_size = 20
+        start_y = self.skill_tree_top - origin_y
+        diamond_size = 20
+        for branch_name, branch_x in self.branch_headers:
+            branch_x -= origin_x
             diamond_points = [
                 (branch_x, start_y),  # Top
                 (branch_x + diamond_size, start_y + diamond_size),  # Right
@@ -933,159 +1090,67 @@ class CharacterScreen:
             ]
             
             # Draw branch diamond
-            pygame.draw.polygon(surface, (100, 200, 100), diamond_points)
-            pygame.draw.polygon(surface, self.colors['border'], diamond_points, 2)
+            pygame.draw.polygon(panel, (100, 200, 100), diamond_points)
+            pygame.draw.polygon(panel, self.colors['border'], diamond_points, 2)
             
             # Draw branch name
-            branch_text = self.text_font.render(branch_name, True, self.colors['text'])
+            branch_text = text_cache.render(self.text_font, branch_name, True, self.colors['text'])
             text_x = branch_x - branch_text.get_width() // 2
             text_y = start_y - branch_text.get_height() - 5
-            surface.blit(branch_text, (text_x, text_y))
-        
-        # Map to store skill positions for drawing connections
-        skill_positions = {}
-        self.skill_rects = {}
-        
-        # Draw skills for each branch
-        for branch_idx, branch_id in enumerate(branch_ids):
-            skills = branches[branch_id]
-            
-            # Center position for this branch
-            branch_x = margin + 50 + branch_idx * branch_width + branch_width // 2
-            
-            # First level skills (direct children of the branch)
-            first_level_skills = [skill for skill in skills if not skill.parent]
-            first_level_count = len(first_level_skills)
-            
-            level_spacing = 110  # Increased vertical spacing between levels
-            skill_spacing = 170  # Much wider horizontal spacing between siblings
-            
-            # Draw first level skills (top row)
-            if first_level_count > 0:
-                # For first level, spread skills horizontally
-                for i, skill in enumerate(first_level_skills):
-                    # Calculate position spreading skills horizontally
-                    skill_x = branch_x
-                    if first_level_count > 1:
-                        # Spread skills horizontally if more than one
-                        offset = (i - (first_level_count - 1) / 2) * skill_spacing
-                        skill_x += offset
-                    
-                    skill_y = start_y + 80  # Increased vertical space from branch header to first skills
-                    
-                    # Draw connection from branch to skill
-                    pygame.draw.line(surface, self.colors['border'], 
-                                    (branch_x, start_y + diamond_size * 2), 
-                                    (skill_x, skill_y - 18), 2)
-                    
-                    # Draw the skill
-                    self.draw_skill_node(surface, skill, skill_x, skill_y)
-                    
-                    # Store position for drawing connections to children
-                    skill_positions[skill.id] = (skill_x, skill_y)
-            
-            # Group skills by their parent to organize them by levels
-            skill_levels = {}
-            for skill in skills:
-                if skill.parent:
-                    if skill.parent not in skill_levels:
-                        skill_levels[skill.parent] = []
-                    skill_levels[skill.parent].append(skill)
-            
-            # Draw remaining levels of skills
-            current_level = 1  # First level already drawn
-            done = False
-            
-            while not done:
-                done = True
-                next_parents = []
-                
-                # Process each parent at this level
-                for parent_id in list(skill_levels.keys()):
-                    if parent_id in skill_positions:
-                        parent_x, parent_y = skill_positions[parent_id]
-                        children = skill_levels.pop(parent_id)
-                        done = False
-                        
-                        # Draw children of this parent
-                        child_count = len(children)
-                        for i, child in enumerate(children):
-                            # Calculate position for this child
-                            child_x = parent_x
-                            if child_count > 1:
-                                # If multiple children, spread them horizontally
-                                offset = (i - (child_count - 1) / 2) * skill_spacing
-                                child_x += offset
-                            
-                            child_y = parent_y + level_spacing
-                            
-                            # Draw connection from parent to child
-                            pygame.draw.line(surface, self.colors['border'], 
-                                            (parent_x, parent_y + 18), 
-                                            (child_x, child_y - 18), 2)
-                            
-                            # Draw the skill
-                            self.draw_skill_node(surface, child, child_x, child_y)
-                            
-                            # Store position for drawing connections to children
-                            skill_positions[child.id] = (child_x, child_y)
-                            next_parents.append(child.id)
-                
-                current_level += 1
-        
-        # If a skill is selected, draw its details
-        if self.skill_selected and self.skill_selected in self.player.skill_tree.skills:
-            skill = self.player.skill_tree.skills[self.skill_selected]
-            
-            # Draw skill detail panel (moved up to make room for bottom tabs)
-            tab_height = 30
-            tab_margin = 20  # Space between detail panel and tabs
-            detail_rect = pygame.Rect(margin + 50, 
-                                    SCREEN_HEIGHT - margin - 150 - tab_height - tab_margin, 
-                                    SCREEN_WIDTH - margin * 2 - 100, 
-                                    120)
-            pygame.draw.rect(surface, self.colors['background'], detail_rect)
-            pygame.draw.rect(surface, self.colors['border'], detail_rect, 2)
-            
-            # Draw skill name
-            detail_name = self.stat_font.render(skill.name, True, self.colors['title'])
-            surface.blit(detail_name, (detail_rect.x + 10, detail_rect.y + 10))
-            
-            # Draw skill description
-            detail_desc = self.text_font.render(skill.description, True, self.colors['text'])
-            surface.blit(detail_desc, (detail_rect.x + 10, detail_rect.y + 40))
+            panel.blit(branch_text, (text_x, text_y))
+        
+        # Draw each skill with the connection from its branch or parent
+        for skill_id, (x, y), (line_x, line_y) in self.skill_nodes:
+            x -= origin_x
+            y -= origin_y
+            pygame.draw.line(panel, self.colors['border'], 
+                            (line_x - origin_x, line_y - origin_y), 
+                            (x, y - 18), 2)
+            self.draw_skill_node(panel, self.player.skill_tree.skills[skill_id], x, y)
+
+    def render_skill_detail(self, panel, origin_x, origin_y):
+        """Render the detail panel of the selected skill"""
+        skill = self.player.skill_tree.skills[self.skill_selected]
+        detail_rect = self.detail_rect.move(-origin_x, -origin_y)
+        
+        # Opaque panel background (the sheet's background color without its alpha)
+        pygame.draw.rect(panel, self.colors['background'][:3], detail_rect)
+        pygame.draw.rect(panel, self.colors['border'], detail_rect, 2)
+        
+        # Draw skill name
+        detail_name = text_cache.render(self.stat_font, skill.name, True, self.colors['title'])
+        panel.blit(detail_name, (detail_rect.x + 10, detail_rect.y + 10))
+        
+        # Draw skill description
+        detail_desc = text_cache.render(self.text_font, skill.description, True, self.colors['text'])
+        panel.blit(detail_desc, (detail_rect.x + 10, detail_rect.y + 40))
+        
+        # Draw unlock button if the skill can be unlocked
+        if self.can_unlock_selected():
+            unlock_button = self.unlock_button_rect.move(-origin_x, -origin_y)
+            pygame.draw.rect(panel, self.colors['button'], unlock_button)
+            pygame.draw.rect(panel, self.colors['border'], unlock_button, 1)
             
-            # Draw unlock button if the skill can be unlocked
-            if not skill.unlocked and skill.can_unlock(self.player) and self.player.attributes.skill_points > 0:
-                unlock_button = pygame.Rect(detail_rect.right - 120, detail_rect.bottom - 40, 100, 30)
-                pygame.draw.rect(surface, self.colors['button'], unlock_button)
-                pygame.draw.rect(surface, self.colors['border'], unlock_button, 1)
-                
-                unlock_text = self.button_font.render("Unlock", True, self.colors['text'])
-                surface.blit(unlock_text, (unlock_button.centerx - unlock_text.get_width() // 2,
-                                        unlock_button.centery - unlock_text.get_height() // 2))
-                
-                # Store unlock button for click detection
-                self.unlock_button_rect = unlock_button
+            unlock_text = text_cache.render(self.button_font, "Unlock", True, self.colors['text'])
+            panel.blit(unlock_text, (unlock_button.centerx - unlock_text.get_width() // 2,
+                                     unlock_button.centery - unlock_text.get_height() // 2))
+        else:
+            # Show status message
+            if skill.unlocked:
+                status_text = text_cache.render(self.text_font, "Skill Unlocked", True, (0, 150, 0))
+            elif not skill.implemented:
+                status_text = text_cache.render(self.text_font, "Not Yet Implemented", True, (150, 0, 0))
+            elif self.player.attributes.level < skill.level_required:
+                status_text = text_cache.render(self.text_font, f"Requires Level {skill.level_required}", True, (150, 0, 0))
+            elif skill.parent and not self.player.skill_tree.is_skill_unlocked(skill.parent):
+                parent_skill = self.player.skill_tree.skills[skill.parent]
+                status_text = text_cache.render(self.text_font, f"Requires {parent_skill.name} Skill", True, (150, 0, 0))
+            elif self.player.attributes.skill_points <= 0:
+                status_text = text_cache.render(self.text_font, "No Skill Points Available", True, (150, 0, 0))
             else:
-                self.unlock_button_rect = None
+                status_text = text_cache.render(self.text_font, "Cannot Unlock Now", True, (150, 0, 0))
                 
-                # Show status message
-                if skill.unlocked:
-                    status_text = self.text_font.render("Skill Unlocked", True, (0, 150, 0))
-                elif not skill.implemented:
-                    status_text = self.text_font.render("Not Yet Implemented", True, (150, 0, 0))
-                elif self.player.attributes.level < skill.level_required:
-                    status_text = self.text_font.render(f"Requires Level {skill.level_required}", True, (150, 0, 0))
-                elif skill.parent and not self.player.skill_tree.is_skill_unlocked(skill.parent):
-                    parent_skill = self.player.skill_tree.skills[skill.parent]
-                    status_text = self.text_font.render(f"Requires {parent_skill.name} Skill", True, (150, 0, 0))
-                elif self.player.attributes.skill_points <= 0:
-                    status_text = self.text_font.render("No Skill Points Available", True, (150, 0, 0))
-                else:
-                    status_text = self.text_font.render("Cannot Unlock Now", True, (150, 0, 0))
-                    
-                surface.blit(status_text, (detail_rect.right - status_text.get_width() - 10, detail_rect.bottom - 30))
+            panel.blit(status_text, (detail_rect.right - status_text.get_width() - 10, detail_rect.bottom - 30))
 
     def draw_skill_node(self, surface, skill, x, y):
         """Draw a skill node in the skill tree with diamond shape"""
@@ -1117,22 +1182,16 @@ class CharacterScreen:
             pygame.draw.polygon(surface, self.colors['border'], diamond_points, 1)
         
         # Draw skill name above the diamond
-        skill_name = self.text_font.render(skill.name, True, self.colors['text'])
+        skill_name = text_cache.render(self.text_font, skill.name, True, self.colors['text'])
         name_x = x - skill_name.get_width() // 2
         name_y = y - diamond_size - skill_name.get_height() - 5  # Increased spacing
         surface.blit(skill_name, (name_x, name_y))
         
         # Draw level requirement below the diamond
-        level_text = self.text_font.render(f"Level {skill.level_required}+", True, self.colors['text'])
+        level_text = text_cache.render(self.text_font, f"Level {skill.level_required}+", True, self.colors['text'])
         level_x = x - level_text.get_width() // 2
         level_y = y + diamond_size + 5  # Increased spacing
         surface.blit(level_text, (level_x, level_y))
-        
-        # Create a rectangular hitbox for the skill (for mouse interaction)
-        # Make it larger than the diamond to be more user-friendly
-        hitbox_size = 50  # Larger hitbox for easier selection
-        hitbox_rect = pygame.Rect(x - hitbox_size//2, y - hitbox_size//2, hitbox_size, hitbox_size)
-        self.skill_rects[skill.id] = hitbox_rect
 
     def draw_resource_bars(self, surface, x, y):
         """Draw health and mana bars"""
@@ -1147,7 +1206,7 @@ class CharacterScreen:
         pygame.draw.rect(surface, self.colors['health'], (x, y, health_fill_width, bar_height))
         pygame.draw.rect(surface, self.colors['border'], (x, y, bar_width, bar_height), 1)
         
-        health_text = self.text_font.render(f"Health: {self.player.attributes.current_health}/{self.player.attributes.max_health}", 
+        health_text = text_cache.render(self.text_font, f"Health: {self.player.attributes.current_health}/{self.player.attributes.max_health}", 
                                           True, self.colors['text'])
         surface.blit(health_text, (x + 10, y + 2))
         
@@ -1159,29 +1218,23 @@ class CharacterScreen:
         pygame.draw.rect(surface, self.colors['mana'], (x, y + 30, mana_fill_width, bar_height))
         pygame.draw.rect(surface, self.colors['border'], (x, y + 30, bar_width, bar_height), 1)
         
-        mana_text = self.text_font.render(f"Mana: {self.player.attributes.current_mana}/{self.player.attributes.max_mana}", 
+        mana_text = text_cache.render(self.text_font, f"Mana: {self.player.attributes.current_mana}/{self.player.attributes.max_mana}", 
                                           True, self.colors['text'])
         surface.blit(mana_text, (x + 10, y + 32))
         
-    def draw_abilities_section(self, surface, x, y):
-        """Draw unlocked abilities based on skill tree"""
-        abilities_title = self.stat_font.render("ABILITIES", True, self.colors['title'])
-        surface.blit(abilities_title, (x, y))
-        
-        abilities = [
-            {"id": "basic_sword", "name": "Sword Attack", "desc": "Basic sword attack (SPACE/Button 2)"},
-            {"id": "sprint", "name": "Sprint", "desc": "Temporary speed boost (SHIFT/Button 4)"},
-            {"id": "dash", "name": "Dash", "desc": "Quick directional burst (CTRL)"},
-            {"id": "extended_sword", "name": "Extended Sword", "desc": "Increased sword reach"},
-            {"id": "blink", "name": "Blink", "desc": "Short-range teleport (B/Button 1)"}
-        ]
+    def render_abilities_section(self, panel, origin_x, origin_y):
+        """Render unlocked abilities based on skill tree"""
+        x = ATTRIBUTES_X - origin_x
+        y = ATTRIBUTES_Y + 210 - origin_y
+        abilities_title = text_cache.render(self.stat_font, "ABILITIES", True, self.colors['title'])
+        panel.blit(abilities_title, (x, y))
         
         # Use more vertical space for abilities
         abilities_y = y + 40
         has_abilities = False
         
         # Draw only unlocked abilities
-        for ability in abilities:
+        for ability in ABILITIES:
             if self.player.skill_tree.is_skill_unlocked(ability["id"]):
                 has_abilities = True
                 
@@ -1189,42 +1242,26 @@ class CharacterScreen:
                 status_color = self.colors['stat_text']  # Green for unlocked
                 status_text = "UNLOCKED"
                     
-                name_text = self.text_font.render(ability["name"], True, self.colors['text'])
-                surface.blit(name_text, (x, abilities_y))
+                name_text = text_cache.render(self.text_font, ability["name"], True, self.colors['text'])
+                panel.blit(name_text, (x, abilities_y))
                 
-                status_text_render = self.text_font.render(status_text, True, status_color)
-                surface.blit(status_text_render, (x + 200, abilities_y))
+                status_text_render = text_cache.render(self.text_font, status_text, True, status_color)
+                panel.blit(status_text_render, (x + 200, abilities_y))
                 
                 # Description on next line
-                desc_text = self.text_font.render(ability["desc"], True, (180, 180, 180))
-                surface.blit(desc_text, (x + 20, abilities_y + 25))
+                desc_text = text_cache.render(self.text_font, ability["desc"], True, (180, 180, 180))
+                panel.blit(desc_text, (x + 20, abilities_y + 25))
                 
                 abilities_y += 60  # Increased spacing
                 
         if not has_abilities:
-            no_abilities_text = self.text_font.render("No abilities unlocked yet", True, (180, 180, 180))
-            surface.blit(no_abilities_text, (x, abilities_y))
+            no_abilities_text = text_cache.render(self.text_font, "No abilities unlocked yet", True, (180, 180, 180))
+            panel.blit(no_abilities_text, (x, abilities_y))
                 
-    def draw_items_grid(self, surface, x, y):
-        """Draw an item grid below the portrait with selection and usage indicators"""
-        # Title for items section
-        items_title = self.stat_font.render("ITEMS", True, self.colors['title'])
-        surface.blit(items_title, (x, y))
-        
-        # Draw control instructions
-        if self.current_section == "inventory" and hasattr(self.player, 'inventory') and len(self.player.inventory.get_items_and_counts()) > 0:
-            instructions = "Press E/Button A to use selected item"
-            instr_text = self.text_font.render(instructions, True, self.colors['text'])
-            surface.blit(instr_text, (x + 100, y))
-        
-        # Calculate grid dimensions
-        grid_width = self.cell_size * self.grid_cols + self.grid_padding * (self.grid_cols + 1)
-        grid_height = self.cell_size * self.grid_rows + self.grid_padding * (self.grid_rows + 1)
-        
-        # Draw grid background
-        grid_rect = pygame.Rect(x, y + 35, grid_width, grid_height)
-        pygame.draw.rect(surface, self.colors['grid_bg'], grid_rect)
-        pygame.draw.rect(surface, self.colors['border'], grid_rect, 2)
+    def render_items_grid(self, panel, origin_x, origin_y):
+        """Render the item grid below the portrait with selection and usage indicators"""
+        x = self.grid_rect.x - origin_x
+        y = self.grid_rect.y - 35 - origin_y
         
         # Get player inventory items
         if hasattr(self.player, 'inventory'):
@@ -1233,90 +1270,85 @@ class CharacterScreen:
             # Use placeholder items if player doesn't have inventory
             inventory_items = []
         
+        # Title for items section
+        items_title = text_cache.render(self.stat_font, "ITEMS", True, self.colors['title'])
+        panel.blit(items_title, (x, y))
+        
+        # Draw control instructions
+        if self.current_section == "inventory" and len(inventory_items) > 0:
+            instr_text = text_cache.render(self.text_font, ITEM_INSTRUCTIONS, True, self.colors['text'])
+            panel.blit(instr_text, (x + 100, y))
+        
+        # Draw grid background
+        grid_rect = self.grid_rect.move(-origin_x, -origin_y)
+        pygame.draw.rect(panel, self.colors['grid_bg'], grid_rect)
+        pygame.draw.rect(panel, self.colors['border'], grid_rect, 2)
+        
         # Draw grid cells
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                cell_x = x + col * (self.cell_size + self.grid_padding) + self.grid_padding
-                cell_y = y + 35 + row * (self.cell_size + self.grid_padding) + self.grid_padding
-                
-                # Get item index
-                item_idx = row * self.grid_cols + col
-                
-                # Determine cell background color based on selection status
-                cell_color = self.colors['grid_border']
-                
-                # Check if this is the selected cell
-                is_selected = item_idx == self.selected_item_index
-                is_hovered = item_idx == self.hovered_item_index
-                
-                # Draw selected or hovered item with different background
-                if is_selected and self.current_section == "inventory":
-                    cell_color = self.colors['item_selected']
-                elif is_hovered:
-                    cell_color = self.colors['item_hover']
-                
-                # Draw cell background
-                cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                pygame.draw.rect(surface, cell_color, cell_rect)
-                pygame.draw.rect(surface, self.colors['grid_border'], cell_rect, 1)
+        for item_idx, screen_cell_rect in enumerate(self.item_cell_rects):
+            cell_rect = screen_cell_rect.move(-origin_x, -origin_y)
+            cell_x, cell_y = cell_rect.topleft
+            
+            # Determine cell background color based on selection status
+            cell_color = self.colors['grid_border']
+            
+            # Check if this is the selected cell
+            is_selected = item_idx == self.selected_item_index
+            is_hovered = item_idx == self.hovered_item_index
+            
+            # Draw selected or hovered item with different background
+            if is_selected and self.current_section == "inventory":
+                cell_color = self.colors['item_selected']
+            elif is_hovered:
+                cell_color = self.colors['item_hover']
+            
+            # Draw cell background
+            pygame.draw.rect(panel, cell_color, cell_rect)
+            pygame.draw.rect(panel, self.colors['grid_border'], cell_rect, 1)
+            
+            # Draw item if it exists in inventory
+            if item_idx < len(inventory_items):
+                item_data = inventory_items[item_idx]
+                item = item_data['item']
+                count = item_data['count']
                 
-                # Draw item if it exists in inventory
-                if item_idx < len(inventory_items):
-                    item_data = inventory_items[item_idx]
-                    item = item_data['item']
-                    count = item_data['count']
+                if item:
+                    # Get item icon if available
+                    if hasattr(item, 'get_icon'):
+                        icon = item.get_icon()
+                        # Center the icon in the cell
+                        icon_x = cell_x + (self.cell_size - icon.get_width()) // 2
+                        icon_y = cell_y + (self.cell_size - icon.get_height()) // 2
+                        panel.blit(icon, (icon_x, icon_y))
+                    else:
+                        # Fallback to a colored rectangle
+                        icon_rect = pygame.Rect(cell_x + 5, cell_y + 5, self.cell_size - 10, self.cell_size - 10)
+                        pygame.draw.rect(panel, (150, 150, 150), icon_rect)
                     
-                    if item:
-                        # Get item icon if available
-                        if hasattr(item, 'get_icon'):
-                            icon = item.get_icon()
-                            # Center the icon in the cell
-                            icon_x = cell_x + (self.cell_size - icon.get_width()) // 2
-                            icon_y = cell_y + (self.cell_size - icon.get_height()) // 2
-                            surface.blit(icon, (icon_x, icon_y))
-                        else:
-                            # Fallback to a colored rectangle
-                            icon_rect = pygame.Rect(cell_x + 5, cell_y + 5, self.cell_size - 10, self.cell_size - 10)
-                            pygame.draw.rect(surface, (150, 150, 150), icon_rect)
-                        
-                        # Draw item count if more than 1
-                        if count > 1:
-                            count_text = self.text_font.render(f"{count}", True, self.colors['text'])
-                            count_x = cell_x + self.cell_size - count_text.get_width() - 5
-                            count_y = cell_y + self.cell_size - count_text.get_height() - 3
-                            surface.blit(count_text, (count_x, count_y))
-                        
-                        # Add visual indication if item is usable
-                        if hasattr(item, 'use') and not getattr(item, 'one_time_use', False):
-                            # Small indicator in the corner
-                            usable_rect = pygame.Rect(cell_x + 2, cell_y + 2, 6, 6)
-                            pygame.draw.rect(surface, self.colors['usable'], usable_rect)
+                    # Draw item count if more than 1
+                    if count > 1:
+                        count_text = text_cache.render(self.text_font, f"{count}", True, self.colors['text'])
+                        count_x = cell_x + self.cell_size - count_text.get_width() - 5
+                        count_y = cell_y + self.cell_size - count_text.get_height() - 3
+                        panel.blit(count_text, (count_x, count_y))
+                    
+                    # Add visual indication if item is usable
+                    if hasattr(item, 'use') and not getattr(item, 'one_time_use', False):
+                        # Small indicator in the corner
+                        usable_rect = pygame.Rect(cell_x + 2, cell_y + 2, 6, 6)
+                        pygame.draw.rect(panel, self.colors['usable'], usable_rect)
+                    
+                    # Draw selection outline
+                    if is_selected and self.current_section == "inventory":
+                        # Draw a bright border around the selected item
+                        selection_rect = cell_rect.inflate(4, 4)
+                        pygame.draw.rect(panel, self.colors['cursor'], selection_rect, 2)
                         
-                        # Draw selection outline
-                        if is_selected and self.current_section == "inventory":
-                            # Draw a bright border around the selected item
-                            selection_rect = cell_rect.inflate(4, 4)
-                            pygame.draw.rect(surface, self.colors['cursor'], selection_rect, 2)
-                            
-                            # Show controller button prompt if using controller navigation
-                            prompt_text = self.button_font.render("E/A", True, self.colors['cursor'])
-                            prompt_x = cell_x + self.cell_size - prompt_text.get_width() - 2
-                            prompt_y = cell_y + 2
-                            surface.blit(prompt_text, (prompt_x, prompt_y))
-                            
-                            # Store selected item for tooltip rendering
-                            # We'll set tooltip_visible flag to true only if it's not already 
-                            # being rendered due to mouse hover
-                            if self.hovered_item_index != item_idx:
-                                self.tooltip_visible = True
-                                self.tooltip_item = item
-                                # Store cursor position for tooltip placement
-                                self.cursor_pos = (cell_x + self.cell_size + 10, cell_y)
-        
-        # Draw feedback message BELOW the grid if active
-        if self.item_feedback_message and self.item_feedback_timer > 0:
-            self.item_feedback_timer -= 1
-            self.draw_item_feedback(surface, x + 100, y + 35 + grid_height + 10)  # Position below the grid with 10px padding
+                        # Show controller button prompt if using controller navigation
+                        prompt_text = text_cache.render(self.button_font, "E/A", True, self.colors['cursor'])
+                        prompt_x = cell_x + self.cell_size - prompt_text.get_width() - 2
+                        prompt_y = cell_y + 2
+                        panel.blit(prompt_text, (prompt_x, prompt_y))
         
     def draw_item_feedback(self, surface, x, y):
         """Draw a feedback message when an item can't be used"""
@@ -1325,6 +1357,7 @@ class CharacterScreen:
             
         # Calculate message position - center horizontally at the specified position
         padding = 8
+        # Rendered directly (not through text_cache): the fade below changes its alpha
         message = self.stat_font.render(self.item_feedback_message, True, self.colors['feedback_text'])
         
         # Position centered at the given coordinates
@@ -1360,7 +1393,16 @@ class CharacterScreen:
         """Draw tooltip with item information"""
         if not item:
             return
-            
+        
+        tooltip = self.get_item_tooltip(item)
+        
+        # Position tooltip near mouse but ensure it stays on screen
+        tooltip_x = min(mouse_pos[0] + 15, SCREEN_WIDTH - tooltip.get_width() - 10)
+        tooltip_y = min(mouse_pos[1] + 15, SCREEN_HEIGHT - tooltip.get_height() - 10)
+        surface.blit(tooltip, (tooltip_x, tooltip_y))
+    
+    def get_item_tooltip(self, item):
+        """Get the tooltip surface for an item, rendering and caching it on first use"""
         # Get item information
         name = item.name if hasattr(item, 'name') else "Unknown Item"
         description = item.description if hasattr(item, 'description') else "No description available."
@@ -1370,52 +1412,40 @@ class CharacterScreen:
         if usable:
             description += " (Click to use)"
         
+        tooltip = self.tooltips.get((name, description))
+        if tooltip:
+            return tooltip
+        
         # Calculate tooltip dimensions
         padding = 10
         max_width = 250
         
         # Render text
-        name_text = self.stat_font.render(name, True, self.colors['title'])
+        name_text = text_cache.render(self.stat_font, name, True, self.colors['title'])
         
         # Word wrap description if needed
-        wrapped_desc = []
-        words = description.split()
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            test_width = self.desc_font.size(test_line)[0]
-            
-            if test_width < max_width:
-                current_line = test_line
-            else:
-                wrapped_desc.append(current_line)
-                current_line = word
-                
-        if current_line:
-            wrapped_desc.append(current_line)
+        wrapped_desc = text_cache.wrap(self.desc_font, description, max_width)
             
         # Render description lines
-        desc_surfaces = [self.desc_font.render(line, True, self.colors['text']) for line in wrapped_desc]
+        desc_surfaces = [text_cache.render(self.desc_font, line, True, self.colors['text']) for line in wrapped_desc]
         
         # Calculate tooltip size
         tooltip_width = max(max_width, name_text.get_width()) + padding * 2
         tooltip_height = padding * 2 + name_text.get_height() + sum(surf.get_height() for surf in desc_surfaces) + 5
         
-        # Position tooltip near mouse but ensure it stays on screen
-        tooltip_x = min(mouse_pos[0] + 15, SCREEN_WIDTH - tooltip_width - 10)
-        tooltip_y = min(mouse_pos[1] + 15, SCREEN_HEIGHT - tooltip_height - 10)
-        
-        # Draw tooltip background
-        tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, tooltip_width, tooltip_height)
-        pygame.draw.rect(surface, self.colors['background'], tooltip_rect)
-        pygame.draw.rect(surface, self.colors['border'], tooltip_rect, 2)
+        # Draw tooltip background (opaque: the sheet's background color without its alpha)
+        tooltip = pygame.Surface((tooltip_width, tooltip_height))
+        tooltip.fill(self.colors['background'][:3])
+        pygame.draw.rect(tooltip, self.colors['border'], tooltip.get_rect(), 2)
         
         # Draw name
-        surface.blit(name_text, (tooltip_x + padding, tooltip_y + padding))
+        tooltip.blit(name_text, (padding, padding))
         
         # Draw description
-        y_offset = tooltip_y + padding + name_text.get_height() + 5
+        y_offset = padding + name_text.get_height() + 5
         for desc_surface in desc_surfaces:
-            surface.blit(desc_surface, (tooltip_x + padding, y_offset))
-            y_offset += desc_surface.get_height()
\ No newline at end of file
+            tooltip.blit(desc_surface, (padding, y_offset))
+            y_offset += desc_surface.get_height()
+        
+        self.tooltips[(name, description)] = tooltip
+        return tooltip
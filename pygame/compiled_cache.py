@@ -0,0 +1,174 @@
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import pygame
+
+# Header: magic, format version, source sha1, source mtime, source size in bytes,
+# frame width, frame height, frame count. Raw RGBA frames follow, stacked vertically.
+HEADER_FORMAT = '<4sH20sdQHHH'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MTIME_OFFSET = struct.calcsize('<4sH20s')
+MAGIC = b'DGZC'
+VERSION = 1
+
+
+def get_default_cache_dir():
+    """Get a per-user, writable cache directory (also valid for PyInstaller builds)"""
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base_dir = os.path.expanduser('~/Library/Caches')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base_dir, 'The_Dark_Garden_of_Z', 'compiled_assets')
+
+
+class CompiledAssetCache:
+    """
+    On-disk cache of already decoded, scaled and sliced sprites.
+
+    Each entry is keyed by source path, variant (whole image, sprite sheet
+    rect or GIF) and target size, and stores raw RGBA pixels behind a small
+    header. On later launches the pixels are mapped with mmap and handed to
+    pygame.image.frombuffer, skipping PNG/GIF decoding and scaling.
+
+    The header records the source file's mtime, size and sha1. An entry whose
+    source changed is rewritten. If only the mtime changed (e.g. files
+    re-extracted by a PyInstaller build), the hash check keeps the entry and
+    its header takes the new mtime, so the next launch skips the hash.
+    """
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.enabled = True
+
+        # Source digests computed this session
+        # Format: {path: (mtime, size, sha1)}
+        self.source_digests = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Compiled asset cache disabled ({self.cache_dir}): {e}")
+            self.enabled = False
+
+    def get_entry_path(self, path, variant, size):
+        """Get the cache file for a (path, variant, size) key"""
+        key = f"{path}|{variant}|{size}".encode('utf-8')
+        return os.path.join(self.cache_dir, hashlib.sha1(key).hexdigest() + '.rgba')
+
+    def get_source_digest(self, path):
+        """Get (mtime, size, sha1) of a source file, hashing it once per session"""
+        stat = os.stat(path)
+        digest = self.source_digests.get(path)
+        if digest is None or digest[0] != stat.st_mtime or digest[1] != stat.st_size:
+            with open(path, 'rb') as f:
+                sha1 = hashlib.sha1(f.read()).digest()
+            digest = (stat.st_mtime, stat.st_size, sha1)
+            self.source_digests[path] = digest
+        return digest
+
+    def is_fresh(self, path, mtime, size, sha1):
+        """Check a cached entry against its source file"""
+        if not os.path.exists(path):
+            # Source not shipped (e.g. packed elsewhere): trust the entry
+            return True
+
+        stat = os.stat(path)
+        if stat.st_mtime == mtime and stat.st_size == size:
+            return True
+        return self.get_source_digest(path)[2] == sha1
+
+    def update_entry_mtime(self, entry_path, mtime):
+        """Record a source's new mtime in an entry whose contents still match"""
+        try:
+            with open(entry_path, 'r+b') as f:
+                f.seek(MTIME_OFFSET)
+                f.write(struct.pack('<d', mtime))
+        except OSError as e:
+            print(f"Error updating compiled asset {entry_path}: {e}")
+
+    def load(self, path, variant, size):
+        """
+        Load cached frames for a key
+
+        Args:
+            path: Source image path
+            variant: What was derived from it ('image', 'frame:<rect>', 'gif')
+            size: Target size the frames were scaled to
+
+        Returns:
+            List of Surfaces, or None if missing or stale
+        """
+        if not self.enabled:
+            return None
+
+        entry_path = self.get_entry_path(path, variant, size)
+        if not os.path.exists(entry_path):
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    magic, version, sha1, mtime, source_size, width, height, frame_count = \
+                        struct.unpack_from(HEADER_FORMAT, mapped)
+
+                    if magic != MAGIC or version != VERSION or not self.is_fresh(path, mtime, source_size, sha1):
+                        self.misses += 1
+                        return None
+
+                    pixels = memoryview(mapped)[HEADER_SIZE:HEADER_SIZE + width * height * frame_count * 4]
+                    strip = pygame.image.frombuffer(pixels, (width, height * frame_count), 'RGBA')
+
+                    # Copy out of the mapping (into the display format when there is one)
+                    # so the file can be closed
+                    strip = strip.convert_alpha() if pygame.display.get_surface() else strip.copy()
+                    pixels.release()
+
+            # Fresh by hash only: store the new mtime so the next check is a stat
+            if os.path.exists(path) and os.stat(path).st_mtime != mtime:
+                self.update_entry_mtime(entry_path, os.stat(path).st_mtime)
+
+            self.hits += 1
+            return [strip.subsurface((0, i * height, width, height)) for i in range(frame_count)]
+
+        except Exception as e:
+            print(f"Error reading compiled asset {entry_path}: {e}")
+            self.misses += 1
+            return None
+
+    def store(self, path, variant, size, frames):
+        """Write frames derived from a source image (all frames share one size)"""
+        if not self.enabled or not frames or not os.path.exists(path):
+            return
+
+        try:
+            mtime, source_size, sha1 = self.get_source_digest(path)
+            width, height = frames[0].get_size()
+            header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, sha1, mtime, source_size,
+                                 width, height, len(frames))
+
+            # Write to a temporary file first so a crash never leaves a torn entry
+            entry_path = self.get_entry_path(path, variant, size)
+            temp_path = entry_path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(header)
+                for frame in frames:
+                    f.write(pygame.image.tobytes(frame, 'RGBA'))
+            os.replace(temp_path, entry_path)
+
+        except Exception as e:
+            print(f"Error writing compiled asset for {path}: {e}")
+
+    def clear(self):
+        """Delete every cached entry"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.rgba') or name.endswith('.tmp'):
+                os.remove(os.path.join(self.cache_dir, name))
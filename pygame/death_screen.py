@@ -1,12 +1,13 @@
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from font_manager import font_manager
 
 class DeathScreen:
     def __init__(self):
         # Fonts
-        self.title_font = pygame.font.SysFont('Arial', 72, bold=True)
-        self.option_font = pygame.font.SysFont('Arial', 28)
-        self.prompt_font = pygame.font.SysFont('Arial', 20)  # Smaller font for prompt
+        self.title_font = font_manager.get_font(72, bold=True)
+        self.option_font = font_manager.get_font(28)
+        self.prompt_font = font_manager.get_font(20)  # Smaller font for prompt
         
         # Text surfaces
         self.title_text = self.title_font.render("YOU DIED", True, (255, 255, 255))
@@ -1,6 +1,8 @@
 import pygame
 import os
 import datetime
+from text_cache import text_cache
+from font_manager import font_manager
 
 class Dialog:
     def __init__(self, title, options=None, callback=None):
@@ -34,8 +36,8 @@ class Dialog:
     
     def set_fonts(self, title_size=24, option_size=20):
         """Set fonts for the dialog (called after pygame.font is initialized)"""
-        self.title_font = pygame.font.SysFont('Arial', title_size, bold=True)
-        self.option_font = pygame.font.SysFont('Arial', option_size)
+        self.title_font = font_manager.get_font(title_size, bold=True)
+        self.option_font = font_manager.get_font(option_size)
     
     def show(self):
         """Show the dialog"""
@@ -131,7 +133,7 @@ class Dialog:
                          (dialog_x, dialog_y, dialog_width, dialog_height), 2)
         
         # Draw title
-        title_text = self.title_font.render(self.title, True, self.colors['title'])
+        title_text = text_cache.render(self.title_font, self.title, True, self.colors['title'])
         title_x = dialog_x + (dialog_width - title_text.get_width()) // 2
         title_y = dialog_y + padding
         surface.blit(title_text, (title_x, title_y))
@@ -139,14 +141,14 @@ class Dialog:
         # Draw options
         for i, option in enumerate(self.options):
             option_color = self.colors['selected'] if i == self.selected_option else self.colors['option']
-            option_text = self.option_font.render(option, True, option_color)
+            option_text = text_cache.render(self.option_font, option, True, option_color)
             
             option_x = dialog_x + padding + 20  # Add some indent
             option_y = dialog_y + padding + 40 + i * option_height
             
             # Indicate selected option with a cursor
             if i == self.selected_option:
-                cursor_text = self.option_font.render("> ", True, self.colors['selected'])
+                cursor_text = text_cache.render(self.option_font, "> ", True, self.colors['selected'])
                 surface.blit(cursor_text, (option_x - 20, option_y))
             
             surface.blit(option_text, (option_x, option_y))
@@ -202,7 +204,7 @@ class FileDialog(Dialog):
                          (dialog_x, dialog_y, dialog_width, dialog_height), 2)
         
         # Draw title
-        title_text = self.title_font.render(self.title, True, self.colors['title'])
+        title_text = text_cache.render(self.title_font, self.title, True, self.colors['title'])
         title_x = dialog_x + (dialog_width - title_text.get_width()) // 2
         title_y = dialog_y + padding
         surface.blit(title_text, (title_x, title_y))
@@ -210,7 +212,7 @@ class FileDialog(Dialog):
         # Draw message if present
         current_y = title_y + title_text.get_height() + 10
         if self.message:
-            message_text = self.option_font.render(self.message, True, self.colors['text'])
+            message_text = text_cache.render(self.option_font, self.message, True, self.colors['text'])
             message_x = dialog_x + padding
             surface.blit(message_text, (message_x, current_y))
             current_y += message_height
@@ -218,14 +220,14 @@ class FileDialog(Dialog):
         # Draw file options
         for i, option in enumerate(self.options):
             option_color = self.colors['selected'] if i == self.selected_option else self.colors['option']
-            option_text = self.option_font.render(option, True, option_color)
+            option_text = text_cache.render(self.option_font, option, True, option_color)
             
             option_x = dialog_x + padding + 20  # Add some indent
             option_y = current_y + i * option_height
             
             # Indicate selected option with a cursor
             if i == self.selected_option:
-                cursor_text = self.option_font.render("> ", True, self.colors['selected'])
+                cursor_text = text_cache.render(self.option_font, "> ", True, self.colors['selected'])
                 surface.blit(cursor_text, (option_x - 20, option_y))
             
             surface.blit(option_text, (option_x, option_y))
@@ -297,7 +299,7 @@ class SaveOverwriteDialog(FileDialog):
             screen_width, screen_height = surface.get_size()
             text = f"Enter filename: {self.entered_name or self.default_name}"
             font = self.option_font
-            text_surf = font.render(text, True, (255, 255, 255))
+            text_surf = text_cache.render(font, text, True, (255, 255, 255))
             x = (screen_width - text_surf.get_width()) // 2
             y = screen_height // 2 + 150
             surface.blit(text_surf, (x, y))
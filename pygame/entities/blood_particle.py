@@ -1,6 +1,7 @@
 # Enhanced BloodParticle class for blood_particle.py
 import random
 import pygame
+from particle_sprites import particle_sprites
 
 class BloodParticle:
     """A class representing a blood particle for damage effects"""
@@ -86,10 +87,15 @@ class BloodParticle:
             if self.current_life <= 0:
                 self.active = False
     
-    def draw(self, surface, camera_offset_x=0, camera_offset_y=0):
-        """Draw the particle with optional camera offset"""
+    def get_blit(self, camera_offset_x=0, camera_offset_y=0):
+        """
+        Get the particle's shared sprite and position, for drawing many with Surface.blits()
+        
+        Returns:
+            (sprite, (x, y)) tuple, or None if the particle is inactive
+        """
         if not self.active:
-            return
+            return None
             
         # Calculate opacity based on remaining life
         if self.current_life < self.fade_start:
@@ -97,20 +103,26 @@ class BloodParticle:
         else:
             opacity = 255
             
-        # Create a surface with alpha for the particle
-        particle_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        
-        # Set the color with opacity
-        color_with_alpha = (*self.color, opacity)
-        pygame.draw.circle(particle_surface, color_with_alpha, 
-                         (self.size//2, self.size//2), self.size//2)
+        # Shared alpha circle for this size, colour and opacity
+        particle_surface = particle_sprites.get_circle(self.size//2, self.color, opacity, self.size)
         
         # Draw the particle
         if self.stuck:
             # The particle is stuck to an obstacle, don't apply camera offset
-            surface.blit(particle_surface, (self.x - self.size//2, self.y - self.size//2))
-        else:
-            # Apply camera offset for free-floating particles
-            surface.blit(particle_surface, 
-                       (self.x - self.size//2 - camera_offset_x, 
-                        self.y - self.size//2 - camera_offset_y))
\ No newline at end of file
+            return particle_surface, (self.x - self.size//2, self.y - self.size//2)
+        # Apply camera offset for free-floating particles
+        return particle_surface, (self.x - self.size//2 - camera_offset_x,
+                                  self.y - self.size//2 - camera_offset_y)
+    
+    def draw(self, surface, camera_offset_x=0, camera_offset_y=0):
+        """Draw the particle with optional camera offset"""
+        blit = self.get_blit(camera_offset_x, camera_offset_y)
+        if blit:
+            surface.blit(*blit)
+
+
+def draw_blood_particles(surface, particles):
+    """Draw a list of blood particles with a single Surface.blits() call"""
+    blits = [blit for blit in (particle.get_blit() for particle in particles if particle) if blit]
+    if blits:
+        surface.blits(blits, doreturn=False)
@@ -1,7 +1,11 @@
 import pygame
 import math
+from asset_cache import asset_cache
 
 class Bonfire:
+    # Animation frame banks shared by every bonfire, keyed by sprite size
+    sprite_banks = {}
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -32,15 +36,19 @@ class Bonfire:
         self.load_sprites()
     
     def load_sprites(self):
-        """Load bonfire-specific sprites from sprite sheet"""
-        self.sprites = {
+        """Point this bonfire at the shared frame bank, building it on first use"""
+        bank_key = (self.width, self.height)
+        if bank_key not in Bonfire.sprite_banks:
+            Bonfire.sprite_banks[bank_key] = self.build_sprite_bank()
+        self.sprites = Bonfire.sprite_banks[bank_key]
+    
+    def build_sprite_bank(self):
+        """Slice bonfire-specific sprites from the sprite sheet (once per size)"""
+        sprites = {
             'burning': []  # Only one animation state for the bonfire
         }
         
         try:
-            # Load the spritesheet
-            bonfire_img = pygame.image.load('assets/bonfire-sprites.png').convert_alpha()
-            
             # Define the frame positions based on the sprite sheet
             # These are the x-coordinates of each frame
             frame_positions = [
@@ -53,25 +61,34 @@ class Bonfire:
             frame_width = 32   # Width of each frame
             frame_height = 32  # Height of each frame
             
-            # Load each frame using defined positions
-            for x_pos in frame_positions:
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(bonfire_img, (0, 0), (x_pos, 0, frame_width, frame_height))
-                # Scale to desired size
-                scaled_frame = pygame.transform.scale(frame, (self.width, self.height))
-                self.sprites['burning'].append(scaled_frame)
+            # Slice and scale each frame once via the shared frame cache
+            frame_rects = [(x_pos, 0, frame_width, frame_height) for x_pos in frame_positions]
+            sprites['burning'] = asset_cache.get_frames(
+                'assets/bonfire-sprites.png', frame_rects, (self.width, self.height)
+            )
                 
         except Exception as e:
             print(f"Error loading bonfire sprites: {e}")
             # Create placeholder
             placeholder = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             placeholder.fill((200, 100, 0))
-            self.sprites['burning'].append(placeholder)
+            sprites['burning'] = [placeholder]
+        
+        return sprites
     
     def get_rect(self):
         """Return the collision rectangle"""
         return self.rect
     
+    def get_draw_rect(self):
+        """Return the area the bonfire draws to, including its heal particles"""
+        if not self.heal_particles_active:
+            return self.rect.copy()
+        # Particles drift up to 32px out from the center (plus their size)
+        reach = 20 + self.heal_particles_timer // 5 + self.heal_particles_timer // 3 + 6
+        return self.rect.union(pygame.Rect(0, 0, reach * 2, reach * 2).move(
+            self.x + self.width // 2 - reach, self.y + self.height // 2 - reach))
+    
     def set_block_coordinates(self, x, y):
         """Set the block coordinates where this bonfire is located"""
         self.block_x = x
@@ -2,6 +2,10 @@ import pygame
 import random
 import math
 from entities.enemy.enemy_attribute import EnemyAttributes
+from asset_cache import asset_cache
+from entities.blood_particle import draw_blood_particles
+from particle_sprites import particle_sprites
+from particle_engine import particle_engine
 
 class Enemy:
     def __init__(self, x, y, width, height, speed=1):
@@ -503,6 +507,12 @@ class Enemy:
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
         
+        # Bulk emit into the shared engine when NumPy is available
+        if particle_engine:
+            particle_engine.emit_burst(center_x, center_y, particle_count, self.width / 3, (5, 12), (0.5, 2.0),
+                                       (15, 30), 30, (150,) * 3, (250,) * 3, gray=True)
+            return
+        
         for _ in range(particle_count):
             # Random angle for 360-degree spread
             angle = random.uniform(0, 2 * math.pi)
@@ -595,14 +605,10 @@ class Enemy:
         animation_frames = self.get_animation_frames()
         
         if len(animation_frames) > 0 and self.frame < len(animation_frames):
+            # Left-facing frames come pre-flipped from the sprite bank
+            # (see add_mirrored_animations), so no surface is created here
             sprite = animation_frames[self.frame]
             
-            # If we're using the right-facing sprites but need to face left,
-            # and we don't have dedicated left sprites, then flip the sprite
-            animation_key = f"{self.state}_right"
-            if self.direction == "left" and animation_key in self.sprites:
-                sprite = pygame.transform.flip(sprite, True, False)
-            
             # For hit effects, we'll only apply flashing to slimes
             from entities.enemy.slime import Slime
             
@@ -616,9 +622,7 @@ class Enemy:
             
             # Draw blood particles
             if hasattr(self, 'blood_particles'):
-                for particle in self.blood_particles:
-                    if particle:
-                        particle.draw(surface)
+                draw_blood_particles(surface, self.blood_particles)
     
     def draw_detection_radius(self, surface):
         """Draw the detection radius as a circle for debugging - NEW"""
@@ -641,25 +645,21 @@ class Enemy:
         if not hasattr(self, 'death_particles'):
             return
             
+        blits = []
         for particle in self.death_particles:
             # Calculate fade-out based on life
             alpha = int(255 * (particle['life'] / particle['max_life']))
             
-            # Create surface for particle
-            particle_surface = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-            
-            # Set color with transparency
-            color_with_alpha = (*particle['color'], alpha)
-            
-            # Draw smoke-like particle (circle with blur effect)
-            pygame.draw.circle(particle_surface, color_with_alpha, 
-                             (particle['size']//2, particle['size']//2), 
-                             particle['size']//2)
+            # Shared smoke-like particle sprite for this size, colour and fade
+            particle_surface = particle_sprites.get_circle(
+                particle['size']//2, particle['color'], alpha, particle['size'])
             
-            # Draw the particle
-            surface.blit(particle_surface, 
-                       (particle['x'] - particle['size']//2, 
-                        particle['y'] - particle['size']//2))
+            blits.append((particle_surface,
+                          (particle['x'] - particle['size']//2,
+                           particle['y'] - particle['size']//2)))
+        
+        # Draw all particles in one call
+        surface.blits(blits, doreturn=False)
     
     def drop_soul(self):
         """Drop a soul when enemy dies"""
@@ -682,6 +682,22 @@ class Enemy:
         that should be overridden by subclasses
         """
         pass
+    
+    @staticmethod
+    def add_mirrored_animations(sprites):
+        """
+        Add a pre-flipped "<state>_left" animation for every "<state>_right"
+        animation that has no dedicated left-facing frames
+        
+        Args:
+            sprites: Dictionary of animation frames, updated in place
+        """
+        for animation_key in list(sprites.keys()):
+            if not animation_key.endswith("_right"):
+                continue
+            left_key = animation_key[:-len("_right")] + "_left"
+            if left_key not in sprites:
+                sprites[left_key] = [asset_cache.get_flipped(sprite) for sprite in sprites[animation_key]]
         
     def render_debug_info(self, surface, font, x, y):
         """Display enemy attribute information for debugging"""
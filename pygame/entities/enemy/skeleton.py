@@ -3,8 +3,15 @@ import random
 import math
 from entities.enemy.enemy import Enemy
 from entities.enemy.enemy_attribute import EnemyAttributes
+from asset_cache import asset_cache
+from entities.blood_particle import draw_blood_particles
+from particle_engine import particle_engine
 
 class Skeleton(Enemy):
+    # Animation frame banks shared by every skeleton, keyed by sprite size
+    # Format: {(width, height): {'idle_right': [...], 'idle_left': [...], ...}}
+    sprite_banks = {}
+
     def __init__(self, x, y):
         # Define skeleton-specific dimensions
         width = 48
@@ -50,15 +57,23 @@ class Skeleton(Enemy):
         self.show_detection_radius = False
     
     def load_sprites(self):
-        """Load skeleton-specific sprites from sprite sheets"""
-        self.sprites = {
+        """Point this skeleton at the shared frame bank, building it on first use"""
+        bank_key = (self.width, self.height)
+        if bank_key not in Skeleton.sprite_banks:
+            Skeleton.sprite_banks[bank_key] = self.build_sprite_bank()
+        self.sprites = Skeleton.sprite_banks[bank_key]
+    
+    def build_sprite_bank(self):
+        """Slice skeleton-specific sprites from sprite sheets (once per size)"""
+        sprites = {
             'idle_right': [],
             'moving_right': []
         }
         
         try:
             # Load idle animation frames
-            idle_img = pygame.image.load('assets/Skeleton_02_White_Idle.png').convert_alpha()
+            idle_path = 'assets/Skeleton_02_White_Idle.png'
+            _, idle_sheet_height = asset_cache.get_image_size(idle_path)
             
             # Manually define the frame positions based on careful examination of the sprite sheet
             # These are the x-coordinates of each frame
@@ -73,18 +88,15 @@ class Skeleton(Enemy):
             ]
             
             frame_width = 42   # Approximate width of each frame
-            frame_height = idle_img.get_height()
+            frame_height = idle_sheet_height
             
-            # Load each idle frame using manual positions
-            for i, x_pos in enumerate(idle_frame_positions):
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(idle_img, (0, 0), (x_pos, 0, frame_width, frame_height))
-                # Scale to desired size
-                scaled_frame = pygame.transform.scale(frame, (self.width, self.height))
-                self.sprites['idle_right'].append(scaled_frame)
+            # Slice and scale each idle frame once via the shared frame cache
+            idle_rects = [(x_pos, 0, frame_width, frame_height) for x_pos in idle_frame_positions]
+            sprites['idle_right'] = asset_cache.get_frames(idle_path, idle_rects, (self.width, self.height))
             
             # Load walking animation frames with manually defined positions
-            walk_img = pygame.image.load('assets/Skeleton_02_White_Walk.png').convert_alpha()
+            walk_path = 'assets/Skeleton_02_White_Walk.png'
+            _, walk_sheet_height = asset_cache.get_image_size(walk_path)
             
             # Manually define the walking frame positions based on sprite sheet examination
             walking_frame_positions = [
@@ -100,28 +112,26 @@ class Skeleton(Enemy):
             ]
             
             frame_width = 42   # Approximate width of each frame
-            frame_height = walk_img.get_height()
+            frame_height = walk_sheet_height
             
-            # Load each walking frame using manual positions
-            for i, x_pos in enumerate(walking_frame_positions):
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(walk_img, (0, 0), (x_pos, 0, frame_width, frame_height))
-                # Scale to desired size
-                scaled_frame = pygame.transform.scale(frame, (self.width, self.height))
-                self.sprites['moving_right'].append(scaled_frame)
+            # Slice and scale each walking frame once via the shared frame cache
+            walk_rects = [(x_pos, 0, frame_width, frame_height) for x_pos in walking_frame_positions]
+            sprites['moving_right'] = asset_cache.get_frames(walk_path, walk_rects, (self.width, self.height))
             
-            print(f"Successfully loaded skeleton sprites: {len(self.sprites['idle_right'])} idle, {len(self.sprites['moving_right'])} moving")
+            print(f"Successfully loaded skeleton sprites: {len(sprites['idle_right'])} idle, {len(sprites['moving_right'])} moving")
                 
         except Exception as e:
             print(f"Error loading skeleton sprites: {e}")
             # Create colored rectangle placeholders
+            sprites['idle_right'] = []
+            sprites['moving_right'] = []
             for _ in range(7):  # Only 7 idle frames
                 idle_placeholder = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 idle_placeholder.fill((200, 200, 200))
                 # Add border for better visibility
                 pygame.draw.rect(idle_placeholder, (100, 100, 100), 
                                (0, 0, self.width, self.height), 2)
-                self.sprites['idle_right'].append(idle_placeholder)
+                sprites['idle_right'].append(idle_placeholder)
             
             for _ in range(9):  # 9 walking frames
                 move_placeholder = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
@@ -129,23 +139,29 @@ class Skeleton(Enemy):
                 # Add border for better visibility
                 pygame.draw.rect(move_placeholder, (90, 90, 90), 
                                (0, 0, self.width, self.height), 2)
-                self.sprites['moving_right'].append(move_placeholder)
+                sprites['moving_right'].append(move_placeholder)
             
-            print(f"Created placeholder sprites for skeleton: {len(self.sprites['idle_right'])} idle, {len(self.sprites['moving_right'])} moving")
+            print(f"Created placeholder sprites for skeleton: {len(sprites['idle_right'])} idle, {len(sprites['moving_right'])} moving")
+        
+        # Mirror the right-facing frames once for left-facing skeletons
+        self.add_mirrored_animations(sprites)
+        
+        return sprites
     
     def get_animation_frames(self):
-        """Override to always use right-facing animations and let draw() handle flipping"""
-        # For skeleton, we only have "_right" animations, so always use those
-        # regardless of the actual direction (the draw method will flip them if needed)
-        animation_key = f"{self.state}_right"
+        """Override to fall back to idle for states without their own animation"""
+        # Left-facing animations are pre-flipped copies of the "_right" ones
+        direction_suffix = "right" if self.direction == "right" else "left"
+        animation_key = f"{self.state}_{direction_suffix}"
         
         if animation_key in self.sprites and len(self.sprites[animation_key]) > 0:
             return self.sprites[animation_key]
         
         # If the current state doesn't have animations (e.g., "attacking" isn't implemented),
-        # fallback to idle_right as a safe default
-        if 'idle_right' in self.sprites and len(self.sprites['idle_right']) > 0:
-            return self.sprites['idle_right']
+        # fallback to idle as a safe default
+        idle_key = f"idle_{direction_suffix}"
+        if idle_key in self.sprites and len(self.sprites[idle_key]) > 0:
+            return self.sprites[idle_key]
             
         # Return an empty list only if all else fails
         return []
@@ -319,6 +335,11 @@ class Skeleton(Enemy):
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
         
+        if particle_engine:
+            particle_engine.emit_burst(center_x, center_y, particle_count, self.width / 3, (3, 7), (0.7, 2.0),
+                                       (20, 35), 35, (220,) * 3, (255,) * 3, gray=True, blue_drop=(10, 30))
+            return
+        
         for _ in range(particle_count):
             # Random angle for 360-degree spread
             angle = random.uniform(0, 2 * math.pi)
@@ -374,12 +395,9 @@ class Skeleton(Enemy):
         animation_frames = self.get_animation_frames()
         
         if len(animation_frames) > 0 and self.frame < len(animation_frames):
+            # Already facing the right way (left frames are pre-flipped)
             sprite = animation_frames[self.frame]
             
-            # Handle left-facing sprites by flipping the right sprites
-            if self.direction == "left":
-                sprite = pygame.transform.flip(sprite, True, False)
-            
             # Handle hit animation
             if self.hit:
                 # Only draw on even frames during hit animation for flashing effect
@@ -391,9 +409,7 @@ class Skeleton(Enemy):
             
             # Draw blood particles if any
             if hasattr(self, 'blood_particles'):
-                for particle in self.blood_particles:
-                    if particle:
-                        particle.draw(surface)
+                draw_blood_particles(surface, self.blood_particles)
     
     def draw_detection_radius(self, surface):
         """Draw the detection radius as a circle for debugging"""
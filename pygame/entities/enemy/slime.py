@@ -1,11 +1,16 @@
 import pygame
 import random
 import math
-from PIL import Image, ImageSequence
 from entities.enemy.enemy import Enemy
 from entities.enemy.enemy_attribute import EnemyAttributes
+from asset_cache import asset_cache
+from entities.blood_particle import draw_blood_particles
+from particle_engine import particle_engine
 
 class Slime(Enemy):
+    # Animation frame banks shared by every slime, keyed by sprite size
+    sprite_banks = {}
+
     def __init__(self, x, y):
         # Define slime-specific dimensions
         width = 32
@@ -28,56 +33,48 @@ class Slime(Enemy):
         self.load_sprites()
     
     def load_sprites(self):
-        """Load slime sprites from GIF files"""
-        self.sprites = {
+        """Point this slime at the shared frame bank, building it on first use"""
+        bank_key = (self.width, self.height)
+        if bank_key not in Slime.sprite_banks:
+            Slime.sprite_banks[bank_key] = self.build_sprite_bank()
+        self.sprites = Slime.sprite_banks[bank_key]
+    
+    def build_sprite_bank(self):
+        """Load slime sprites from GIF files (once per size)"""
+        sprites = {
             'idle': [],
             'moving': []
         }
         
         try:
             # Load idle animation from GIF
-            self.load_animation_from_gif('assets/slime_idle.gif', 'idle')
+            sprites['idle'] = self.load_animation_from_gif('assets/slime_idle.gif')
             
             # Load moving animation from GIF
-            self.load_animation_from_gif('assets/slime_move.gif', 'moving')
+            sprites['moving'] = self.load_animation_from_gif('assets/slime_move.gif')
                 
         except Exception as e:
             print(f"Error loading slime sprites: {e}")
             # Create colored rectangle placeholders
+            sprites['idle'] = []
+            sprites['moving'] = []
             for _ in range(4):
                 idle_placeholder = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 idle_placeholder.fill((0, 200, 0))  # Green for slime
-                self.sprites['idle'].append(idle_placeholder)
+                sprites['idle'].append(idle_placeholder)
             
             for _ in range(6):
                 move_placeholder = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 move_placeholder.fill((0, 180, 0))  # Slightly darker green
-                self.sprites['moving'].append(move_placeholder)
+                sprites['moving'].append(move_placeholder)
+        
+        return sprites
     
-    def load_animation_from_gif(self, gif_path, animation_key):
-        """Load frames from a GIF file and add them to sprites dictionary"""
+    def load_animation_from_gif(self, gif_path):
+        """Get the decoded frames of a GIF scaled to the slime's dimensions"""
         try:
-            # Open the GIF file using PIL
-            gif = Image.open(gif_path)
-            
-            # Process each frame in the GIF
-            frames = []
-            for frame in ImageSequence.Iterator(gif):
-                # Convert PIL image to pygame surface
-                frame_rgba = frame.convert("RGBA")
-                frame_data = frame_rgba.tobytes()
-                size = frame_rgba.size
-                mode = frame_rgba.mode
-                
-                # Create pygame surface from the frame data
-                py_frame = pygame.image.fromstring(frame_data, size, mode)
-                
-                # Scale the frame to match the slime's dimensions
-                scaled_frame = pygame.transform.scale(py_frame, (self.width, self.height))
-                frames.append(scaled_frame)
-            
-            # Add the frames to the sprites dictionary
-            self.sprites[animation_key] = frames
+            # Decoded once per process (or read from a pre-decoded strip)
+            return asset_cache.get_gif_frames(gif_path, (self.width, self.height))
             
         except Exception as e:
             print(f"Error loading animation from {gif_path}: {e}")
@@ -167,6 +164,12 @@ class Slime(Enemy):
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
         
+        # Bulk emit into the shared engine when NumPy is available
+        if particle_engine:
+            particle_engine.emit_burst(center_x, center_y, particle_count, self.width / 2, (4, 10), (0.8, 2.5),
+                                       (15, 30), 30, (30, 150, 30), (100, 250, 100))
+            return
+        
         for _ in range(particle_count):
             # Random angle for 360-degree spread
             angle = random.uniform(0, 2 * math.pi)
@@ -227,9 +230,7 @@ class Slime(Enemy):
             
             # Draw blood particles
             if hasattr(self, 'blood_particles'):
-                for particle in self.blood_particles:
-                    if particle:  # Make sure particle is not None
-                        particle.draw(surface)
+                draw_blood_particles(surface, self.blood_particles)
                         
     def render_debug_info(self, surface, font, x, y):
         """Display enemy attribute information for debugging"""
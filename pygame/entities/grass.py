@@ -1,7 +1,11 @@
 import pygame
 import random
+from asset_cache import asset_cache
 
 class Grass:
+    # Bush sprite variants in assets/bush/
+    sprite_choices = ['bush1.png', 'bush2.png', 'bush3.png']
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -13,10 +17,9 @@ class Grass:
         
         # Load direct bush image instead of spritesheet
         try:
-            bush_choice = random.choice(['bush1.png', 'bush2.png', 'bush3.png'])
-            self.sprite = pygame.image.load(f'assets/bush/{bush_choice}').convert_alpha()
-            # Scale the sprite to match the desired dimensions
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
+            bush_choice = random.choice(Grass.sprite_choices)
+            # Shared, pre-scaled sprite from the asset cache
+            self.sprite = asset_cache.get_image(f'assets/bush/{bush_choice}', (self.width, self.height))
         except Exception as e:
             print(f"Error loading bush sprite: {e}")
             # Create placeholder
@@ -26,6 +29,10 @@ class Grass:
     def get_rect(self):
         """Return the collision rectangle"""
         return self.rect
+    
+    def is_static(self):
+        """Never moves or animates, so it is baked into the block's static layer"""
+        return True
         
     def draw(self, surface):
         """Draw the grass"""
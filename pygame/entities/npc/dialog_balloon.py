@@ -1,4 +1,6 @@
 import pygame
+from text_cache import text_cache
+from font_manager import font_manager
 
 
 class DialogBalloon:
@@ -28,7 +30,7 @@ class DialogBalloon:
     
     def set_font(self, font_size=15):
         """Set the font for dialog balloons"""
-        self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = font_manager.get_font(font_size)
     
     def get_dynamic_max_width(self, text):
         """Calculate appropriate width based on text length and screen size"""
@@ -63,10 +65,10 @@ class DialogBalloon:
         
         # Calculate balloon dimensions
         if wrapped_lines:
-            text_width = max(self.font.size(line)[0] for line in wrapped_lines)
+            text_width = max(text_cache.size(self.font, line)[0] for line in wrapped_lines)
             text_height = len(wrapped_lines) * self.line_height
         else:
-            text_width = self.font.size(text)[0]
+            text_width = text_cache.size(self.font, text)[0]
             text_height = self.line_height
         
         balloon_width = text_width + (self.padding * 2)
@@ -96,6 +98,9 @@ class DialogBalloon:
             'alpha': 255
         }
         
+        # Composite the whole balloon once; fading only changes its alpha
+        balloon['surface'] = self._render_balloon(balloon)
+        
         self.active_balloons.append(balloon)
     
     def _wrap_text(self, text, max_width):
@@ -103,32 +108,57 @@ class DialogBalloon:
         if not self.font:
             return [text]
         
-        # First check if the entire text fits on one line
-        if self.font.size(text)[0] <= max_width:
-            return [text]
-        
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            width = self.font.size(test_line)[0]
-            
-            if width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Word is too long, but still add it (don't truncate)
-                    lines.append(word)
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines if lines else [text]
+        # Layout is cached per (font, text, width), words are measured once
+        return list(text_cache.wrap(self.font, text, max_width))
+    
+    def _render_balloon(self, balloon):
+        """Draw a balloon's background, border, tail and text onto its own surface"""
+        # Create a surface for the balloon with alpha
+        balloon_surface = pygame.Surface(
+            (balloon['width'] + 6, balloon['height'] + self.tail_height + 6),
+            pygame.SRCALPHA
+        )
+        
+        # Draw balloon background
+        pygame.draw.rect(
+            balloon_surface,
+            self.bg_color,
+            (3, 3, balloon['width'], balloon['height']),
+            border_radius=10
+        )
+        
+        # Draw balloon border
+        pygame.draw.rect(
+            balloon_surface,
+            self.border_color,
+            (3, 3, balloon['width'], balloon['height']),
+            width=2,
+            border_radius=10
+        )
+        
+        # Draw tail (speech bubble pointer)
+        tail_points = [
+            (balloon['width'] // 2 - self.tail_width // 2, balloon['height']),
+            (balloon['width'] // 2 + self.tail_width // 2, balloon['height']),
+            (balloon['width'] // 2, balloon['height'] + self.tail_height)
+        ]
+        
+        # Adjust tail position relative to balloon surface
+        tail_points = [(p[0] + 3, p[1] + 3) for p in tail_points]
+        
+        pygame.draw.polygon(balloon_surface, self.bg_color, tail_points)
+        pygame.draw.lines(balloon_surface, self.border_color, False, 
+                        [tail_points[0], tail_points[2], tail_points[1]], 2)
+        
+        # Draw text - ALL LINES, NO TRUNCATION
+        y_offset = self.padding + 3
+        for line in balloon['lines']:
+            text_surface = text_cache.render(self.font, line, True, self.text_color)
+            text_x = (balloon['width'] - text_surface.get_width()) // 2 + 3
+            balloon_surface.blit(text_surface, (text_x, y_offset))
+            y_offset += self.line_height
+        
+        return balloon_surface
     
     def update(self, current_time):
         """Update all active dialog balloons"""
@@ -143,6 +173,7 @@ class DialogBalloon:
                 # Fade out
                 fade_progress = (elapsed - self.display_duration) / self.fade_duration
                 balloon['alpha'] = int(255 * (1 - fade_progress))
+                balloon['surface'].set_alpha(balloon['alpha'])
         
         # Remove expired balloons
         for balloon in balloons_to_remove:
@@ -153,57 +184,17 @@ class DialogBalloon:
         if not self.font:
             return
         
-        for balloon in self.active_balloons:
-            # Create a surface for the balloon with alpha
-            balloon_surface = pygame.Surface(
-                (balloon['width'] + 6, balloon['height'] + self.tail_height + 6),
-                pygame.SRCALPHA
-            )
-            
-            # Draw balloon background
-            bg_color = (*self.bg_color[:3], min(self.bg_color[3], balloon['alpha']))
-            pygame.draw.rect(
-                balloon_surface,
-                bg_color,
-                (3, 3, balloon['width'], balloon['height']),
-                border_radius=10
-            )
-            
-            # Draw balloon border
-            border_color = (*self.border_color, balloon['alpha'])
-            pygame.draw.rect(
-                balloon_surface,
-                border_color,
-                (3, 3, balloon['width'], balloon['height']),
-                width=2,
-                border_radius=10
-            )
-            
-            # Draw tail (speech bubble pointer)
-            tail_points = [
-                (balloon['width'] // 2 - self.tail_width // 2, balloon['height']),
-                (balloon['width'] // 2 + self.tail_width // 2, balloon['height']),
-                (balloon['width'] // 2, balloon['height'] + self.tail_height)
-            ]
-            
-            # Adjust tail position relative to balloon surface
-            tail_points = [(p[0] + 3, p[1] + 3) for p in tail_points]
-            
-            pygame.draw.polygon(balloon_surface, bg_color, tail_points)
-            pygame.draw.lines(balloon_surface, border_color, False, 
-                            [tail_points[0], tail_points[2], tail_points[1]], 2)
-            
-            # Draw text - ALL LINES, NO TRUNCATION
-            y_offset = self.padding + 3
-            for line in balloon['lines']:
-                text_color = (*self.text_color, balloon['alpha'])
-                text_surface = self.font.render(line, True, text_color)
-                text_x = (balloon['width'] - text_surface.get_width()) // 2 + 3
-                balloon_surface.blit(text_surface, (text_x, y_offset))
-                y_offset += self.line_height
-            
-            # Blit balloon to main surface
-            surface.blit(balloon_surface, (balloon['x'] - 3, balloon['y'] - 3))
+        # Balloons are composited in add_dialog: one blit each, whatever their length
+        surface.blits([(balloon['surface'], (balloon['x'] - 3, balloon['y'] - 3))
+                       for balloon in self.active_balloons], doreturn=False)
+    
+    def get_draw_rects(self):
+        """Get the screen area of every active balloon (for dirty-rect rendering)"""
+        return [
+            pygame.Rect(balloon['x'] - 3, balloon['y'] - 3,
+                        balloon['width'] + 6, balloon['height'] + self.tail_height + 6)
+            for balloon in self.active_balloons
+        ]
     
     def clear(self):
         """Clear all active dialog balloons"""
@@ -5,6 +5,7 @@ from inventory import Inventory
 from entities.player.attributes import PlayerAttributes
 from entities.player.particles import ParticleSystem
 from entities.player.sprite_sheet import SpriteSheet
+from entities.player.sword_angles import SwordAngleTable
 from entities.npc.dialog_balloon import dialog_balloon_system
 
 class NPC:
@@ -85,6 +86,8 @@ class NPC:
         self.sprites, self.sword_sprite = self.sprite_sheet.load_character_sprites(
             character_name, self.width, self.height
         )
+        # Pre-rotated sword sprites shared with the player's sword table
+        self.sword_angles = SwordAngleTable.get_table(character_name, self.sword_sprite)
 
     def gain_xp(self, amount):
         """Add XP to the NPC and check for level up"""
@@ -420,6 +423,18 @@ class NPC:
         """Return NPC collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
         
+    def get_draw_rect(self):
+        """Return the area the NPC draws to: sprite, sword swing and particles"""
+        rect = self.get_rect()
+        if self.swinging:
+            center_x = self.x + self.width / 2
+            center_y = self.y + self.height / 2 - (9 if self.facing == 'up' else 0)
+            rect.union_ip(self.sword_angles.get_reach_rect(center_x, center_y, self.attributes.sword_length))
+        particle_rect = self.particles.get_draw_rect()
+        if particle_rect:
+            rect.union_ip(particle_rect)
+        return rect
+
     def start_swing(self):
         """Start the sword swing animation"""
         if not self.swinging:
@@ -561,21 +576,7 @@ class NPC:
         
         sword_length = self.attributes.sword_length
         
-        sword_x = npc_center_x + math.cos(rotation_angle) * sword_length
-        sword_y = npc_center_y + math.sin(rotation_angle) * sword_length
-        
-        display_angle = -math.degrees(rotation_angle) - 90
-        
-        rotated_sword = pygame.transform.rotate(self.sword_sprite, display_angle)
-        sword_rect = rotated_sword.get_rect()
-        
-        handle_offset_x = sword_rect.width * 0.5
-        handle_offset_y = sword_rect.height * 0.2
-        
-        offset_x = sword_x - handle_offset_x
-        offset_y = sword_y - handle_offset_y
-        
-        surface.blit(rotated_sword, (offset_x, offset_y))
+        self.sword_angles.draw(surface, npc_center_x, npc_center_y, rotation_angle, sword_length)
     
     def draw(self, surface):
         """Draw the NPC with appropriate animation frame"""
@@ -597,19 +598,11 @@ class NPC:
             self.particles.draw_xp_particles(surface)
             return
         
-        # For left-facing, use the right sprites but flip them horizontally
-        if self.facing == 'left':
-            if self.moving:
-                right_sprite = self.sprites['right_walk'][self.frame]
-                sprite = pygame.transform.flip(right_sprite, True, False)
-            else:
-                right_sprite = self.sprites['right_idle'][0]
-                sprite = pygame.transform.flip(right_sprite, True, False)
+        # Left-facing frames are pre-flipped copies of the right ones (see SpriteSheet)
+        if self.moving:
+            sprite = self.sprites[f'{self.facing}_walk'][self.frame]
         else:
-            if self.moving:
-                sprite = self.sprites[f'{self.facing}_walk'][self.frame]
-            else:
-                sprite = self.sprites[f'{self.facing}_idle'][0]
+            sprite = self.sprites[f'{self.facing}_idle'][0]
         
         # Draw the NPC character
         surface.blit(sprite, (self.x, self.y))
@@ -1,5 +1,6 @@
 import math
 import random
+from text_cache import text_cache
 
 # XP Tables for different progression rates
 XP_TABLE_1_5 = [10]  # Base XP needed for level 1 -> 2
@@ -12,9 +13,21 @@ for i in range(49):  # 49 more levels for a total of 50
     XP_TABLE_1_3.append(int(XP_TABLE_1_3[-1] * 1.3))
     XP_TABLE_1_2.append(int(XP_TABLE_1_2[-1] * 1.2))
 
+# Attributes whose changes are reported to listeners (the HUD redraws its panels on them)
+WATCHED_ATTRIBUTES = frozenset({
+    'current_health', 'max_health', 'current_mana', 'max_mana',
+    'xp', 'xp_needed', 'level',
+    'can_sprint', 'sprinting', 'sprint_timer',
+    'can_dash', 'dashing', 'dash_timer',
+    'can_blink', 'blink_timer', 'sword_length',
+})
+
 class PlayerAttributes:
     """Handles player attributes, leveling and XP system"""
     def __init__(self, player):
+        # Callbacks taking the name of a watched attribute that changed
+        self.listeners = []
+        
         self.player = player
         
         # Starting attributes
@@ -77,6 +90,28 @@ class PlayerAttributes:
         # Initialize any abilities the player should have at level 1
         self.initialize_abilities()
     
+    def __setattr__(self, name, value):
+        """Set an attribute, notifying listeners when a watched one changes value"""
+        changed = name in WATCHED_ATTRIBUTES and self.__dict__.get(name) != value
+        object.__setattr__(self, name, value)
+        if changed:
+            self.notify(name)
+    
+    def add_listener(self, callback):
+        """Call callback(attribute_name) whenever a watched attribute changes"""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """Stop notifying a callback"""
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def notify(self, name):
+        """Tell every listener that an attribute changed"""
+        for callback in self.listeners:
+            callback(name)
+    
     def get_xp_needed(self):
         """Get XP needed for next level based on current level and XP table"""
         if self.level >= self.max_level:
@@ -249,33 +284,33 @@ class PlayerAttributes:
 
     def render_info(self, surface, font, x, y):
         """Display player level information on screen"""
-        level_text = font.render(f"Level: {self.level}/{self.max_level}", True, (255, 255, 255))
+        level_text = text_cache.render(font, f"Level: {self.level}/{self.max_level}", True, (255, 255, 255))
         surface.blit(level_text, (x, y))
         
         # Display XP info with progress percentage
         if self.level < self.max_level:
             xp_percentage = (self.xp / self.xp_needed * 100) if self.xp_needed > 0 else 100
-            xp_text = font.render(f"XP: {self.xp}/{self.xp_needed} ({xp_percentage:.1f}%)", True, (255, 215, 0))
+            xp_text = text_cache.render(font, f"XP: {self.xp}/{self.xp_needed} ({xp_percentage:.1f}%)", True, (255, 215, 0))
         else:
-            xp_text = font.render(f"MAX LEVEL", True, (255, 215, 0))
+            xp_text = text_cache.render(font, f"MAX LEVEL", True, (255, 215, 0))
         surface.blit(xp_text, (x, y + 20))
         
         # Display XP table info
-        xp_table_text = font.render(f"XP Table: {self.current_xp_table}x", True, (200, 200, 200))
+        xp_table_text = text_cache.render(font, f"XP Table: {self.current_xp_table}x", True, (200, 200, 200))
         surface.blit(xp_table_text, (x, y + 40))
         
         # Display stats
-        stats_text = font.render(f"STR:{self.str} CON:{self.con} DEX:{self.dex} INT:{self.int}", True, (200, 255, 200))
+        stats_text = text_cache.render(font, f"STR:{self.str} CON:{self.con} DEX:{self.dex} INT:{self.int}", True, (200, 255, 200))
         surface.blit(stats_text, (x, y + 60))
         
         # Show available stat points
         if self.stat_points > 0:
-            points_text = font.render(f"Stat Points: {self.stat_points}", True, (255, 255, 100))
+            points_text = text_cache.render(font, f"Stat Points: {self.stat_points}", True, (255, 255, 100))
             surface.blit(points_text, (x, y + 80))
             
         # Show available skill points
         if self.skill_points > 0:
-            skill_points_text = font.render(f"Skill Points: {self.skill_points}", True, (255, 255, 100))
+            skill_points_text = text_cache.render(font, f"Skill Points: {self.skill_points}", True, (255, 255, 100))
             surface.blit(skill_points_text, (x, y + 100))
             abilities_y = y + 125
         else:
@@ -294,7 +329,7 @@ class PlayerAttributes:
                 sprint_status = "Cooling Down"
                 color = (255, 165, 0)  # Orange when on cooldown
 
-            sprint_text = font.render(f"Sprint: {sprint_status}", True, color)
+            sprint_text = text_cache.render(font, f"Sprint: {sprint_status}", True, color)
             surface.blit(sprint_text, (x, abilities_y))
             abilities_y += 25
 
@@ -310,13 +345,13 @@ class PlayerAttributes:
                 dash_status = "Cooling Down"
                 color = (255, 165, 0)  # Orange when on cooldown
 
-            dash_text = font.render(f"Dash: {dash_status}", True, color)
+            dash_text = text_cache.render(font, f"Dash: {dash_status}", True, color)
             surface.blit(dash_text, (x, abilities_y))
             abilities_y += 25
 
         # Extended Sword ability
         if self.player.skill_tree.is_skill_unlocked("extended_sword"):
-            sword_text = font.render(f"Extended Sword: Active", True, (255, 255, 255))
+            sword_text = text_cache.render(font, f"Extended Sword: Active", True, (255, 255, 255))
             surface.blit(sword_text, (x, abilities_y))
             abilities_y += 25
             
@@ -324,12 +359,12 @@ class PlayerAttributes:
         if self.player.skill_tree.is_skill_unlocked("blink"):
             blink_status = "Ready" if self.blink_timer == 0 else "Cooling Down"
             blink_color = (255, 255, 255) if self.blink_timer == 0 else (255, 165, 0)
-            blink_text = font.render(f"Blink: {blink_status}", True, blink_color)
+            blink_text = text_cache.render(font, f"Blink: {blink_status}", True, blink_color)
             surface.blit(blink_text, (x, abilities_y))
             abilities_y += 25
             
         # Skill/stat points available indicator
         if self.stat_points > 0 or self.skill_points > 0:
-            points_text = font.render(f"Press ENTER to open menu", True, (255, 255, 100))
+            points_text = text_cache.render(font, f"Press ENTER to open menu", True, (255, 255, 100))
             surface.blit(points_text, (x, abilities_y))
             abilities_y += 25
\ No newline at end of file
@@ -1,9 +1,16 @@
-import pygame
 import math
 import random
+from collections import OrderedDict
 
 # Import the original BloodParticle class instead of reimplementing it
-from entities.blood_particle import BloodParticle
+from entities.blood_particle import BloodParticle, draw_blood_particles
+from particle_sprites import particle_sprites
+from particle_engine import particle_engine
+from renderer import get_particle_bounds
+
+MAX_STUCK_PER_BLOCK = 400   # Splats remembered per block; older ones are washed away
+STUCK_PRUNE_COUNT = 100     # Splats washed away at once (the block's decals are then re-baked)
+MAX_DECAL_LAYERS = 2        # Blocks whose blood-stained ground is kept in memory
 
 class ParticleSystem:
     """Manages XP and blood particles for the player"""
@@ -17,6 +24,14 @@ class ParticleSystem:
         # Format: {(block_x, block_y): [(x, y, size, color, life), ...]}
         self.stuck_particles = {}
         self.current_block = (0, 0)
+        
+        # Particles that stuck during the last update, still to be shown once
+        self.stuck_this_frame = []
+        
+        # Stuck blood baked into a copy of the block's static layer, kept for
+        # the most recently drawn blocks only
+        # Format: {(block_x, block_y): (static_layer, Surface)}
+        self.decal_layers = OrderedDict()
     
     def create_xp_particles(self, amount):
         """Create particles when XP is gained"""
@@ -27,6 +42,11 @@ class ParticleSystem:
         center_x = self.player.x + self.player.width / 2
         center_y = self.player.y + self.player.height / 2
         
+        # Bulk emit into the shared engine when NumPy is available
+        if particle_engine:
+            particle_engine.emit_xp(center_x, center_y, particle_count)
+            return
+        
         for _ in range(particle_count):
             # Random position around player
             angle = random.uniform(0, 2 * math.pi)
@@ -59,6 +79,11 @@ class ParticleSystem:
         center_x = self.player.x + self.player.width / 2
         center_y = self.player.y + self.player.height / 2
         
+        if particle_engine:
+            particle_engine.remove_owner(self)
+            particle_engine.emit_blood_spray(center_x, center_y, particle_count, self)
+            return
+        
         # Create particles in a circular spray
         for _ in range(particle_count):
             # Random angle for particle direction
@@ -99,6 +124,10 @@ class ParticleSystem:
         # Create particles
         particle_count = random.randint(8, 12)
         
+        if particle_engine:
+            particle_engine.emit_blood_cone(impact_x, impact_y, math.atan2(dir_y, dir_x), particle_count, enemy)
+            return
+        
         # Initialize blood_particles list for enemy if needed
         if not hasattr(enemy, 'blood_particles'):
             enemy.blood_particles = []
@@ -130,6 +159,8 @@ class ParticleSystem:
     
     def update(self, current_time, obstacles=None):
         """Update all particles"""
+        self.stuck_this_frame = []
+        
         # Update XP particles
         for particle in self.xp_particles[:]:
             # Move particle if it has velocity
@@ -165,54 +196,106 @@ class ParticleSystem:
                 if hasattr(particle, 'stuck') and particle.stuck and particle in self.blood_particles:
                     self.blood_particles.remove(particle)
                     
-                    # Make sure the current block has an entry in the dictionary
-                    if self.current_block not in self.stuck_particles:
-                        self.stuck_particles[self.current_block] = []
-                    
                     # Store information about the stuck particle
-                    self.stuck_particles[self.current_block].append((
+                    self.add_stuck_blood((
                         particle.x,
                         particle.y,
                         particle.size,
                         particle.color,
                         particle.current_life
                     ))
+                    self.stuck_this_frame.append(particle)
     
     def draw_active_blood(self, surface):
         """Draw only the active (flying) blood particles"""
-        # Draw active particles
-        for particle in self.blood_particles:
-            particle.draw(surface)
+        # Draw active particles in one call
+        draw_blood_particles(surface, self.blood_particles)
 
+    def add_stuck_blood(self, splat):
+        """
+        Record a stuck blood splat in the current block and bake it into the block's decals
+        
+        Args:
+            splat: (x, y, size, color, life) tuple
+        """
+        # Make sure the current block has an entry in the dictionary
+        if self.current_block not in self.stuck_particles:
+            self.stuck_particles[self.current_block] = []
+        splats = self.stuck_particles[self.current_block]
+        splats.append(splat)
+        
+        if len(splats) > MAX_STUCK_PER_BLOCK:
+            # Wash away the oldest splats; the rest are re-baked on the next draw
+            del splats[:STUCK_PRUNE_COUNT]
+            self.decal_layers.pop(self.current_block, None)
+            return
+        
+        # Already baked: add just this splat
+        decal_layer = self.decal_layers.get(self.current_block)
+        if decal_layer is not None:
+            self.draw_splat(decal_layer[1], *splat)
+    
+    def draw_splat(self, surface, x, y, size, color, life):
+        """Draw one stuck blood splat"""
+        # Calculate opacity based on life
+        opacity = min(255, life * 10)  # Fade out based on life
+        
+        # Shared alpha circle for this size, colour and opacity
+        particle_surface = particle_sprites.get_circle(size//2, color, opacity, size)
+        
+        # Draw the particle
+        surface.blit(particle_surface, (x - size//2, y - size//2))
+    
+    def get_decal_layer(self, static_layer):
+        """
+        Get the current block's ground with its stuck blood baked in
+        
+        Splats are drawn onto a copy of the block's static layer once (and
+        new ones as they stick), so drawing blood costs nothing per frame
+        however much has been spilled. A re-baked static layer or washed
+        away splats give a new surface, which dirty-rect mode redraws in full.
+        
+        Args:
+            static_layer: The block's baked ground and static entities
+        
+        Returns:
+            Surface to draw as the block's background (static_layer itself if there is no blood)
+        """
+        splats = self.stuck_particles.get(self.current_block)
+        if not splats or static_layer is None:
+            return static_layer
+        
+        decal_layer = self.decal_layers.get(self.current_block)
+        if decal_layer is None or decal_layer[0] is not static_layer:
+            layer = static_layer.copy()
+            for splat in splats:
+                self.draw_splat(layer, *splat)
+            decal_layer = (static_layer, layer)
+            self.decal_layers[self.current_block] = decal_layer
+        
+        # Keep layers only for the most recently drawn blocks
+        self.decal_layers.move_to_end(self.current_block)
+        while len(self.decal_layers) > MAX_DECAL_LAYERS:
+            self.decal_layers.popitem(last=False)
+        
+        return decal_layer[1]
+    
     def draw_stuck_blood(self, surface):
-        """Draw only the stuck blood particles (should be called before drawing entities)"""
+        """Draw only the stuck blood particles splat by splat (get_decal_layer bakes them instead)"""
         # Draw stuck particles for the current block only
-        if self.current_block in self.stuck_particles:
-            for x, y, size, color, life in self.stuck_particles[self.current_block]:
-                # Skip if outside screen (optimization)
-                if x < -size or x > pygame.display.get_surface().get_width() + size or \
-                y < -size or y > pygame.display.get_surface().get_height() + size:
-                    continue
-                
-                # Calculate opacity based on life
-                opacity = min(255, life * 10)  # Fade out based on life
-                
-                # Create a surface with alpha for the particle
-                particle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                
-                # Set the color with opacity
-                color_with_alpha = (*color, opacity)
-                pygame.draw.circle(particle_surface, color_with_alpha, 
-                                (size//2, size//2), size//2)
-                
-                # Draw the particle
-                surface.blit(particle_surface, (x - size//2, y - size//2))
+        screen_width, screen_height = surface.get_size()
+        for x, y, size, color, life in self.stuck_particles.get(self.current_block, []):
+            # Skip if outside screen (optimization)
+            if x < -size or x > screen_width + size or y < -size or y > screen_height + size:
+                continue
+            self.draw_splat(surface, x, y, size, color, life)
     
     def draw_xp_particles(self, surface):
         """Draw XP particles with fading effect"""
         if not self.xp_particles:
             return
             
+        blits = []
         for particle in self.xp_particles:
             # Calculate opacity based on remaining life percentage
             if 'max_life' in particle:
@@ -220,18 +303,24 @@ class ParticleSystem:
             else:
                 opacity = 255  # Full opacity for particles without max_life
             
-            # Create a surface with alpha for the particle
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            
-            # Set the color with opacity
-            color_with_alpha = (*particle['color'], opacity)
-            pygame.draw.circle(particle_surface, color_with_alpha, 
-                          (particle['size'], particle['size']), 
-                          particle['size'])
+            # Shared alpha circle for this size, colour and opacity
+            particle_surface = particle_sprites.get_circle(particle['size'], particle['color'], opacity)
             
-            # Draw the particle
-            surface.blit(particle_surface, (int(particle['x'] - particle['size']), int(particle['y'] - particle['size'])))
+            blits.append((particle_surface, (int(particle['x'] - particle['size']), int(particle['y'] - particle['size']))))
+        
+        # Draw all particles in one call
+        surface.blits(blits, doreturn=False)
     
+    def get_draw_rect(self):
+        """Get the rect covering the flying (and just stuck) blood and XP/fire particles, or None"""
+        bounds = get_particle_bounds(self.blood_particles + self.stuck_this_frame)
+        xp_bounds = get_particle_bounds(self.xp_particles)
+        if bounds is None:
+            return xp_bounds
+        if xp_bounds is not None:
+            bounds.union_ip(xp_bounds)
+        return bounds
+
     def set_current_block(self, block_x, block_y):
         """Update the player's current block coordinates"""
         self.current_block = (block_x, block_y)
@@ -246,6 +335,9 @@ class ParticleSystem:
             size = random.randint(2, 4)
         if life == None:
             life = random.randint(3, 6)
+        if particle_engine:
+            particle_engine.emit_fire_trail(x, y, size, life)
+            return
         for _ in range(2):
             self.xp_particles.append({
                 'x': x,
@@ -258,6 +350,10 @@ class ParticleSystem:
 
     def create_fire_explosion(self, x, y):
         """Create a dynamic fire explosion with particles that spread outward"""
+        if particle_engine:
+            particle_engine.emit_fire_explosion(x, y)
+            return
+        
         # Create more particles for a bigger explosion
         particle_count = random.randint(15, 25)
         
@@ -339,6 +435,9 @@ class ParticleSystem:
     def create_smoke_cloud(self, x, y):
         """Create a smoke cloud that rises and dissipates"""
         # Small rising black/gray cloud after firebolt hits
+        if particle_engine:
+            particle_engine.emit_smoke_cloud(x, y)
+            return
         for _ in range(8):
             # Random angle but biased upward
             angle = random.uniform(-2.5, 0.5)  # Mostly upward (-π to π/6)
@@ -4,6 +4,7 @@ from inventory import Inventory
 from .attributes import PlayerAttributes
 from .particles import ParticleSystem
 from .sprite_sheet import SpriteSheet
+from .sword_angles import SwordAngleTable
 
 class Player:
     # change to ark if needed
@@ -67,6 +68,8 @@ class Player:
         self.sprites, self.sword_sprite = self.sprite_sheet.load_character_sprites(
             character_name, self.width, self.height
         )
+        # Pre-rotated sword sprites shared with every character using this sword
+        self.sword_angles = SwordAngleTable.get_table(character_name, self.sword_sprite)
 
     def gain_xp(self, amount):
         """Add XP to the player and check for level up"""
@@ -419,6 +422,18 @@ class Player:
         """Return player collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
         
+    def get_draw_rect(self):
+        """Return the area the player draws to: sprite, sword swing and particles"""
+        rect = self.get_rect()
+        if self.swinging:
+            center_x = self.x + self.width / 2
+            center_y = self.y + self.height / 2 - (9 if self.facing == 'up' else 0)
+            rect.union_ip(self.sword_angles.get_reach_rect(center_x, center_y, self.attributes.sword_length))
+        particle_rect = self.particles.get_draw_rect()
+        if particle_rect:
+            rect.union_ip(particle_rect)
+        return rect
+
     def start_swing(self):
         """Start the sword swing animation"""
         if not self.swinging:  # Only start if not already swinging
@@ -597,30 +612,8 @@ class Player:
         # This value is now controlled by the level system
         sword_length = self.attributes.sword_length
         
-        # Calculate sword position based on rotation angle
-        sword_x = player_center_x + math.cos(rotation_angle) * sword_length
-        sword_y = player_center_y + math.sin(rotation_angle) * sword_length
-        
-        # Calculate display rotation angle in degrees for pygame
-        display_angle = -math.degrees(rotation_angle) - 90  # -90 to adjust for sword sprite orientation
-        
-        # Rotate sword sprite
-        rotated_sword = pygame.transform.rotate(self.sword_sprite, display_angle)
-        
-        # Get the new rect for the rotated sword to properly position it
-        sword_rect = rotated_sword.get_rect()
-        
-        # Set the sword position so that the handle (not the center) is at the rotation point
-        # We need to offset from the calculated position to account for handle placement
-        handle_offset_x = sword_rect.width * 0.5  # Adjust based on where the handle is in your sprite
-        handle_offset_y = sword_rect.height * 0.2  # Assume handle is at 20% of the sprite height
-        
-        # Calculate the offset position for the sprite
-        offset_x = sword_x - handle_offset_x
-        offset_y = sword_y - handle_offset_y
-        
-        # Draw the sword
-        surface.blit(rotated_sword, (offset_x, offset_y))
+        # Look up the pre-rotated sword instead of rotating it every frame
+        self.sword_angles.draw(surface, player_center_x, player_center_y, rotation_angle, sword_length)
     
     def draw(self, surface):
         """Draw the player with appropriate animation frame"""
@@ -648,22 +641,11 @@ class Player:
             self.particles.draw_xp_particles(surface)
             return
         
-        # For left-facing, use the right sprites but flip them horizontally
-        if self.facing == 'left':
-            if self.moving:
-                # Get right sprite and flip it
-                right_sprite = self.sprites['right_walk'][self.frame]
-                sprite = pygame.transform.flip(right_sprite, True, False)  # Flip horizontally
-            else:
-                # Get right idle sprite and flip it
-                right_sprite = self.sprites['right_idle'][0]
-                sprite = pygame.transform.flip(right_sprite, True, False)  # Flip horizontally
+        # Left-facing frames are pre-flipped copies of the right ones (see SpriteSheet)
+        if self.moving:
+            sprite = self.sprites[f'{self.facing}_walk'][self.frame]
         else:
-            # Normal sprite handling for other directions
-            if self.moving:
-                sprite = self.sprites[f'{self.facing}_walk'][self.frame]
-            else:
-                sprite = self.sprites[f'{self.facing}_idle'][0]
+            sprite = self.sprites[f'{self.facing}_idle'][0]
         
         # Draw the player character
         surface.blit(sprite, (self.x, self.y))
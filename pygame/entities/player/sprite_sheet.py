@@ -1,5 +1,6 @@
 import pygame
 import os
+from asset_cache import asset_cache
 
 class SpriteSheet:
     """
@@ -14,19 +15,19 @@ class SpriteSheet:
             character_name (str): Name of the character ("link", "gojou", "ark", etc.)
         """
         self.character_name = character_name
-        self.spritesheet = None
+        self.spritesheet_path = None
         
         # Load the appropriate sprite sheet for characters that use it
         if character_name.lower() in ["link", "gojou"]:
             self.load_spritesheet()
     
     def load_spritesheet(self):
-        """Load the sprite sheet image"""
-        try:
-            self.spritesheet = pygame.image.load('assets/sprites.png').convert_alpha()
-        except Exception as e:
-            print(f"Error loading sprites: {e}")
-            self.spritesheet = None
+        """Locate the sprite sheet image (frames are sliced through the asset cache)"""
+        if asset_cache.has_image('assets/sprites.png'):
+            self.spritesheet_path = 'assets/sprites.png'
+        else:
+            print("Error loading sprites: assets/sprites.png not found")
+            self.spritesheet_path = None
     
     def get_sprite_definitions(self, character_name):
         """Define sprite locations based on character name"""
@@ -93,20 +94,18 @@ class SpriteSheet:
             target_width, target_height: Size to scale to (optional)
         
         Returns:
-            A pygame Surface with the extracted sprite
+            A shared pygame Surface with the extracted sprite (a subsurface
+            view of the sheet when no scaling is needed)
         """
-        if self.spritesheet is None:
+        if self.spritesheet_path is None:
             # Create a placeholder if spritesheet failed to load
             sprite = pygame.Surface((width, height), pygame.SRCALPHA)
             sprite.fill((50, 50, 150))
             return sprite
-            
-        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
-        sprite.blit(self.spritesheet, (0, 0), (x, y, width, height))
         
-        if target_width and target_height:
-            return pygame.transform.scale(sprite, (target_width, target_height))
-        return sprite
+        # Shared frame, sliced and scaled once per process
+        target_size = (target_width, target_height) if target_width and target_height else None
+        return asset_cache.get_frame(self.spritesheet_path, (x, y, width, height), target_size)
     
     def get_sword_sprite(self, character_name):
         """
@@ -119,21 +118,17 @@ class SpriteSheet:
         _, sword_def = self.get_sprite_definitions(character_name)
         x, y, width, height = sword_def
         
-        # Load the original spritesheet if not already loaded
-        if self.spritesheet is None:
-            try:
-                self.spritesheet = pygame.image.load('assets/sprites.png').convert_alpha()
-            except Exception as e:
-                print(f"Error loading sprites for sword: {e}")
+        # Locate the original spritesheet if not already done
+        if self.spritesheet_path is None:
+            self.load_spritesheet()
+            if self.spritesheet_path is None:
                 # Create placeholder
                 sword_sprite = pygame.Surface((width, height), pygame.SRCALPHA)
                 sword_sprite.fill((200, 200, 200))
                 return pygame.transform.scale(sword_sprite, (width * 2, height * 2))
         
-        # Extract the sword sprite
-        sprite = self.get_sprite(x, y, width, height)
-        # Keep the original aspect ratio for the sword
-        return pygame.transform.scale(sprite, (width * 2, height * 2))
+        # Extract the sword sprite, keeping the original aspect ratio
+        return self.get_sprite(x, y, width, height, width * 2, height * 2)
     
     # Methods for loading separate image files
     def load_image(self, file_path):
@@ -147,7 +142,7 @@ class SpriteSheet:
             Loaded pygame Surface or None if loading failed
         """
         try:
-            return pygame.image.load(file_path).convert_alpha()
+            return asset_cache.get_image(file_path)
         except Exception as e:
             print(f"Error loading image {file_path}: {e}")
             return None
@@ -163,20 +158,20 @@ class SpriteSheet:
         Returns:
             A pygame Surface with the loaded sprite
         """
-        sprite = self.load_image(file_path)
+        target_size = (target_width, target_height) if target_width and target_height else None
         
-        if sprite is None:
-            # Create a placeholder if image failed to load
-            sprite = pygame.Surface((16, 24), pygame.SRCALPHA)
-            sprite.fill((50, 50, 150))
-            
-            if target_width and target_height:
-                return pygame.transform.scale(sprite, (target_width, target_height))
-            return sprite
+        try:
+            # Shared sprite, loaded and scaled once per process
+            return asset_cache.get_image(file_path, target_size)
+        except Exception as e:
+            print(f"Error loading image {file_path}: {e}")
             
-        if target_width and target_height:
-            return pygame.transform.scale(sprite, (target_width, target_height))
+        # Create a placeholder if image failed to load
+        sprite = pygame.Surface((16, 24), pygame.SRCALPHA)
+        sprite.fill((50, 50, 150))
         
+        if target_size:
+            return pygame.transform.scale(sprite, target_size)
         return sprite
     
     def extract_frames_from_spritesheet(self, file_path, num_frames, character_name, direction, target_width=None, target_height=None):
@@ -193,10 +188,9 @@ class SpriteSheet:
         Returns:
             List of pygame Surfaces containing the individual frames
         """
-        spritesheet = self.load_image(file_path)
         frames = []
         
-        if spritesheet is None:
+        if not asset_cache.has_image(file_path):
             # Create placeholder frames if spritesheet failed to load
             for _ in range(num_frames):
                 frame = pygame.Surface((16, 24), pygame.SRCALPHA)
@@ -211,20 +205,11 @@ class SpriteSheet:
         # Get specific frame coordinates based on character and direction
         frame_coords = self.get_frame_coordinates(character_name, direction)
         
-        # Extract each frame using the specific coordinates
-        for coords in frame_coords:
-            x, y, width, height = coords
-            
-            # Create a frame with the standard 16x24 size
-            frame = pygame.Surface((16, 24), pygame.SRCALPHA)
-            
-            # Blit the sprite onto the frame
-            frame.blit(spritesheet, (0, 0), (x, y, width, height))
-            
-            if target_width and target_height:
-                frame = pygame.transform.scale(frame, (target_width, target_height))
-                
-            frames.append(frame)
+        # Extract each frame using the specific coordinates (all frames are 16x24),
+        # sliced and scaled once per process by the asset cache
+        target_size = (target_width, target_height) if target_width and target_height else None
+        for x, y, width, height in frame_coords:
+            frames.append(asset_cache.get_frame(file_path, (x, y, 16, 24), target_size))
             
         return frames
     
@@ -349,11 +334,10 @@ class SpriteSheet:
         
         try:
             # Get the spritesheet dimensions
-            spritesheet = self.load_image(file_path)
-            if spritesheet is None:
+            if not asset_cache.has_image(file_path):
                 return [(0, 0, 16, 24) for _ in range(8)]  # Default placeholders
                 
-            sheet_width = spritesheet.get_width()
+            sheet_width, _ = asset_cache.get_image_size(file_path)
             num_frames = 8  # Default number of frames
             
             # Calculate frame width
@@ -385,11 +369,10 @@ class SpriteSheet:
             'down_idle': os.path.join(base_dir, f"{character_name.lower()}_stand_down.png"),
             'up_idle': os.path.join(base_dir, f"{character_name.lower()}_stand_up.png"),
             'right_idle': os.path.join(base_dir, f"{character_name.lower()}_stand_right.png"),
-            'left_idle': os.path.join(base_dir, f"{character_name.lower()}_stand_left.png"),
             'down_walk': os.path.join(base_dir, f"{character_name.lower()}_walk_down_speed-70.png"),
             'up_walk': os.path.join(base_dir, f"{character_name.lower()}_walk_up_speed-70.png"),
-            'right_walk': os.path.join(base_dir, f"{character_name.lower()}_walk_right_speed-70.png"),
-            'left_walk': os.path.join(base_dir, f"{character_name.lower()}_walk_left_speed-70.png")
+            'right_walk': os.path.join(base_dir, f"{character_name.lower()}_walk_right_speed-70.png")
+            # Left-facing animations are mirrored from the right ones in load_character_sprites
         }
         
         # Character-specific adjustments
@@ -399,11 +382,11 @@ class SpriteSheet:
             num_walk_frames = 8  # Update this if Ark has a different number of frames
         
         # Load single frame sprites (idle animations)
-        for direction in ['down_idle', 'up_idle', 'right_idle', 'left_idle']:
+        for direction in ['down_idle', 'up_idle', 'right_idle']:
             sprites[direction] = [self.get_sprite_from_file(file_paths[direction], player_width, player_height)]
         
         # Load and extract frames from walk animation spritesheets
-        for direction in ['down_walk', 'up_walk', 'right_walk', 'left_walk']:
+        for direction in ['down_walk', 'up_walk', 'right_walk']:
             sprites[direction] = self.extract_frames_from_spritesheet(
                 file_paths[direction], 
                 num_frames=num_walk_frames,
@@ -432,7 +415,7 @@ class SpriteSheet:
         sprite_defs, _ = self.get_sprite_definitions(character_name)
         
         # Check if sprite sheet was loaded successfully
-        if not self.spritesheet:
+        if not self.spritesheet_path:
             # Create colored rectangle placeholders
             sprites = {
                 'down_idle': [pygame.Surface((16, 24), pygame.SRCALPHA)],
@@ -457,14 +440,21 @@ class SpriteSheet:
                 sprite = self.get_sprite(x, y, w, h, player_width, player_height)
                 sprites[key].append(sprite)
         
-        # Create left animations by flipping right animations
-        if 'left_idle' not in sprites and 'right_idle' in sprites:
-            sprites['left_idle'] = [pygame.transform.flip(sprite, True, False) for sprite in sprites['right_idle']]
-        if 'left_walk' not in sprites and 'right_walk' in sprites:
-            sprites['left_walk'] = [pygame.transform.flip(sprite, True, False) for sprite in sprites['right_walk']]
-        
         return sprites
     
+    def add_mirrored_sprites(self, sprites):
+        """
+        Create the left-facing animations by flipping the right-facing ones once,
+        so drawing a left-facing character never has to flip a surface
+        
+        Args:
+            sprites: Dictionary of sprites, updated in place
+        """
+        for animation in ['idle', 'walk']:
+            right_key = f'right_{animation}'
+            if right_key in sprites:
+                sprites[f'left_{animation}'] = [asset_cache.get_flipped(sprite) for sprite in sprites[right_key]]
+    
     def load_character_sprites(self, character_name, player_width, player_height):
         """
         Load all sprites for the character and scale them to the player size.
@@ -478,6 +468,7 @@ class SpriteSheet:
             Dictionary of sprites and sword sprite
         """
         self.character_name = character_name
+        bytes_before = asset_cache.get_memory_report()['owned_bytes']
         
         # Choose the appropriate loading method based on character
         if character_name.lower() in ["link", "gojou"]:
@@ -491,7 +482,15 @@ class SpriteSheet:
             print(f"Character '{character_name}' not recognized. Using Link as default.")
             sprites = self.load_character_sprites_from_spritesheet("link", player_width, player_height)
         
+        # Pre-flip the right-facing frames for left-facing drawing
+        self.add_mirrored_sprites(sprites)
+        
         # Get the sword sprite (always from the original spritesheet)
         sword_sprite = self.get_sword_sprite(character_name)
         
+        # Frames are shared views/copies, so only the first load of a character costs memory
+        frame_count = sum(len(frames) for frames in sprites.values())
+        new_bytes = asset_cache.get_memory_report()['owned_bytes'] - bytes_before
+        print(f"DEBUG: Loaded {character_name} sprites: {frame_count} frames, {new_bytes / 1024:.1f} KB new sprite memory")
+        
         return sprites, sword_sprite
\ No newline at end of file
@@ -0,0 +1,86 @@
+import pygame
+import math
+
+class SwordAngleTable:
+    """
+    Pre-rotated sword sprites for the swing animation, shared by the player and NPCs.
+
+    Rotating the sword every frame is one of the slowest pygame transforms, so
+    the sprite is rotated once to every ANGLE_STEP degrees of a full turn.
+    The four facings each swing through a 90-degree arc and together cover
+    the whole circle. Sword length only moves the sprite along the swing
+    direction, so the same rotated surfaces serve every length
+    (including the extended_sword skill).
+    """
+    ANGLE_STEP = 2  # Degrees between pre-rotated sprites
+
+    # Tables shared across all characters using the same sword
+    # Format: {character_name: SwordAngleTable}
+    tables = {}
+
+    def __init__(self, sword_sprite, angle_step=ANGLE_STEP):
+        self.angle_step = angle_step
+        self.angle_count = int(360 / angle_step)
+
+        # One entry per quantised angle
+        # Format: [(rotated_sprite, handle_offset_x, handle_offset_y), ...]
+        self.entries = []
+        # Largest rotated sprite side, for the area a swing can draw to
+        self.max_size = 0
+        for i in range(self.angle_count):
+            rotated_sword = pygame.transform.rotate(sword_sprite, i * angle_step)
+            sword_rect = rotated_sword.get_rect()
+
+            # The handle (not the center) sits at the rotation point:
+            # horizontally centered, 20% down the rotated sprite
+            handle_offset_x = sword_rect.width * 0.5
+            handle_offset_y = sword_rect.height * 0.2
+
+            self.entries.append((rotated_sword, handle_offset_x, handle_offset_y))
+            self.max_size = max(self.max_size, sword_rect.width, sword_rect.height)
+
+    @classmethod
+    def get_table(cls, character_name, sword_sprite):
+        """Get the shared table for a character's sword, building it on first use"""
+        key = character_name.lower()
+        if key not in cls.tables:
+            cls.tables[key] = cls(sword_sprite)
+        return cls.tables[key]
+
+    def get(self, display_angle):
+        """
+        Look up the pre-rotated sword closest to a pygame rotation angle
+
+        Args:
+            display_angle: Rotation in degrees, as passed to pygame.transform.rotate
+
+        Returns:
+            (rotated_sprite, handle_offset_x, handle_offset_y)
+        """
+        index = int(round(display_angle / self.angle_step)) % self.angle_count
+        return self.entries[index]
+
+    def get_reach_rect(self, center_x, center_y, sword_length):
+        """Get a rect covering the sword at any angle around a character's center"""
+        reach = int(sword_length + self.max_size) + 1
+        return pygame.Rect(int(center_x) - reach, int(center_y) - reach, reach * 2, reach * 2)
+
+    def draw(self, surface, center_x, center_y, rotation_angle, sword_length):
+        """
+        Draw the sword swung to rotation_angle around a character's center
+
+        Args:
+            surface: Surface to draw on
+            center_x, center_y: Rotation point (the character's hand)
+            rotation_angle: Swing angle in radians (0 = pointing right)
+            sword_length: Distance from the rotation point to the handle
+        """
+        # Calculate sword position based on rotation angle
+        sword_x = center_x + math.cos(rotation_angle) * sword_length
+        sword_y = center_y + math.sin(rotation_angle) * sword_length
+
+        # Display rotation in degrees for pygame (-90 adjusts for the sprite pointing up)
+        display_angle = -math.degrees(rotation_angle) - 90
+
+        rotated_sword, handle_offset_x, handle_offset_y = self.get(display_angle)
+        surface.blit(rotated_sword, (sword_x - handle_offset_x, sword_y - handle_offset_y))
@@ -71,6 +71,11 @@ class Firebolt(Projectile):
                 
             self.particle_system.create_fire_trail(self.x + offset_x, self.y + offset_y)
 
+    def get_draw_rect(self):
+        """Return the area the bolt's glow covers (its trail is drawn by the player's particles)"""
+        return pygame.Rect(int(self.x) - self.bolt_size - 1, int(self.y) - self.bolt_size - 1,
+                           self.bolt_size * 2 + 2, self.bolt_size * 2 + 2)
+
     def draw(self, surface):
         # Draw outer glow
         pygame.draw.circle(
@@ -73,6 +73,10 @@ class Projectile:
         """Hook for subclasses to update custom rectangle positions"""
         pass
 
+    def get_draw_rect(self):
+        """Return the area the projectile draws to"""
+        return self.rect.copy()
+
     def draw(self, surface):
         pygame.draw.rect(surface, (255, 255, 0), self.rect)
 
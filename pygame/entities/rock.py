@@ -1,7 +1,11 @@
 import pygame
 import random
+from asset_cache import asset_cache
 
 class Rock:
+    # Rock sprite variants in assets/rock/
+    sprite_choices = ['rock1.png', 'rock2.png', 'rock3.png']
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -13,10 +17,9 @@ class Rock:
         
         # Load direct rock image instead of spritesheet
         try:
-            rock_choice = random.choice(['rock1.png', 'rock2.png', 'rock3.png'])
-            self.sprite = pygame.image.load(f'assets/rock/{rock_choice}').convert_alpha()
-            # Scale the sprite to match the desired dimensions
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
+            rock_choice = random.choice(Rock.sprite_choices)
+            # Shared, pre-scaled sprite from the asset cache
+            self.sprite = asset_cache.get_image(f'assets/rock/{rock_choice}', (self.width, self.height))
         except Exception as e:
             print(f"Error loading rock sprite: {e}")
             # Create placeholder
@@ -26,6 +29,10 @@ class Rock:
     def get_rect(self):
         """Return the collision rectangle"""
         return self.rect
+    
+    def is_static(self):
+        """Never moves or animates, so it is baked into the block's static layer"""
+        return True
         
     def draw(self, surface):
         """Draw the rock"""
@@ -1,9 +1,18 @@
 import pygame
 import random
 import math
+from particle_sprites import particle_sprites
 
 class Soul:
     """Experience orb that can be collected by the player"""
+    ROTATION_STEP = 5     # Degrees between pre-rotated orb sprites
+    GLOW_ALPHA_STEP = 8   # Pulse alpha values per glow sprite bucket
+    
+    # Sprites shared by every soul so drawing never allocates surfaces
+    soul_image = None
+    rotation_steps = []   # Format: [(rotated_sprite, half_width, half_height), ...]
+    glow_sprites = {}     # Format: {(glow_size, alpha_bucket): Surface}
+    
     def __init__(self, x, y, value=1):
         # Position
         self.x = x
@@ -46,24 +55,61 @@ class Soul:
         self.load_sprites()
     
     def load_sprites(self):
-        """Load or create soul sprites"""
+        """Point this soul at the shared sprites, creating them on first use"""
+        if Soul.soul_image is None:
+            Soul.soul_image = self.create_soul_image()
+            Soul.rotation_steps = self.build_rotation_steps(Soul.soul_image)
+            
+            # Pre-render every glow bucket the pulse animation can reach
+            for glow_alpha in range(80, 161, Soul.GLOW_ALPHA_STEP):
+                self.get_glow_sprite(glow_alpha)
+        
+        self.soul_image = Soul.soul_image
+    
+    def create_soul_image(self):
+        """Create the soul orb sprite"""
         try:
             # Create a small blue/green soul orb
-            self.soul_image = pygame.Surface((6, 6), pygame.SRCALPHA)
+            soul_image = pygame.Surface((6, 6), pygame.SRCALPHA)
             
             # Create a blue/green soul orb
-            pygame.draw.circle(self.soul_image, (100, 200, 255), (3, 3), 2)  # Inner core
-            pygame.draw.circle(self.soul_image, (150, 230, 255, 180), (3, 3), 3)  # Outer glow
+            pygame.draw.circle(soul_image, (100, 200, 255), (3, 3), 2)  # Inner core
+            pygame.draw.circle(soul_image, (150, 230, 255, 180), (3, 3), 3)  # Outer glow
             
             # Add a highlight
-            pygame.draw.circle(self.soul_image, (220, 240, 255, 200), (2, 2), 1)
+            pygame.draw.circle(soul_image, (220, 240, 255, 200), (2, 2), 1)
             
             print("Created soul orb graphic")
         except Exception as e:
             print(f"Error creating soul sprites: {e}")
             # Fallback to a simple colored circle
-            self.soul_image = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(self.soul_image, (0, 200, 255), (3, 3), 2)
+            soul_image = pygame.Surface((6, 6), pygame.SRCALPHA)
+            pygame.draw.circle(soul_image, (0, 200, 255), (3, 3), 2)
+        
+        return soul_image
+    
+    def build_rotation_steps(self, soul_image):
+        """Rotate the orb once per ROTATION_STEP degrees of a full turn"""
+        rotation_steps = []
+        for angle in range(0, 360, Soul.ROTATION_STEP):
+            rotated_soul = pygame.transform.rotate(soul_image, angle)
+            rotation_steps.append((rotated_soul, rotated_soul.get_width() / 2, rotated_soul.get_height() / 2))
+        return rotation_steps
+    
+    def get_glow_sprite(self, glow_alpha):
+        """Get the shared glow sprite for a pulse alpha, rendering its bucket on first use"""
+        alpha_bucket = (glow_alpha // Soul.GLOW_ALPHA_STEP) * Soul.GLOW_ALPHA_STEP
+        key = (self.glow_size, alpha_bucket)
+        
+        glow_surface = Soul.glow_sprites.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((self.glow_size, self.glow_size), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (100, 200, 255, alpha_bucket), 
+                              (self.glow_size//2, self.glow_size//2), 
+                              self.glow_size//2)
+            Soul.glow_sprites[key] = glow_surface
+        
+        return glow_surface
     
     def update(self, player):
         """Update soul animation and check for collection"""
@@ -195,27 +241,25 @@ class Soul:
 
     def draw(self, surface):
         """Draw the soul with effects"""
-        # Draw glow
-        glow_surface = pygame.Surface((self.glow_size, self.glow_size), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (100, 200, 255, self.glow_alpha), 
-                          (self.glow_size//2, self.glow_size//2), 
-                          self.glow_size//2)
+        # Draw glow (pre-rendered sprite for the current pulse bucket)
+        glow_surface = self.get_glow_sprite(self.glow_alpha)
         
         glow_x = self.x + 3 - self.glow_size//2
         glow_y = self.y + 3 - self.glow_size//2 + self.bob_offset
         surface.blit(glow_surface, (glow_x, glow_y))
         
-        # Draw particles behind the soul
-        for particle in self.particles:
-            pygame.draw.circle(surface, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), 
-                             particle['size'])
+        # Draw particles behind the soul (shared circle sprites, one blits call)
+        surface.blits([
+            (particle_sprites.get_circle(particle['size'], particle['color'], 255, particle['size'] * 2 + 1),
+             (int(particle['x']) - particle['size'], int(particle['y']) - particle['size']))
+            for particle in self.particles
+        ], doreturn=False)
         
         # Draw soul
-        # Apply bobbing and rotation
-        rotated_soul = pygame.transform.rotate(self.soul_image, self.rotation)
-        soul_rect = rotated_soul.get_rect(center=(self.x + 3, self.y + 3 + self.bob_offset))
-        surface.blit(rotated_soul, soul_rect.topleft)
+        # Apply bobbing and rotation (nearest pre-rotated step)
+        step = round(self.rotation / Soul.ROTATION_STEP) % len(Soul.rotation_steps)
+        rotated_soul, half_width, half_height = Soul.rotation_steps[step]
+        surface.blit(rotated_soul, (self.x + 3 - half_width, self.y + 3 + self.bob_offset - half_height))
         
         # Debug: Draw attraction radius if enabled
         if hasattr(self, 'debug_show_radius') and self.debug_show_radius:
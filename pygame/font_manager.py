@@ -0,0 +1,97 @@
+import os
+import pygame
+
+# Optional bundled fonts: a TTF here is loaded directly, skipping the system
+# font search (fontconfig on Linux). Files are named <face>.ttf and
+# <face>-Bold.ttf, e.g. assets/fonts/Arial.ttf
+BUNDLED_FONT_DIR = 'assets/fonts'
+
+
+class FontManager:
+    """
+    Hands out shared pygame fonts.
+
+    pygame.font.SysFont searches the system font list on every call, and the
+    game used to call it for every HUD, map, dialog and screen it built
+    (again on each restart). Here each (face, size, bold) is resolved once
+    per process and the same Font object is returned afterwards, which also
+    keeps text_cache entries keyed on that font valid across restarts.
+    """
+    def __init__(self, font_dir=BUNDLED_FONT_DIR):
+        self.font_dir = font_dir
+
+        # Format: {(face, size, bold): Font}
+        self.fonts = {}
+
+        self.lookups = 0
+        self.lookup_time = 0.0
+
+    def get_bundled_path(self, face, bold):
+        """Get the bundled TTF for a face, or None if it isn't shipped"""
+        if face is None:
+            return None
+
+        file_names = [f"{face}-Bold.ttf", f"{face}.ttf"] if bold else [f"{face}.ttf"]
+        for file_name in file_names:
+            path = os.path.join(self.font_dir, file_name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def get_font(self, size, face='Arial', bold=False):
+        """
+        Get a shared font, resolving it on first use
+
+        Args:
+            size: Point size
+            face: Font face name (None for pygame's default font)
+            bold: Whether the font should be bold
+
+        Returns:
+            pygame.font.Font shared by every caller (do not change its style)
+        """
+        key = (face, size, bold)
+        font = self.fonts.get(key)
+        if font is not None:
+            return font
+
+        start_time = pygame.time.get_ticks()
+        bundled_path = self.get_bundled_path(face, bold)
+        if bundled_path:
+            font = pygame.font.Font(bundled_path, size)
+            # Only the regular file is shipped: embolden it like SysFont would
+            if bold and not bundled_path.endswith('-Bold.ttf'):
+                font.set_bold(True)
+        else:
+            font = pygame.font.SysFont(face, size, bold=bold)
+
+        self.lookups += 1
+        self.lookup_time += (pygame.time.get_ticks() - start_time) / 1000.0
+        self.fonts[key] = font
+        return font
+
+    def preload(self, font_specs):
+        """Resolve a list of (size, face, bold) tuples ahead of time"""
+        for size, face, bold in font_specs:
+            self.get_font(size, face, bold)
+
+
+# Every font the game's screens ask for, resolved by the loading screen
+GAME_FONTS = [
+    (14, 'Arial', False),   # HUD XP / map labels
+    (15, 'Arial', False),   # Dialog balloon default
+    (16, 'Arial', False),   # HUD / buttons / descriptions / balloons
+    (18, 'Arial', False),   # Character screen text
+    (20, 'Arial', False),   # Dialog options / death screen prompt
+    (22, 'Arial', True),    # Character screen stats
+    (24, 'Arial', True),    # Dialog titles
+    (24, 'Arial', False),   # Map title
+    (26, 'Arial', True),    # Character screen title
+    (28, 'Arial', False),   # Death screen options
+    (72, 'Arial', True),    # Death screen title
+    (24, None, False),      # main.py default font
+]
+
+
+# Singleton instance
+font_manager = FontManager()
@@ -34,6 +34,7 @@ a = Analysis(
         'entities.player.particles',
         'entities.player.skill_tree',
         'entities.player.sprite_sheet',
+        'entities.player.sword_angles',
         
         # Items
         'items',
@@ -41,13 +42,24 @@ a = Analysis(
         'items.ancient_scroll',
         'items.dragon_heart',
         'items.health_potion',
+        'items.item_registry',
         
         # Game modules
+        'asset_cache',
         'character_screen',
+        'compiled_cache',
         'constants',
         'death_screen',
         'hud',
         'inventory',
+        'loading_screen',
+        'text_cache',
+        'font_manager',
+        'ground',
+        'renderer',
+        'scene_stack',
+        'particle_sprites',
+        'particle_engine',
         'map',
         'world'
     ],
@@ -0,0 +1,149 @@
+import pygame
+import random
+from collections import OrderedDict
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN
+from asset_cache import asset_cache
+
+TILESET_PATH = 'assets/world-tiles-1.png'
+SOURCE_TILE_SIZE = 8   # Tiles in the tileset are 8x8 pixels
+TILE_SIZE = 32         # Drawn 4x, on the same 32px grid as grass and rocks
+CHUNK_TILES = 16       # Chunks are 16x16 tiles (512x512 pixels)
+MAX_CHUNKS = 48        # Cached chunks (~1 MB each): a few blocks' worth
+
+# Ground tiles, as (x, y) of the 8x8 tile in the tileset, with their pick weights
+# Format: {tile_name: (weight, [(x, y), ...])}
+GROUND_TILES = {
+    'grass':   (80, [(233, 39)]),
+    'leaves':  (8,  [(253, 57), (261, 57), (253, 65), (261, 65)]),
+    'stripes': (5,  [(270, 57), (278, 57), (270, 65), (278, 65)]),
+    'tuft':    (4,  [(233, 48), (241, 48)]),
+    'flower':  (2,  [(296, 39), (287, 48), (296, 48), (304, 48)]),
+    'bush':    (1,  [(241, 39)]),
+}
+
+
+class GroundRenderer:
+    """
+    Tiled ground for world blocks, drawn from world-tiles-1.png.
+
+    Each block gets a tile grid generated from its coordinates, so revisiting
+    a block (or reloading a save) shows the same ground without storing it.
+    Tiles are composited into CHUNK_TILES x CHUNK_TILES chunk surfaces once,
+    and a whole screen of ground is then a handful of chunk blits instead of
+    one blit per tile. The block's static layer bakes that into a single
+    surface, so gameplay frames pay one blit for ground and props together.
+    """
+    def __init__(self, tileset_path=TILESET_PATH):
+        self.tileset_path = tileset_path
+        self.columns = -(-SCREEN_WIDTH // TILE_SIZE)   # Round up to cover the screen
+        self.rows = -(-SCREEN_HEIGHT // TILE_SIZE)
+
+        # Scaled tile surfaces, one list per tile name
+        # Format: {tile_name: [Surface, ...]}
+        self.tiles = None
+        self.tile_names = list(GROUND_TILES)
+        self.tile_weights = [GROUND_TILES[name][0] for name in self.tile_names]
+
+        # Tile grids per block
+        # Format: {(block_x, block_y): [[(tile_name, variant), ...], ...]}
+        self.grids = {}
+
+        # Composited chunks, least recently used first
+        # Format: {(block_x, block_y, chunk_x, chunk_y): Surface}
+        self.chunks = OrderedDict()
+
+        self.chunk_builds = 0
+
+    def load_tiles(self):
+        """Slice and scale every ground tile through the asset cache (once)"""
+        if self.tiles is not None:
+            return self.tiles
+
+        self.tiles = {}
+        for name, (weight, positions) in GROUND_TILES.items():
+            self.tiles[name] = [
+                asset_cache.get_frame(self.tileset_path, (x, y, SOURCE_TILE_SIZE, SOURCE_TILE_SIZE),
+                                      (TILE_SIZE, TILE_SIZE))
+                for x, y in positions
+            ]
+        return self.tiles
+
+    def is_available(self):
+        """Check if the tileset can be used (falls back to a flat colour otherwise)"""
+        try:
+            self.load_tiles()
+            return True
+        except Exception as e:
+            print(f"Error loading ground tileset {self.tileset_path}: {e}")
+            return False
+
+    def get_tile_grid(self, block_x, block_y):
+        """Get the block's tile grid, generating it from the block coordinates"""
+        key = (block_x, block_y)
+        grid = self.grids.get(key)
+        if grid is None:
+            # Seeded per block: the same coordinates always give the same ground
+            rng = random.Random(f"ground:{block_x},{block_y}")
+            grid = []
+            for row in range(self.rows):
+                names = rng.choices(self.tile_names, weights=self.tile_weights, k=self.columns)
+                grid.append([(name, rng.randrange(len(GROUND_TILES[name][1]))) for name in names])
+            self.grids[key] = grid
+        return grid
+
+    def get_chunk(self, block_x, block_y, chunk_x, chunk_y):
+        """Get a composited chunk of a block's ground, building it on first use"""
+        key = (block_x, block_y, chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        tiles = self.load_tiles()
+        grid = self.get_tile_grid(block_x, block_y)
+
+        first_column = chunk_x * CHUNK_TILES
+        first_row = chunk_y * CHUNK_TILES
+        columns = min(CHUNK_TILES, self.columns - first_column)
+        rows = min(CHUNK_TILES, self.rows - first_row)
+
+        chunk = pygame.Surface((columns * TILE_SIZE, rows * TILE_SIZE))
+        if pygame.display.get_surface():
+            chunk = chunk.convert()
+        chunk.fill(GREEN)
+
+        for row in range(rows):
+            grid_row = grid[first_row + row]
+            for column in range(columns):
+                name, variant = grid_row[first_column + column]
+                chunk.blit(tiles[name][variant], (column * TILE_SIZE, row * TILE_SIZE))
+
+        self.chunks[key] = chunk
+        self.chunk_builds += 1
+        if len(self.chunks) > MAX_CHUNKS:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def draw_block(self, surface, block_x, block_y):
+        """Draw a block's whole ground onto a screen-sized surface, one blit per chunk"""
+        chunk_pixels = CHUNK_TILES * TILE_SIZE
+        for chunk_y in range(-(-self.rows // CHUNK_TILES)):
+            for chunk_x in range(-(-self.columns // CHUNK_TILES)):
+                chunk = self.get_chunk(block_x, block_y, chunk_x, chunk_y)
+                surface.blit(chunk, (chunk_x * chunk_pixels, chunk_y * chunk_pixels))
+
+    def draw_tiles(self, surface, block_x, block_y):
+        """Draw a block's ground tile by tile (uncached; used for benchmarks)"""
+        tiles = self.load_tiles()
+        for row, grid_row in enumerate(self.get_tile_grid(block_x, block_y)):
+            for column, (name, variant) in enumerate(grid_row):
+                surface.blit(tiles[name][variant], (column * TILE_SIZE, row * TILE_SIZE))
+
+    def clear(self):
+        """Drop cached grids and chunks"""
+        self.grids.clear()
+        self.chunks.clear()
+
+
+# Singleton instance
+ground_renderer = GroundRenderer()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Ground rendering benchmark.
+
+Compares the per-frame cost of clearing the screen to a flat colour (the old
+ground) with the tiled ground drawn tile by tile, from cached chunks, and as
+part of a block's baked static layer (what the game draws every frame).
+
+Run from the pygame directory:
+    python ground_benchmark.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN
+
+FRAMES = 300
+
+
+def time_per_frame(draw, frames=FRAMES):
+    """Average milliseconds per call of draw()"""
+    draw()  # Warm up (builds any caches)
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Silence the world's debug output while generating blocks
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        from ground import ground_renderer
+        from world import World
+
+        world = World()
+        world.generate_block(0, 0)
+        block = world.get_current_block()
+        props = block.static_entities
+
+        def old_frame():
+            screen.fill(GREEN)
+            for entity in props:
+                entity.draw(screen)
+
+        results = [
+            ("screen.fill (old ground)", time_per_frame(lambda: screen.fill(GREEN))),
+            ("screen.fill + grass/rock blits (old frame)", time_per_frame(old_frame)),
+            (f"tiles, one blit each ({ground_renderer.columns * ground_renderer.rows})",
+             time_per_frame(lambda: ground_renderer.draw_tiles(screen, 0, 0))),
+            ("tiles from cached chunks", time_per_frame(lambda: ground_renderer.draw_block(screen, 0, 0))),
+            ("baked static layer (new frame)", time_per_frame(lambda: world.draw_static_layer(screen))),
+        ]
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"Ground cost per frame at {SCREEN_WIDTH}x{SCREEN_HEIGHT} "
+          f"({pygame.display.get_driver()} driver, {FRAMES} frames):")
+    for label, ms in results:
+        print(f"  {label:<45} {ms:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,13 @@
 import pygame
 from entities.enemy.enemy import Enemy
+from text_cache import text_cache
+from font_manager import font_manager
+
+# Attributes each cached HUD panel shows; a change to one re-renders its panel
+STATUS_ATTRIBUTES = frozenset({'current_health', 'max_health', 'current_mana', 'max_mana', 'xp', 'xp_needed', 'level'})
+ABILITY_ATTRIBUTES = frozenset({'can_sprint', 'sprinting', 'sprint_timer', 'can_dash', 'dashing', 'dash_timer',
+                                'can_blink', 'blink_timer', 'sword_length'})
+COOLDOWN_REFRESH_MS = 100   # Ability cooldown countdowns re-render at most this often
 
 class HUD:
     def __init__(self, player):
@@ -16,8 +24,8 @@ class HUD:
         }
         
         # Fonts
-        self.font = pygame.font.SysFont('Arial', 16)
-        self.small_font = pygame.font.SysFont('Arial', 14)  # Smaller font for XP text
+        self.font = font_manager.get_font(16)
+        self.small_font = font_manager.get_font(14)  # Smaller font for XP text
         
         # Cached positions and measurements
         self.screen_width = pygame.display.get_surface().get_width()
@@ -28,19 +36,104 @@ class HUD:
         self.health_scaling = 7             # Width increase per health point
         self.mana_base_width = 10           # Base width for initial mana (2)
         self.mana_scaling = 6               # Width increase per mana point
+        
+        # Screen area of each panel; panels are cached surfaces re-rendered only when dirty
+        # Format: {panel_name: Rect}
+        self.panel_rects = {
+            'status': pygame.Rect(10, 10, 360, 70),                          # Icon, bars and XP text
+            'abilities': pygame.Rect(10, 85, 250, 100),                      # Ability info
+            'world': pygame.Rect(self.screen_width - 150, 10, 150, 20),     # World info
+        }
+        # Rendered panels, as (surface, screen position, area holding anything) for blits()
+        # Format: {panel_name: (Surface, (x, y), Rect)}
+        self.panels = {}
+        self.dirty_panels = set(self.panel_rects)
+        
+        # Controls list, rendered once on the first frame
+        self.controls_surface = None
+        
+        # World whose block changes re-render the world panel
+        self.world = None
+        self.block_info = ""
+        self.cooldown_refresh_time = 0
+        self.panel_renders = 0
+        
+        # Re-render panels when the attributes they show change
+        self.player.attributes.add_listener(self.on_attribute_changed)
+
+    def on_attribute_changed(self, name):
+        """Mark the panel showing a player attribute as needing a re-render"""
+        if name in STATUS_ATTRIBUTES:
+            self.dirty_panels.add('status')
+        if name in ABILITY_ATTRIBUTES:
+            self.dirty_panels.add('abilities')
+
+    def invalidate(self):
+        """Re-render every panel (a loaded save sets skills without going through attributes)"""
+        self.dirty_panels.update(self.panel_rects)
+
+    def on_block_changed(self, block_coords):
+        """Re-render the world panel for the new block"""
+        self.dirty_panels.add('world')
+
+    def set_world(self, game_world):
+        """Follow a world's block changes (a new game or a loaded save brings a new one)"""
+        if self.world is game_world:
+            return
+        if self.world:
+            self.world.remove_block_listener(self.on_block_changed)
+        self.world = game_world
+        game_world.add_block_listener(self.on_block_changed)
+        self.dirty_panels.add('world')
+
+    def has_running_cooldown(self):
+        """Check if a shown ability is cooling down (its countdown needs refreshing)"""
+        attributes = self.player.attributes
+        skill_tree = self.player.skill_tree
+        return ((attributes.sprint_timer and skill_tree.is_skill_unlocked("sprint"))
+                or (attributes.dash_timer and skill_tree.is_skill_unlocked("dash"))
+                or (attributes.blink_timer and skill_tree.is_skill_unlocked("blink")))
+
+    def update_panels(self):
+        """Re-render the panels whose contents changed since they were last drawn"""
+        current_time = pygame.time.get_ticks()
+        if self.has_running_cooldown() and current_time - self.cooldown_refresh_time >= COOLDOWN_REFRESH_MS:
+            self.dirty_panels.add('abilities')
+        
+        for name in self.dirty_panels:
+            rect = self.panel_rects[name]
+            if name in self.panels:
+                panel = self.panels[name][0]
+                panel.fill((0, 0, 0, 0))
+            else:
+                panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+            
+            if name == 'status':
+                self.draw_status_bars(panel, 0, 0)
+            elif name == 'abilities':
+                self.render_ability_info(panel, 0, 0, current_time)
+                self.cooldown_refresh_time = current_time
+            elif name == 'world':
+                self.block_info = self.world.get_block_description() if self.world else ""
+                self.display_world_info(panel, self.block_info, 0, 0)
+            
+            # Blit only the part that isn't transparent
+            area = panel.get_bounding_rect()
+            self.panels[name] = (panel, (rect.x + area.x, rect.y + area.y), area)
+            self.panel_renders += 1
+        self.dirty_panels.clear()
 
-    def draw_status_bars(self, surface):
-        """Draw health and mana bars in the main game view"""
+    def draw_status_bars(self, surface, x=10, y=10):
+        """Draw health and mana bars with their icon at (x, y)"""
         # Measurements
-        margin = 10                        # Margin from screen edge
         bar_spacing = 5                    # Space between bars
         bar_height = 15                    # Height of each bar
         icon_size = 40                     # Size of the octagonal icon
         max_bar_width = 300                # Maximum width for any bar
         
         # Draw the octagonal icon (placeholder for character icon)
-        icon_x = margin
-        icon_y = margin
+        icon_x = x
+        icon_y = y
         pygame.draw.rect(surface, self.colors['border'], (icon_x, icon_y, icon_size, icon_size))
         pygame.draw.rect(surface, (30, 30, 40), (icon_x + 2, icon_y + 2, icon_size - 4, icon_size - 4))
         
@@ -75,24 +168,25 @@ class HUD:
         
         # Display XP text underneath the icon - with fixed alignment
         # Now we access XP through the attributes component
-        xp_text = self.font.render(f"XP: {int(self.player.attributes.xp)}/{int(self.player.attributes.xp_needed)}", True, self.colors['xp'])
+        xp_text = text_cache.render(self.font, f"XP: {int(self.player.attributes.xp)}/{int(self.player.attributes.xp_needed)}", True, self.colors['xp'])
         text_x = icon_x
         text_y = icon_y + icon_size + 5  # 5px padding below the icon
         surface.blit(xp_text, (text_x, text_y))
         
         # Display values on bars
-        health_text = self.font.render(f"{self.player.attributes.current_health}/{self.player.attributes.max_health}", True, self.colors['text'])
+        health_text = text_cache.render(self.font, f"{self.player.attributes.current_health}/{self.player.attributes.max_health}", True, self.colors['text'])
         surface.blit(health_text, (health_x + 5, health_y))
         
-        mana_text = self.font.render(f"{self.player.attributes.current_mana}/{self.player.attributes.max_mana}", True, self.colors['text'])
+        mana_text = text_cache.render(self.font, f"{self.player.attributes.current_mana}/{self.player.attributes.max_mana}", True, self.colors['text'])
         surface.blit(mana_text, (mana_x + 5, mana_y))
 
-    def render_ability_info(self, surface):
-        """Display ability status information"""
-        # Position below status bars with extra space for XP text
-        x = 10
-        y = 85  # Increased to make room for XP text under the icon
-        
+    def get_cooldown_status(self, timer, current_time):
+        """Get the 'Cooling Down' label with the seconds left on an ability's timer"""
+        remaining = max(0, timer - current_time) / 1000
+        return f"Cooling Down ({remaining:.1f}s)"
+
+    def render_ability_info(self, surface, x=10, y=85, current_time=0):
+        """Display ability status information from (x, y) down"""
         # Display ability info based on skill tree unlocks
         # Sprint ability
         if self.player.skill_tree.is_skill_unlocked("sprint"):
@@ -103,10 +197,10 @@ class HUD:
                 sprint_status = "Ready"
                 color = (255, 255, 255)  # White when ready
             else:
-                sprint_status = "Cooling Down"
+                sprint_status = self.get_cooldown_status(self.player.attributes.sprint_timer, current_time)
                 color = (255, 165, 0)  # Orange when on cooldown
 
-            sprint_text = self.font.render(f"Sprint: {sprint_status}", True, color)
+            sprint_text = text_cache.render(self.font, f"Sprint: {sprint_status}", True, color)
             surface.blit(sprint_text, (x, y))
             y += 25
 
@@ -119,34 +213,48 @@ class HUD:
                 dash_status = "Ready"
                 color = (255, 255, 255)  # White when ready
             else:
-                dash_status = "Cooling Down"
+                dash_status = self.get_cooldown_status(self.player.attributes.dash_timer, current_time)
                 color = (255, 165, 0)  # Orange when on cooldown
 
-            dash_text = self.font.render(f"Dash: {dash_status}", True, color)
+            dash_text = text_cache.render(self.font, f"Dash: {dash_status}", True, color)
             surface.blit(dash_text, (x, y))
             y += 25
 
         # Extended Sword ability  
         if self.player.skill_tree.is_skill_unlocked("extended_sword"):
-            sword_text = self.font.render(f"Extended Sword: Active", True, self.colors['text'])
+            sword_text = text_cache.render(self.font, f"Extended Sword: Active", True, self.colors['text'])
             surface.blit(sword_text, (x, y))
             y += 25
             
         # Blink ability
         if self.player.skill_tree.is_skill_unlocked("blink"):
-            blink_status = "Ready" if self.player.attributes.blink_timer == 0 else "Cooling Down"
-            blink_color = self.colors['text'] if self.player.attributes.blink_timer == 0 else (255, 165, 0)
-            blink_text = self.font.render(f"Blink: {blink_status}", True, blink_color)
+            if self.player.attributes.blink_timer == 0:
+                blink_status = "Ready"
+                blink_color = self.colors['text']
+            else:
+                blink_status = self.get_cooldown_status(self.player.attributes.blink_timer, current_time)
+                blink_color = (255, 165, 0)
+            blink_text = text_cache.render(self.font, f"Blink: {blink_status}", True, blink_color)
             surface.blit(blink_text, (x, y))
 
-    def display_world_info(self, surface, block_info):
+    def display_world_info(self, surface, block_info, x=None, y=10):
         """Display information about the current world block"""
-        block_text = self.font.render(f"Current: {block_info}", True, self.colors['text'])
-        surface.blit(block_text, (self.screen_width - 150, 10))
+        if x is None:
+            x = self.screen_width - 150
+        block_text = text_cache.render(self.font, f"Current: {block_info}", True, self.colors['text'])
+        surface.blit(block_text, (x, y))
 
     def display_controls(self, surface):
         """Display game controls"""
         controls_y = self.screen_height - 165  # Adjusted to fit the new control line
+        
+        # The list never changes: render it into one surface on the first frame
+        if self.controls_surface is None:
+            self.controls_surface = self.render_controls()
+        surface.blit(self.controls_surface, (10, controls_y))
+
+    def render_controls(self):
+        """Render the controls list into a single transparent surface"""
         controls_text = [
             "Controls:",
             "WASD or Arrow Keys: Move",
@@ -161,9 +269,14 @@ class HUD:
             "ENTER: Character Screen"
         ]
         
-        for i, text in enumerate(controls_text):
-            text_surface = self.font.render(text, True, self.colors['text'])
-            surface.blit(text_surface, (10, controls_y + i * 15))
+        text_surfaces = [text_cache.render(self.font, text, True, self.colors['text']) for text in controls_text]
+        width = max(text_surface.get_width() for text_surface in text_surfaces)
+        height = (len(text_surfaces) - 1) * 15 + text_surfaces[-1].get_height()
+        
+        controls_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, text_surface in enumerate(text_surfaces):
+            controls_surface.blit(text_surface, (0, i * 15))
+        return controls_surface
 
     def draw_transition_effect(self, surface, fade_surface, fade_alpha, transition_direction):
         """Draw transition effect between blocks"""
@@ -173,7 +286,7 @@ class HUD:
         
         # Show transition text during fade
         if fade_alpha > 50 and transition_direction:
-            direction_text = self.font.render(f"Moving {transition_direction.upper()}", True, self.colors['text'])
+            direction_text = text_cache.render(self.font, f"Moving {transition_direction.upper()}", True, self.colors['text'])
             text_rect = direction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             surface.blit(direction_text, text_rect)
 
@@ -212,25 +325,45 @@ class HUD:
                 }.get(difficulty, (255, 255, 255))
 
                 text = f"{name} (Lvl {level}, {difficulty}) HP {current_health}/{max_health} ATK {attack} DEF {defense} SPEED: {speed} State: {state}"
-                debug_surface = self.font.render(text, True, color)
+                debug_surface = text_cache.render(self.font, text, True, color)
                 surface.blit(debug_surface, (x, y))
                 y += line_gap
 
         if not any_found:
-            no_data_text = self.font.render("No enemy debug info available.", True, (255, 255, 0))
+            no_data_text = text_cache.render(self.font, "No enemy debug info available.", True, (255, 255, 0))
             surface.blit(no_data_text, (x, y))
 
+    def display_dirty_stats(self, surface, stats):
+        """Display the dirty-rect coverage of the last frame"""
+        stats_text = text_cache.render(
+            self.small_font, f"Dirty: {stats['coverage']:.0%} ({stats['rects']} rects)", True, self.colors['text'])
+        surface.blit(stats_text, (self.screen_width - 150, 30))
+
+    def get_draw_rects(self, show_enemy_debug=False):
+        """
+        Get the screen areas the HUD draws to (for dirty-rect rendering)
+
+        Returns:
+            List of Rects covering the status bars, abilities, world info and controls
+        """
+        rects = [
+            self.panel_rects['status'],
+            self.panel_rects['abilities'],
+            pygame.Rect(self.screen_width - 150, 10, 150, 40),     # World info / dirty stats
+        ]
+        if self.controls_surface:
+            rects.append(self.controls_surface.get_rect(topleft=(10, self.screen_height - 165)))
+        if show_enemy_debug:
+            rects.append(pygame.Rect(self.screen_width - 450, 40, 450, self.screen_height - 40))
+        return rects
+
     def draw(self, surface, game_world, fade_surface=None, fade_alpha=0, transition_direction=None, transition_in_progress=False, entities=None, show_enemy_debug=False):
         """Draw all HUD elements"""
-        # Draw status bars
-        self.draw_status_bars(surface)
-        
-        # Display ability info (moved to separate area)
-        self.render_ability_info(surface)
-        
-        # Display world info
-        block_info = game_world.get_block_description()
-        self.display_world_info(surface, block_info)
+        # Status bars, ability info and world info are cached panels,
+        # re-rendered only after the attributes or block they show change
+        self.set_world(game_world)
+        self.update_panels()
+        surface.blits(list(self.panels.values()), doreturn=False)
         
         # Display controls
         self.display_controls(surface)
@@ -1,12 +1,13 @@
 import pygame
 from typing import Dict, List, Optional, Type
+from items.item_registry import item_registry
 
 class Inventory:
     """Manages the player's collected items"""
     
     def __init__(self, max_slots=24):
         self.max_slots = max_slots
-        self.items = []  # List of items
+        self.items = []  # List of ItemType records (shared per item class)
         self.item_counts = {}  # Dictionary to track quantities of stackable items
     
     def add_item(self, item) -> bool:
@@ -14,11 +15,14 @@ class Inventory:
         Add an item to the inventory
         
         Args:
-            item: The item object to add
+            item: The item object (or its ItemType record) to add
             
         Returns:
             bool: True if successfully added, False if inventory is full
         """
+        # Store the shared type record, not the world instance
+        item = item_registry.get_type_for(item)
+        
         # Check if inventory is full
         if len(self.items) >= self.max_slots and item.name not in self.item_counts:
             print(f"Inventory full, cannot add {item.name}")
@@ -1,8 +1,12 @@
 import pygame
 import math
 from items.item import Item
+from items.item_registry import item_registry
+from asset_cache import asset_cache
 
 class AncientScroll(Item):
+    ICON_PADDING = 2
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.name = "Ancient Scroll"
@@ -26,29 +30,32 @@ class AncientScroll(Item):
         self.glow_speed = 0.02
         self.glow_intensity = 0
         
-        # Try to load the scroll sprite
+        # Shared sprite, loaded once for every scroll
+        self.sprite = item_registry.get_sprite(AncientScroll, self.load_sprite)
+    
+    def load_sprite(self):
+        """Load the scroll sprite"""
         try:
-            self.sprite = pygame.image.load('assets/ancient_scroll.png').convert_alpha()
-            # Scale the sprite to match the desired dimensions
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-            print("Ancient scroll sprite loaded successfully")
+            # Shared, pre-scaled sprite from the asset cache
+            return asset_cache.get_image('assets/ancient_scroll.png', (self.width, self.height))
         except Exception as e:
             print(f"Error loading ancient scroll sprite: {e}")
             # Create a scroll placeholder
-            self.sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             
             # Draw a scroll shape
             scroll_color = (220, 190, 120)  # Parchment color
-            pygame.draw.rect(self.sprite, scroll_color, (5, 5, 30, 30), border_radius=2)
+            pygame.draw.rect(sprite, scroll_color, (5, 5, 30, 30), border_radius=2)
             
             # Draw scroll edges
             edge_color = (180, 140, 80)  # Darker edge color
-            pygame.draw.rect(self.sprite, edge_color, (3, 3, 34, 34), 2, border_radius=3)
+            pygame.draw.rect(sprite, edge_color, (3, 3, 34, 34), 2, border_radius=3)
             
             # Draw some text lines
             line_color = (60, 40, 20)  # Dark text color
             for i in range(5):
-                pygame.draw.line(self.sprite, line_color, (10, 10 + i*5), (30, 10 + i*5), 1)
+                pygame.draw.line(sprite, line_color, (10, 10 + i*5), (30, 10 + i*5), 1)
+            return sprite
     
     def update(self, player=None):
         """Update scroll animation and check for collection"""
@@ -100,18 +107,6 @@ class AncientScroll(Item):
             # Then draw the scroll on top
             surface.blit(self.sprite, (self.x, self.y + self.bob_offset))
     
-    def get_icon(self):
-        """Get a display icon for inventory"""
-        icon_size = 40
-        icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-        
-        # Scale the sprite to fit the icon
-        temp = pygame.transform.scale(self.sprite, (icon_size - 4, icon_size - 4))
-        # Center the sprite in the icon
-        icon.blit(temp, (2, 2))
-        
-        return icon
-    
     def collect(self, player):
         """Collect the scroll and immediately activate its effect"""
         # If already collected, don't do anything
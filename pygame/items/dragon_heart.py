@@ -2,8 +2,13 @@ import pygame
 import math
 import random
 from items.item import Item
+from items.item_registry import item_registry
+from asset_cache import asset_cache
+from particle_sprites import particle_sprites
 
 class DragonHeart(Item):
+    ICON_PADDING = 3
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.name = "Dragon Heart"
@@ -31,30 +36,33 @@ class DragonHeart(Item):
         self.particles = []
         self.particle_timer = 0
         
-        # Try to load the heart sprite
+        # Shared sprite, loaded once for every heart
+        self.sprite = item_registry.get_sprite(DragonHeart, self.load_sprite)
+    
+    def load_sprite(self):
+        """Load the heart sprite"""
         try:
-            self.sprite = pygame.image.load('assets/dragon_heart.png').convert_alpha()
-            # Scale the sprite to match the desired dimensions
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-            print("Dragon heart sprite loaded successfully")
+            # Shared, pre-scaled sprite from the asset cache
+            return asset_cache.get_image('assets/dragon_heart.png', (self.width, self.height))
         except Exception as e:
             print(f"Error loading dragon heart sprite: {e}")
             # Create a heart placeholder
-            self.sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             
             # Draw a heart shape
             heart_color = (200, 30, 30)  # Deep red
             
             # Draw two circles for the top of the heart
-            pygame.draw.circle(self.sprite, heart_color, (10, 15), 8)
-            pygame.draw.circle(self.sprite, heart_color, (26, 15), 8)
+            pygame.draw.circle(sprite, heart_color, (10, 15), 8)
+            pygame.draw.circle(sprite, heart_color, (26, 15), 8)
             
             # Draw a triangle for the bottom of the heart
             points = [(4, 18), (self.width//2, 32), (self.width-4, 18)]
-            pygame.draw.polygon(self.sprite, heart_color, points)
+            pygame.draw.polygon(sprite, heart_color, points)
             
             # Add a highlight
-            pygame.draw.circle(self.sprite, (250, 100, 100), (12, 12), 3)
+            pygame.draw.circle(sprite, (250, 100, 100), (12, 12), 3)
+            return sprite
     
     def update(self, player=None):
         """Update heart animation, particles and check for collection"""
@@ -136,15 +144,15 @@ class DragonHeart(Item):
         """Draw the heart with beat animation and particles"""
         if not self.collected:
             # Draw particles below the heart
+            blits = []
             for particle in self.particles:
                 # Calculate fade based on remaining life
                 alpha = int(particle['color'][3] * (particle['life'] / particle['max_life']))
-                color = (particle['color'][0], particle['color'][1], particle['color'][2], alpha)
                 
-                # Draw circle particle
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color, (particle['size'], particle['size']), particle['size'])
-                surface.blit(particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size']))
+                # Shared circle sprite for this size, colour and fade
+                particle_surface = particle_sprites.get_circle(particle['size'], particle['color'][:3], alpha)
+                blits.append((particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size'])))
+            surface.blits(blits, doreturn=False)
             
             # Draw the heart with beat effect
             if hasattr(self, 'sprite') and self.sprite.get_width() > 1:
@@ -162,18 +170,6 @@ class DragonHeart(Item):
                 # Draw with bobbing and scaled for heartbeat
                 surface.blit(scaled_sprite, (self.x - x_offset, self.y + self.bob_offset - y_offset))
     
-    def get_icon(self):
-        """Get a display icon for inventory"""
-        icon_size = 40
-        icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-        
-        # Scale the sprite to fit the icon
-        temp = pygame.transform.scale(self.sprite, (icon_size - 6, icon_size - 6))
-        # Center the sprite in the icon
-        icon.blit(temp, (3, 3))
-        
-        return icon
-    
     def collect(self, player):
         """Collect the heart and immediately activate its effect"""
         # If already collected, don't do anything
@@ -1,7 +1,11 @@
 import pygame
 from items.item import Item
+from items.item_registry import item_registry
+from asset_cache import asset_cache
 
 class HealthPotion(Item):
+    ICON_PADDING = 4
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.name = "Health Potion"
@@ -11,32 +15,31 @@ class HealthPotion(Item):
         
         # Rotation properties
         self.rotation_angle = -45  # 45 degrees counter-clockwise
-        self.original_sprite = None
         
-        # Try to load the health potion sprite
+        # Shared sprites: loaded and rotated once for every potion
+        self.original_sprite = item_registry.get_sprite(HealthPotion, self.load_sprite)
+        self.sprite = item_registry.get_sprite(
+            HealthPotion, lambda: pygame.transform.rotate(self.original_sprite, self.rotation_angle), 'rotated')
+    
+    def load_sprite(self):
+        """Load the upright potion sprite"""
         try:
-            self.original_sprite = pygame.image.load('assets/health-potion.png').convert_alpha()
-            # Scale the sprite to match the desired dimensions
-            self.original_sprite = pygame.transform.scale(self.original_sprite, (self.width, self.height))
-            # Rotate the sprite
-            self.sprite = pygame.transform.rotate(self.original_sprite, self.rotation_angle)
-            print("Health potion sprite loaded successfully")
+            # Shared, pre-scaled sprite from the asset cache
+            return asset_cache.get_image('assets/health-potion.png', (self.width, self.height))
         except Exception as e:
             print(f"Error loading health potion sprite: {e}")
             # Create a red potion placeholder
-            self.original_sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            original_sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             
             # Draw a potion bottle shape
             bottle_color = (220, 50, 50)  # Red for health
-            pygame.draw.rect(self.original_sprite, bottle_color, (8, 12, 16, 16))  # Bottle body
-            pygame.draw.rect(self.original_sprite, bottle_color, (10, 6, 12, 6))   # Bottle neck
-            pygame.draw.rect(self.original_sprite, (150, 150, 150), (11, 4, 10, 2)) # Bottle cap
+            pygame.draw.rect(original_sprite, bottle_color, (8, 12, 16, 16))  # Bottle body
+            pygame.draw.rect(original_sprite, bottle_color, (10, 6, 12, 6))   # Bottle neck
+            pygame.draw.rect(original_sprite, (150, 150, 150), (11, 4, 10, 2)) # Bottle cap
             
             # Add a shine effect
-            pygame.draw.circle(self.original_sprite, (250, 200, 200), (12, 15), 2)
-            
-            # Rotate the placeholder sprite
-            self.sprite = pygame.transform.rotate(self.original_sprite, self.rotation_angle)
+            pygame.draw.circle(original_sprite, (250, 200, 200), (12, 15), 2)
+            return original_sprite
     
     def draw(self, surface):
         """Draw the rotated potion with bobbing animation"""
@@ -48,22 +51,9 @@ class HealthPotion(Item):
             # Draw with bobbing animation effect and adjusted position for rotation
             surface.blit(self.sprite, (self.x - offset_x, self.y + self.bob_offset - offset_y))
     
-    def get_icon(self):
-        """Get a display icon for inventory"""
-        # For potions, use the non-rotated version as the icon
-        icon_size = 40
-        icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-        
-        # Scale the original (non-rotated) sprite
-        if self.original_sprite:
-            temp = pygame.transform.scale(self.original_sprite, (icon_size - 8, icon_size - 8))
-            # Center the sprite in the icon
-            icon.blit(temp, (4, 4))
-        else:
-            # Fallback if somehow original sprite is missing
-            icon.fill((220, 50, 50))
-        
-        return icon
+    def get_icon_sprite(self):
+        """For potions, use the non-rotated version as the icon"""
+        return self.original_sprite
         
     def use(self, player):
         """Use the potion to heal the player"""
@@ -1,8 +1,14 @@
 import pygame
 import math
+from items.item_registry import item_registry
+from renderer import get_particle_bounds
 
 
 class Item:
+    ICON_SIZE = 40
+    ICON_PADDING = 0  # Transparent border around the sprite in the inventory icon
+    DRAW_MARGIN = 8   # Room for glows and beat scaling around the sprite
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -24,8 +30,7 @@ class Item:
         
         # The base Item class doesn't load an image
         # Subclasses should implement their own sprites
-        self.sprite = pygame.Surface((self.width, self.height))
-        self.sprite.fill((200, 200, 200))  # Default gray placeholder
+        self.sprite = item_registry.get_sprite(Item, self.create_placeholder_sprite)
         
         self.pickup_rect = pygame.Rect(
             self.x,           # Start at the same X as the sprite
@@ -34,6 +39,12 @@ class Item:
             self.height       # Full height of the sprite
         )
    
+    def create_placeholder_sprite(self):
+        """Default gray placeholder sprite"""
+        sprite = pygame.Surface((self.width, self.height))
+        sprite.fill((200, 200, 200))
+        return sprite
+    
     def get_rect(self):
         """Return the collision rectangle for pickup"""
         # Update pickup rect to current position with bobbing
@@ -41,6 +52,18 @@ class Item:
         self.pickup_rect.y = self.y + self.bob_offset
         return self.pickup_rect
 
+    def get_draw_rect(self):
+        """Return the area the item draws to (its bobbing sprite, centered or not, plus effects)"""
+        top = self.y + self.bob_offset
+        rect = self.sprite.get_rect(topleft=(self.x, top))
+        rect.union_ip(self.sprite.get_rect(center=(self.x + self.width // 2, top + self.height // 2)))
+        rect.inflate_ip(self.DRAW_MARGIN * 2, self.DRAW_MARGIN * 2)
+        
+        particles = getattr(self, 'particles', None)
+        if particles:
+            rect.union_ip(get_particle_bounds(particles))
+        return rect
+
     def update(self, player=None):
         # Update bobbing animation
         self.bob_counter += self.bob_speed
@@ -85,18 +108,25 @@ class Item:
         """Base use method - to be implemented by subclasses"""
         pass
         
-    def get_icon(self):
-        """Get a display icon for inventory
+    def get_icon_sprite(self):
+        """Get the sprite the inventory icon is made from"""
+        return self.sprite
+    
+    def build_icon(self):
+        """Render the inventory icon (called once per item type by the registry)
         
         Returns:
             Surface: A scaled copy of the sprite to use as an icon
         """
-        # Default is to return a copy of the sprite at the correct size
-        icon_size = 40
-        icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
+        icon = pygame.Surface((self.ICON_SIZE, self.ICON_SIZE), pygame.SRCALPHA)
         
-        # Create a scaled copy of the sprite
-        temp = pygame.transform.scale(self.sprite, (icon_size, icon_size))
-        icon.blit(temp, (0, 0))
+        # Scale the sprite to fit the icon, centered inside the padding
+        inner_size = self.ICON_SIZE - self.ICON_PADDING * 2
+        temp = pygame.transform.scale(self.get_icon_sprite(), (inner_size, inner_size))
+        icon.blit(temp, (self.ICON_PADDING, self.ICON_PADDING))
         
-        return icon
\ No newline at end of file
+        return icon
+        
+    def get_icon(self):
+        """Get the shared display icon for inventory"""
+        return item_registry.get_type_for(self).get_icon()
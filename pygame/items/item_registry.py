@@ -0,0 +1,100 @@
+class ItemType:
+    """
+    Compact record for one kind of item.
+
+    Inventories and saves hold these instead of item instances: every
+    potion in a stack shares the same record, and its icon is rendered once.
+    """
+    def __init__(self, item_class, prototype):
+        self.type_name = item_class.__name__
+        self.item_class = item_class
+        self.name = prototype.name
+        self.description = prototype.description
+        self.stackable = prototype.stackable
+        self.one_time_use = getattr(prototype, 'one_time_use', False)
+        self.icon = prototype.build_icon()
+
+        # Kept only to run the class's use() logic (e.g. heal_amount)
+        self.prototype = prototype
+
+    def get_icon(self):
+        """Get the shared inventory icon"""
+        return self.icon
+
+    def use(self, player):
+        """Use an item of this type (same return values as Item.use)"""
+        return self.prototype.use(player)
+
+
+class ItemRegistry:
+    """Owns the sprites, icons and type records shared by every item of a class"""
+    def __init__(self):
+        # One record per item class
+        # Format: {type_name: ItemType}
+        self.types = {}
+
+        # World sprites built once per item class
+        # Format: {(type_name, variant): Surface}
+        self.sprites = {}
+
+        self.item_classes_loaded = False
+
+    def get_sprite(self, item_class, build_sprite, variant='world'):
+        """
+        Get a shared sprite for an item class, building it on first use
+
+        Args:
+            item_class: The Item subclass the sprite belongs to
+            build_sprite: Function returning the Surface when it is not built yet
+            variant: Name of the sprite when a class has several (e.g. 'rotated')
+
+        Returns:
+            Surface shared by every instance of the class
+        """
+        key = (item_class.__name__, variant)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = build_sprite()
+            self.sprites[key] = sprite
+        return sprite
+
+    def register(self, item_class):
+        """Build the type record for an item class (once)"""
+        type_name = item_class.__name__
+        if type_name not in self.types:
+            self.types[type_name] = ItemType(item_class, item_class(0, 0))
+        return self.types[type_name]
+
+    def load_item_classes(self):
+        """Register every item class a save file can refer to"""
+        if self.item_classes_loaded:
+            return
+        self.item_classes_loaded = True
+
+        from items.health_potion import HealthPotion
+        from items.ancient_scroll import AncientScroll
+        from items.dragon_heart import DragonHeart
+
+        for item_class in (HealthPotion, AncientScroll, DragonHeart):
+            self.register(item_class)
+
+    def get_type(self, type_name):
+        """
+        Look up an item type by class name (as written in save files)
+
+        Returns:
+            ItemType, or None for an unknown name
+        """
+        if type_name not in self.types:
+            self.load_item_classes()
+        return self.types.get(type_name)
+
+    def get_type_for(self, item):
+        """Get the type record for an item instance (records are returned as is)"""
+        if isinstance(item, ItemType):
+            return item
+        return self.register(type(item))
+
+
+# Singleton instance
+item_registry = ItemRegistry()
@@ -0,0 +1,163 @@
+import pygame
+import threading
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from asset_cache import asset_cache
+
+
+def get_preload_steps(include_atlas=True):
+    """
+    Get the asset preload steps, in order
+
+    Each step creates one of an entity so its shared sprite bank is built
+    through the asset cache, exactly as it would be on first encounter.
+    The steps only decode images, so they can run on the worker thread.
+
+    Args:
+        include_atlas: Start by registering the pre-built texture atlas
+
+    Returns:
+        List of (label, function) tuples
+    """
+    def load_atlas():
+        asset_cache.load_atlas()
+
+    def load_player():
+        from entities.player.player import Player
+        Player(0, 0, "link")
+        Player(0, 0, "ark")
+
+    def load_npcs():
+        from entities.npc.link import Link
+        Link(0, 0)
+
+    def load_skeletons():
+        from entities.enemy.skeleton import Skeleton
+        Skeleton(0, 0)
+
+    def load_slimes():
+        from entities.enemy.slime import Slime
+        Slime(0, 0)
+
+    def load_world_objects():
+        from entities.bonfire import Bonfire
+        from entities.grass import Grass
+        from entities.rock import Rock
+        from entities.soul import Soul
+        Bonfire(0, 0)
+        Soul(0, 0)
+
+        # Grass and rocks pick a random variant, so request every variant directly
+        grass = Grass(0, 0)
+        for choice in Grass.sprite_choices:
+            asset_cache.get_image(f'assets/bush/{choice}', (grass.width, grass.height))
+        rock = Rock(0, 0)
+        for choice in Rock.sprite_choices:
+            asset_cache.get_image(f'assets/rock/{choice}', (rock.width, rock.height))
+
+        # Ground tiles sliced from the world tileset
+        from ground import ground_renderer
+        ground_renderer.load_tiles()
+
+    def load_items():
+        # Builds each item type's shared sprites and inventory icon
+        from items.item_registry import item_registry
+        item_registry.load_item_classes()
+
+    steps = [
+        ("Heroes", load_player),
+        ("Villagers", load_npcs),
+        ("Skeletons", load_skeletons),
+        ("Slimes", load_slimes),
+        ("World", load_world_objects),
+        ("Items", load_items),
+    ]
+    if include_atlas:
+        steps.insert(0, ("Texture atlas", load_atlas))
+    return steps
+
+
+class LoadingScreen:
+    """
+    Warms the asset cache on a worker thread while the main thread draws progress.
+
+    Fonts are resolved on the main thread before the worker starts: SDL_ttf
+    and pygame's system font table aren't thread-safe, and the main thread
+    renders the progress label while the worker runs.
+
+    Gameplay should only start once is_done() returns True, so the first
+    encounter with any enemy type never has to load sprites mid-game.
+    """
+    def __init__(self):
+        # Default font: available immediately, no system font lookup needed
+        self.title_font = pygame.font.Font(None, 72)
+        self.label_font = pygame.font.Font(None, 32)
+
+        self.steps = get_preload_steps()
+        self.total_steps = len(self.steps) + 1  # The fonts count as one step
+        self.completed_steps = 0
+        self.current_label = ""
+        self.done = False
+        self.thread = None
+
+        # Progress bar layout
+        self.bar_width = 600
+        self.bar_height = 24
+        self.bar_rect = pygame.Rect((SCREEN_WIDTH - self.bar_width) // 2, SCREEN_HEIGHT // 2,
+                                    self.bar_width, self.bar_height)
+
+        self.title_text = self.title_font.render("The Dark Garden of Z", True, (255, 255, 255))
+
+    def start(self):
+        """Resolve the fonts, then start preloading images on a worker thread"""
+        self.load_fonts()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def load_fonts(self):
+        """Resolve every UI font once (main thread); screens built later reuse them"""
+        from font_manager import font_manager, GAME_FONTS
+        self.current_label = "Fonts"
+        font_manager.preload(GAME_FONTS)
+        self.completed_steps += 1
+
+    def run(self):
+        """Run every preload step (worker thread)"""
+        for label, step in self.steps:
+            self.current_label = label
+            try:
+                step()
+            except Exception as e:
+                # A missing asset falls back to its placeholder later on
+                print(f"Error preloading {label}: {e}")
+            self.completed_steps += 1
+
+        stats = asset_cache.get_stats()
+        print(f"DEBUG: Preload finished ({stats['loads']} image loads, {stats['entries']} cached entries)")
+        self.done = True
+
+    def is_done(self):
+        """Check if every asset has been preloaded"""
+        return self.done
+
+    def get_progress(self):
+        """Get preload progress from 0.0 to 1.0"""
+        return self.completed_steps / self.total_steps
+
+    def draw(self, surface):
+        """Draw the loading screen with a progress bar"""
+        surface.fill((0, 0, 0))
+
+        title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
+        surface.blit(self.title_text, title_rect)
+
+        # Progress bar outline and fill
+        pygame.draw.rect(surface, (60, 60, 60), self.bar_rect)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_width * self.get_progress())
+        pygame.draw.rect(surface, (0, 160, 160), fill_rect)
+        pygame.draw.rect(surface, (200, 200, 200), self.bar_rect, 2)
+
+        label = f"Loading {self.current_label}..." if not self.done else "Ready"
+        label_text = self.label_font.render(label, True, (200, 200, 200))
+        label_rect = label_text.get_rect(center=(SCREEN_WIDTH // 2, self.bar_rect.bottom + 30))
+        surface.blit(label_text, label_rect)
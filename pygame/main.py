@@ -16,9 +16,14 @@ from hud import HUD
 from dialog import Dialog, FileDialog
 from dialog import SaveOverwriteDialog
 from save_manager import SaveManager
+from loading_screen import LoadingScreen
+from font_manager import font_manager
+from renderer import dirty_rect_renderer
+from particle_engine import particle_engine
+from scene_stack import Scene, SceneStack
 
 
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GREEN, DESERT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DESERT
 
 # Set working directory to script location
 abspath = os.path.abspath(__file__)
@@ -27,7 +32,7 @@ os.chdir(dname)
 
 # Initialize pygame
 pygame.init()
-font = pygame.font.SysFont(None, 24)
+font = font_manager.get_font(24, face=None)
 
 # Create the game window
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -113,17 +118,8 @@ def cast_firebolt(current_time):
     return False
 
 def should_update_gameplay():
-    """Determine if gameplay should be updated based on UI state."""
-    return (
-        not (transition_in_progress and fading_in) and
-        not game_map.is_visible() and 
-        not character_screen.is_visible() and 
-        not death_screen.is_active() and 
-        not save_load_dialog.is_visible() and 
-        not file_dialog.is_visible() and 
-        not message_dialog.is_visible() and 
-        not save_overwrite_dialog.is_visible()
-    )
+    """Determine if gameplay should be updated: no modal scene open and not fading out of a block."""
+    return not (transition_in_progress and fading_in) and scene_stack.is_empty()
 
 # Game state variables
 player = None
@@ -165,6 +161,8 @@ def initialize_game():
 
     player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     game_world = World()
+    if particle_engine:
+        particle_engine.clear()
     initial_block = game_world.generate_block(0, 0)
     set_bonfire_callback()
     game_world.place_special_items("ancient_scroll", [-4, 3])
@@ -198,8 +196,10 @@ def on_save_overwrite(saved_path):
 
 def restart_game():
     """Restart the game by reinitializing everything"""
+    start_time = pygame.time.get_ticks()
     initialize_game()
-    print("Game restarted!")
+    print(f"Game restarted! ({pygame.time.get_ticks() - start_time} ms, "
+          f"{font_manager.lookups} font lookups this session)")
 
 def start_transition(direction):
     """Start a transition effect when moving between blocks"""
@@ -253,7 +253,7 @@ def show_load_dialog():
 
 def on_file_selected(file_index, files):
     """Handle save file selection"""
-    global file_dialog, save_manager, death_screen
+    global file_dialog, save_manager, death_screen, game_hud
     
     file_dialog.hide()
     
@@ -270,6 +270,10 @@ def on_file_selected(file_index, files):
         # Deactivate the death screen if it's active
         if death_screen.is_active():
             death_screen.active = False
+        # The HUD shows unlocked skills, which loading sets directly
+        game_hud.invalidate()
+        # Whatever is shown over gameplay now sits on the loaded world
+        scene_stack.invalidate_backdrop()
         show_message(f"Game loaded from {files[file_index]}")
     else:
         show_message("Failed to load game")
@@ -302,6 +306,186 @@ def set_bonfire_callback():
     if not bonfire_found:
         print("WARNING: Could not find origin bonfire to set callback")
 
+def handle_gameplay_event(event, current_time):
+    """Handle keyboard and controller input while no modal scene is open"""
+    global show_enemy_debug
+    
+    # Handle keyboard inputs
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_SPACE:
+            player.start_swing()
+        elif event.key == pygame.K_e:
+            check_entity_interaction(player)
+        elif event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS or event.key == pygame.K_EQUALS:
+            player.gain_xp(50)
+        elif event.key == pygame.K_m:
+            game_map.toggle()
+        elif event.key == pygame.K_RETURN:
+            character_screen.toggle()
+        elif event.key == pygame.K_F3:
+            show_enemy_debug = not show_enemy_debug
+            print(f"Enemy debug info: {'ON' if show_enemy_debug else 'OFF'}")
+        elif event.key == pygame.K_F4:
+            dirty_rect_renderer.toggle()
+        elif event.key == pygame.K_F5:
+            if particle_engine:
+                particle_engine.cycle_quality()
+    
+    # Handle controller inputs
+    elif event.type == pygame.JOYBUTTONDOWN:
+        if event.button == 2:  # Attack
+            player.start_swing()
+        elif event.button == 0:  # Interact
+            check_entity_interaction(player)
+        elif event.button == 7:  # Character screen
+            character_screen.toggle()
+        elif event.button == 6:  # Map toggle
+            game_map.toggle()
+        elif event.button == 1 and player.skill_tree.is_skill_unlocked("blink"):  # Blink
+            obstacles = game_world.get_current_entities()
+            player.blink(obstacles, current_time)
+        elif event.button == 3:  # Firebolt - Added this button for casting firebolt
+            cast_firebolt(current_time)
+
+def handle_map_event(event):
+    """Close the map with M/LB, otherwise zoom and pan it"""
+    if ((event.type == pygame.KEYDOWN and event.key == pygame.K_m) or
+            (event.type == pygame.JOYBUTTONDOWN and event.button == 6)):
+        game_map.toggle()
+        return True
+    return game_map.handle_event(event)
+
+def handle_character_screen_event(event):
+    """Close the character screen with ENTER/START, otherwise pass the event on"""
+    if ((event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN) or
+            (event.type == pygame.JOYBUTTONDOWN and event.button == 7)):
+        character_screen.toggle()
+        return True
+    return character_screen.handle_event(event)
+
+def handle_death_screen_event(event):
+    """Restart or open the load dialog from the death screen"""
+    result = death_screen.handle_event(event)
+    if result == "restart":
+        restart_game()
+    elif result == "load":
+        # Keep the death screen active until a game is successfully loaded
+        show_load_dialog()
+    return bool(result)
+
+def draw_gameplay(surface, hud=True):
+    """Draw one gameplay frame: world, entities, effects and (unless hud is False) the HUD"""
+    # Ground, grass, rocks and blood splatters in one blit
+    # (or, in dirty-rect mode, just the parts of it drawn over last frame)
+    background = player.particles.get_decal_layer(game_world.get_static_layer())
+    dirty_rect_renderer.begin_frame(surface, background)
+    
+    # Draw world entities that move or animate
+    for entity in game_world.get_current_dynamic_entities():
+        entity.draw(surface)
+
+    # Draw player
+    player.draw(surface)
+
+    # Draw projectiles
+    for projectile in projectiles:
+        projectile.draw(surface)
+
+    # Draw every engine particle in one blit batch
+    if particle_engine:
+        particle_engine.draw(surface)
+
+    dialog_balloon_system.draw(surface)
+
+    # Draw collision boxes for debugging
+    if show_collision_boxes:
+        for entity in game_world.get_current_entities():
+            rect = entity.get_rect()
+            pygame.draw.rect(surface, (255, 0, 0), rect, 1)
+        
+        player_rect = player.get_rect()
+        pygame.draw.rect(surface, (0, 0, 255), player_rect, 1)
+    
+        for projectile in projectiles:
+            projectile_rect = projectile.rect
+            pygame.draw.rect(surface, (255, 165, 0), projectile_rect, 1)  # Orange color for projectiles
+
+    if dirty_rect_renderer.enabled:
+        # Record everything drawn this frame; unmarked overlays need a full redraw
+        for entity in game_world.get_current_dynamic_entities():
+            dirty_rect_renderer.mark_entity(entity)
+        dirty_rect_renderer.mark_entity(player)
+        for projectile in projectiles:
+            dirty_rect_renderer.mark_entity(projectile)
+        if particle_engine:
+            dirty_rect_renderer.mark(particle_engine.get_draw_rect())
+        for rect in dialog_balloon_system.get_draw_rects():
+            dirty_rect_renderer.mark(rect)
+        for rect in game_hud.get_draw_rects(show_enemy_debug):
+            dirty_rect_renderer.mark(rect)
+
+        if transition_in_progress or show_collision_boxes:
+            dirty_rect_renderer.force_full_redraw()
+
+    if hud:
+        draw_hud(surface)
+
+def draw_hud(surface):
+    """Draw the HUD over the gameplay view (also over the frozen frame under a scene)"""
+    # Draw HUD if not in death screen
+    if not death_screen.is_active():
+        game_hud.draw(
+            surface=surface,
+            game_world=game_world,
+            fade_surface=fade_surface,
+            fade_alpha=fade_alpha,
+            transition_direction=transition_direction,
+            transition_in_progress=transition_in_progress,
+            entities=game_world.get_current_entities(),
+            show_enemy_debug=show_enemy_debug
+        )
+
+    if dirty_rect_renderer.enabled:
+        game_hud.display_dirty_stats(surface, dirty_rect_renderer.get_stats())
+
+# Modal scenes over gameplay. The lambdas look the UI objects up on each call,
+# since restarting or loading the game creates new ones. The frozen frame
+# leaves the HUD out, so potions used from the character screen still show
+scene_stack = SceneStack(lambda surface: draw_gameplay(surface, hud=False), draw_hud)
+scene_stack.register(Scene("map", lambda: game_map.is_visible(), handle_map_event,
+                           lambda surface: game_map.draw(surface),
+                           update=lambda: game_map.update(), opaque=True))
+scene_stack.register(Scene("character_screen", lambda: character_screen.is_visible(), handle_character_screen_event,
+                           lambda surface: character_screen.draw(surface)))
+scene_stack.register(Scene("death_screen", death_screen.is_active, handle_death_screen_event,
+                           lambda surface: death_screen.draw(surface, player)))
+scene_stack.register(Scene("save_load_dialog", lambda: save_load_dialog.is_visible(),
+                           lambda event: save_load_dialog.handle_event(event),
+                           lambda surface: save_load_dialog.draw(surface)))
+scene_stack.register(Scene("file_dialog", lambda: file_dialog.is_visible(),
+                           lambda event: file_dialog.handle_event(event),
+                           lambda surface: file_dialog.draw(surface)))
+scene_stack.register(Scene("message_dialog", lambda: message_dialog.is_visible(),
+                           lambda event: message_dialog.handle_event(event),
+                           lambda surface: message_dialog.draw(surface)))
+scene_stack.register(Scene("save_overwrite_dialog", lambda: save_overwrite_dialog.is_visible(),
+                           lambda event: save_overwrite_dialog.handle_event(event),
+                           lambda surface: save_overwrite_dialog.draw(surface)))
+
+# Preload every asset on a worker thread while showing progress,
+# so no enemy type has to load its sprites mid-game
+loading_screen = LoadingScreen()
+loading_screen.start()
+while not loading_screen.is_done():
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+    
+    loading_screen.draw(screen)
+    pygame.display.flip()
+    clock.tick(FPS)
+
 # Initial game setup
 initialize_game()
 
@@ -309,79 +493,15 @@ initialize_game()
 while running:
     current_time = pygame.time.get_ticks()
     
-    # Process events
+    # Process events: the top modal scene gets them all, otherwise gameplay does
+    scene_stack.sync()
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         
-        # Check dialogs first (they have priority)
-        if save_load_dialog and save_load_dialog.is_visible():
-            if save_load_dialog.handle_event(event):
-                continue
-        
-        if file_dialog and file_dialog.is_visible():
-            if file_dialog.handle_event(event):
-                continue
-        
-        if message_dialog and message_dialog.is_visible():
-            if message_dialog.handle_event(event):
-                continue
-
-        if save_overwrite_dialog and save_overwrite_dialog.is_visible():
-            if save_overwrite_dialog.handle_event(event):
-                continue
-
-        # Handle death screen events
-        if death_screen.is_active():
-            result = death_screen.handle_event(event)
-            if result == "restart":
-                restart_game()
-                continue
-            elif result == "load":
-                # Show the load game dialog when "Load Save" is selected
-                show_load_dialog()
-                # Keep the death screen active until a game is successfully loaded
-                continue
-                
-        # Handle keyboard inputs
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                player.start_swing()
-            elif event.key == pygame.K_e:
-                check_entity_interaction(player)
-            elif event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS or event.key == pygame.K_EQUALS:
-                player.gain_xp(50)
-            elif event.key == pygame.K_m:
-                if not character_screen.is_visible() and not death_screen.is_active():
-                    game_map.toggle()
-            elif event.key == pygame.K_RETURN:
-                if not game_map.is_visible() and not death_screen.is_active():
-                    character_screen.toggle()
-            elif event.key == pygame.K_F3:
-                show_enemy_debug = not show_enemy_debug
-                print(f"Enemy debug info: {'ON' if show_enemy_debug else 'OFF'}")
-        
-        # Handle controller inputs
-        elif event.type == pygame.JOYBUTTONDOWN:
-            if event.button == 2:  # Attack
-                player.start_swing()
-            elif event.button == 0:  # Interact
-                check_entity_interaction(player)
-            elif event.button == 7:  # Character screen
-                if not game_map.is_visible() and not death_screen.is_active():
-                    character_screen.toggle()
-            elif event.button == 6:  # Map toggle
-                if not character_screen.is_visible() and not death_screen.is_active():
-                    game_map.toggle()
-            elif event.button == 1 and player.skill_tree.is_skill_unlocked("blink"):  # Blink
-                obstacles = game_world.get_current_entities()
-                player.blink(obstacles, current_time)
-            elif event.button == 3:  # Firebolt - Added this button for casting firebolt
-                cast_firebolt(current_time)
-        
-        # Handle character screen events
-        if character_screen.is_visible():
-            character_screen.handle_event(event)
+        if not scene_stack.handle_event(event):
+            handle_gameplay_event(event, current_time)
+            scene_stack.sync()
     
     # Handle transition effect
     if transition_in_progress:
@@ -617,6 +737,10 @@ while running:
             if not projectile.alive:
                 projectiles.remove(projectile)
 
+        # Update fire, smoke, XP, blood and death particles in one go
+        if particle_engine:
+            particle_engine.update(current_entities)
+
         # Check sword collisions
         if player.swinging:
             player.check_sword_collisions(current_entities)
@@ -627,95 +751,31 @@ while running:
             if block_changed:
                 transition_direction = direction
                 start_transition(direction)
+                # Effects stay behind in the old block
+                if particle_engine:
+                    particle_engine.clear()
 
     # Check for player death
     if player.attributes.current_health <= 0 and not death_screen.is_active():
         death_screen.activate()
     
-    # Draw the game world
-    if game_map.is_visible() and not death_screen.is_active():
-        # Draw the map screen
-        game_map.draw(screen)
-    elif character_screen.is_visible() and not death_screen.is_active():
-        # Draw the character screen with game background
-        screen.fill(GREEN)
-        
-        # Draw entities and player
-        for entity in game_world.get_current_entities():
-            entity.draw(screen)
-        player.draw(screen)
-        
-        for projectile in projectiles:
-            projectile.draw(screen)
-
-        # Draw character screen overlay
-        character_screen.draw(screen)
+    scene_stack.sync()
+    if scene_stack.is_empty():
+        draw_gameplay(screen)
     else:
-        # Draw normal game screen
-        screen.fill(GREEN)
-        
-        # Draw background blood splatters
-        player.particles.draw_stuck_blood(screen)
-        
-        # Draw world entities
-        for entity in game_world.get_current_entities():
-            entity.draw(screen)
-
-        # Draw player
-        player.draw(screen)
-
-        # Draw projectiles
-        for projectile in projectiles:
-            projectile.draw(screen)
-
-        dialog_balloon_system.draw(screen)
-
-        # Draw collision boxes for debugging
-        if show_collision_boxes:
-            for entity in game_world.get_current_entities():
-                rect = entity.get_rect()
-                pygame.draw.rect(screen, (255, 0, 0), rect, 1)
-            
-            player_rect = player.get_rect()
-            pygame.draw.rect(screen, (0, 0, 255), player_rect, 1)
-        
-            for projectile in projectiles:
-                projectile_rect = projectile.rect
-                pygame.draw.rect(screen, (255, 165, 0), projectile_rect, 1)  # Orange color for projectiles
-
-        # Draw HUD if not in death screen
-        if not death_screen.is_active():
-            game_hud.draw(
-                surface=screen,
-                game_world=game_world,
-                fade_surface=fade_surface,
-                fade_alpha=fade_alpha,
-                transition_direction=transition_direction,
-                transition_in_progress=transition_in_progress,
-                entities=game_world.get_current_entities(),
-                show_enemy_debug=show_enemy_debug
-            )
-
-        # Draw death screen if active
-        if death_screen.is_active():
-            death_screen.draw(screen, player)
-    
-    # Draw dialogs on top if visible
-    if save_load_dialog and save_load_dialog.is_visible():
-        save_load_dialog.draw(screen)
-
-    if file_dialog and file_dialog.is_visible():
-        file_dialog.draw(screen)
-
-    if message_dialog and message_dialog.is_visible():
-        message_dialog.draw(screen)
-
-    if save_overwrite_dialog and save_overwrite_dialog.is_visible():
-        save_overwrite_dialog.draw(screen)
+        # Update the top scene and draw the open scenes over the frozen gameplay frame
+        scene_stack.update()
+        scene_stack.draw(screen)
+        # Menus and overlays cover the whole screen: present all of it
+        dirty_rect_renderer.force_full_redraw()
     
-    # Update display
-    pygame.display.flip()
+    # Update display (only the changed areas in dirty-rect mode)
+    dirty_rect_renderer.present()
     clock.tick(FPS)
 
+    # Shed particles while frames take too long (raw time excludes the frame rate delay)
+    if particle_engine:
+        particle_engine.adjust_budget(clock.get_rawtime())
+
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -1,13 +1,20 @@
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from text_cache import text_cache
+from font_manager import font_manager
+
+MAP_CHUNK_BLOCKS = 16   # Map texture chunks are 16x16 blocks
+ZOOM_LEVELS = 4         # Cell sizes 28, 14, 7 and 3.5 pixels: each level halves the one before
+PAN_SPEED = 12          # Pixels per frame while a pan key is held
+# Screen area the map grid is drawn in
+MAP_VIEWPORT = pygame.Rect(SCREEN_WIDTH // 2 - 600, 90, 1200, 840)
 
 class Map:
     def __init__(self, world):
         """Initialize the map with a reference to the world"""
         self.world = world
         self.visible = False
-        self.cell_size = 28  # Reduced cell size to fit more cells on screen
-        self.grid_size = 20  # Increased to 20x20 grid
+        self.cell_size = 28  # Cell size at full zoom
         self.colors = {
             'background': (20, 20, 40),
             'grid': (60, 60, 80),
@@ -17,147 +24,248 @@ class Map:
             'player': (230, 230, 50),    # Player marker (yellow)
             'text': (220, 220, 220)
         }
-        
+
         # Font for labels
-        self.font = pygame.font.SysFont('Arial', 14)
-        self.title_font = pygame.font.SysFont('Arial', 24)
-    
+        self.font = font_manager.get_font(14)
+        self.title_font = font_manager.get_font(24)
+
+        # Map texture: every known block painted once into its chunk, at every
+        # zoom level (each level is the one above it halved)
+        # Format: {(chunk_x, chunk_y): [Surface per zoom level]}
+        self.chunks = {}
+
+        # View: zoom level and the block coordinates at the center of the viewport
+        self.zoom = 0
+        self.view_x = 0.0
+        self.view_y = 0.0
+        self.dragging = False
+
+        # Paint blocks as they're created or visited, not when the map is drawn
+        self.world.add_block_update_listener(self.on_block_updated)
+        # Loading a save replaces every block
+        self.world.add_blocks_reset_listener(self.repaint)
+        self.repaint()
+
     def toggle(self):
         """Toggle map visibility"""
         self.visible = not self.visible
+        if self.visible:
+            self.center_on_player()
         return self.visible
-    
+
     def is_visible(self):
         """Check if map is currently visible"""
         return self.visible
-    
+
+    def center_on_player(self):
+        """Center the view on the current block"""
+        self.view_x, self.view_y = self.world.current_block_coords
+
+    def get_cell_size(self):
+        """Get the size of a block on screen at the current zoom level"""
+        return self.cell_size / (2 ** self.zoom)
+
+    def set_zoom(self, zoom):
+        """Change the zoom level (0 is the closest), keeping the view centered"""
+        self.zoom = max(0, min(ZOOM_LEVELS - 1, zoom))
+
+    def pan(self, dx, dy):
+        """Move the view by a number of screen pixels"""
+        cell_size = self.get_cell_size()
+        self.view_x += dx / cell_size
+        self.view_y += dy / cell_size
+
+    def on_block_updated(self, block):
+        """Paint a block that was just created or visited"""
+        self.paint_block(block)
+
+    def repaint(self):
+        """Repaint the whole texture from the world's blocks"""
+        self.chunks.clear()
+        for block in self.world.blocks.values():
+            self.paint_block(block)
+
+    def paint_block(self, block):
+        """Paint one block's cell into its chunk, then shrink it into the smaller zoom levels"""
+        chunk_key = (block.x_coord // MAP_CHUNK_BLOCKS, block.y_coord // MAP_CHUNK_BLOCKS)
+        levels = self.chunks.get(chunk_key)
+        if levels is None:
+            chunk_pixels = MAP_CHUNK_BLOCKS * self.cell_size
+            levels = [pygame.Surface((chunk_pixels >> level, chunk_pixels >> level), pygame.SRCALPHA)
+                      for level in range(ZOOM_LEVELS)]
+            self.chunks[chunk_key] = levels
+
+        cell_rect = pygame.Rect(
+            (block.x_coord % MAP_CHUNK_BLOCKS) * self.cell_size,
+            (block.y_coord % MAP_CHUNK_BLOCKS) * self.cell_size,
+            self.cell_size,
+            self.cell_size
+        )
+        color = self.colors['visited'] if block.is_visited() else self.colors['unexplored']
+
+        # Draw filled cell with border
+        chunk = levels[0]
+        pygame.draw.rect(chunk, color, cell_rect)
+        pygame.draw.rect(chunk, self.colors['grid'], cell_rect, 1)
+
+        # Draw coordinates in the cell if cell is large enough
+        text_surf = text_cache.render(self.font, f"({block.x_coord},{block.y_coord})", True, self.colors['text'])
+        if text_surf.get_width() < self.cell_size - 4:
+            chunk.blit(text_surf, text_surf.get_rect(center=cell_rect.center))
+
+        # Halve the changed area into each smaller level, widened to even pixels
+        # so it averages the same 2x2 pixels as halving the whole chunk would
+        area = cell_rect
+        for level in range(1, ZOOM_LEVELS):
+            left, top = area.x // 2 * 2, area.y // 2 * 2
+            right, bottom = -(-area.right // 2) * 2, -(-area.bottom // 2) * 2
+            source = levels[level - 1].subsurface((left, top, right - left, bottom - top))
+            area = pygame.Rect(left // 2, top // 2, (right - left) // 2, (bottom - top) // 2)
+            levels[level].fill((0, 0, 0, 0), area)
+            levels[level].blit(pygame.transform.smoothscale(source, area.size), area)
+
+    def handle_event(self, event):
+        """Handle zooming (mouse wheel, PAGE UP/DOWN), dragging and recentering (HOME)"""
+        if event.type == pygame.MOUSEWHEEL:
+            self.set_zoom(self.zoom - event.y)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_PAGEUP:
+                self.set_zoom(self.zoom - 1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.set_zoom(self.zoom + 1)
+            elif event.key == pygame.K_HOME:
+                self.center_on_player()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.dragging = MAP_VIEWPORT.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.pan(-event.rel[0], -event.rel[1])
+
+    def update(self):
+        """Pan the view while arrow keys or WASD are held"""
+        keys = pygame.key.get_pressed()
+        dx = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a])
+        dy = (keys[pygame.K_DOWN] or keys[pygame.K_s]) - (keys[pygame.K_UP] or keys[pygame.K_w])
+        if dx or dy:
+            self.pan(dx * PAN_SPEED, dy * PAN_SPEED)
+
+    def block_to_screen(self, block_x, block_y):
+        """Get the screen position of a block's top-left corner"""
+        cell_size = self.get_cell_size()
+        return (round(MAP_VIEWPORT.centerx + (block_x - self.view_x) * cell_size),
+                round(MAP_VIEWPORT.centery + (block_y - self.view_y) * cell_size))
+
+    def draw_grid(self, screen, cell_size):
+        """Draw the grid lines of the cells in the viewport"""
+        first_x = MAP_VIEWPORT.centerx - (self.view_x % 1) * cell_size
+        first_y = MAP_VIEWPORT.centery - (self.view_y % 1) * cell_size
+        first_x -= (first_x - MAP_VIEWPORT.left) // cell_size * cell_size
+        first_y -= (first_y - MAP_VIEWPORT.top) // cell_size * cell_size
+
+        x = first_x
+        while x < MAP_VIEWPORT.right:
+            pygame.draw.line(screen, self.colors['grid'], (round(x), MAP_VIEWPORT.top), (round(x), MAP_VIEWPORT.bottom))
+            x += cell_size
+        y = first_y
+        while y < MAP_VIEWPORT.bottom:
+            pygame.draw.line(screen, self.colors['grid'], (MAP_VIEWPORT.left, round(y)), (MAP_VIEWPORT.right, round(y)))
+            y += cell_size
+
+    def draw_blocks(self, screen):
+        """Draw the map texture chunks covering the viewport"""
+        cell_size = self.get_cell_size()
+        chunk_span = MAP_CHUNK_BLOCKS * cell_size
+
+        # Chunks overlapping the viewport
+        left_block = self.view_x - MAP_VIEWPORT.width / 2 / cell_size
+        top_block = self.view_y - MAP_VIEWPORT.height / 2 / cell_size
+        first_chunk_x = int(left_block // MAP_CHUNK_BLOCKS)
+        first_chunk_y = int(top_block // MAP_CHUNK_BLOCKS)
+        chunks_wide = int(MAP_VIEWPORT.width // chunk_span) + 2
+        chunks_high = int(MAP_VIEWPORT.height // chunk_span) + 2
+
+        blits = []
+        for chunk_y in range(first_chunk_y, first_chunk_y + chunks_high):
+            for chunk_x in range(first_chunk_x, first_chunk_x + chunks_wide):
+                if (chunk_x, chunk_y) in self.chunks:
+                    chunk = self.chunks[(chunk_x, chunk_y)][self.zoom]
+                    position = self.block_to_screen(chunk_x * MAP_CHUNK_BLOCKS, chunk_y * MAP_CHUNK_BLOCKS)
+                    blits.append((chunk, position))
+        screen.blits(blits, doreturn=False)
+
     def draw(self, screen):
         """Draw the map on the screen"""
         if not self.visible:
             return
-            
+
         # Fill background
         screen.fill(self.colors['background'])
-        
+
         # Draw title
-        title = self.title_font.render("WORLD MAP", True, self.colors['text'])
+        title = text_cache.render(self.title_font, "WORLD MAP", True, self.colors['text'])
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 20))
-        
+
         # Draw current coordinates info
         curr_x, curr_y = self.world.current_block_coords
-        coords_text = self.font.render(f"Current Position: ({curr_x}, {curr_y})", True, self.colors['text'])
+        coords_text = text_cache.render(self.font, f"Current Position: ({curr_x}, {curr_y})", True, self.colors['text'])
         screen.blit(coords_text, (SCREEN_WIDTH // 2 - coords_text.get_width() // 2, 50))
-        
-        # Calculate map center position
-        center_x = SCREEN_WIDTH // 2
-        center_y = SCREEN_HEIGHT // 2
-        
-        # Calculate offset for centered grid
-        offset_x = center_x - (self.grid_size // 2) * self.cell_size
-        offset_y = center_y - (self.grid_size // 2) * self.cell_size
-        
-        # Get current block coordinates
-        current_x, current_y = self.world.current_block_coords
-        
-        # Draw the grid and blocks
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                # Calculate world coordinates for this cell
-                world_x = current_x - (self.grid_size // 2) + x
-                world_y = current_y - (self.grid_size // 2) + y
-                
-                # Calculate screen position for this cell
-                screen_x = offset_x + x * self.cell_size
-                screen_y = offset_y + y * self.cell_size
-                
-                # Draw cell
-                cell_rect = pygame.Rect(
-                    screen_x, 
-                    screen_y, 
-                    self.cell_size, 
-                    self.cell_size
-                )
-                
-                # Check if block exists at these coordinates
-                block_exists = (world_x, world_y) in self.world.blocks
-                
-                # Determine cell color
-                if world_x == current_x and world_y == current_y:
-                    # Current block
-                    color = self.colors['current']
-                elif block_exists and self.world.blocks[(world_x, world_y)].is_visited():
-                    # Visited block
-                    color = self.colors['visited']
-                elif block_exists:
-                    # Known but unexplored block
-                    color = self.colors['unexplored']
-                else:
-                    # Draw only grid for unknown blocks
-                    pygame.draw.rect(screen, self.colors['grid'], cell_rect, 1)
-                    continue
-                
-                # Draw filled cell with border
-                pygame.draw.rect(screen, color, cell_rect)
-                pygame.draw.rect(screen, self.colors['grid'], cell_rect, 1)
-                
-                # Draw coordinates in the cell if cell is large enough
-                coord_text = f"({world_x},{world_y})"
-                text_surf = self.font.render(coord_text, True, self.colors['text'])
-                
-                # Only draw text if it fits in the cell
-                if text_surf.get_width() < self.cell_size - 4:
-                    text_pos = (
-                        screen_x + self.cell_size // 2 - text_surf.get_width() // 2,
-                        screen_y + self.cell_size // 2 - text_surf.get_height() // 2
-                    )
-                    screen.blit(text_surf, text_pos)
-        
-        # Draw player marker (centered in current block)
-        current_screen_x = offset_x + (self.grid_size // 2) * self.cell_size
-        current_screen_y = offset_y + (self.grid_size // 2) * self.cell_size
-        
-        # Draw a triangle for player direction
+
+        # Draw the grid and blocks inside the viewport
+        cell_size = self.get_cell_size()
+        screen.set_clip(MAP_VIEWPORT)
+        if cell_size >= 14:
+            self.draw_grid(screen, cell_size)
+        self.draw_blocks(screen)
+
+        # Highlight the current block
+        current_x, current_y = self.block_to_screen(curr_x, curr_y)
+        next_x, next_y = self.block_to_screen(curr_x + 1, curr_y + 1)
+        current_rect = pygame.Rect(current_x, current_y, next_x - current_x, next_y - current_y)
+        pygame.draw.rect(screen, self.colors['current'], current_rect)
+        pygame.draw.rect(screen, self.colors['grid'], current_rect, 1)
+
+        # Draw player position (centered in current block)
         player_color = self.colors['player']
-        center_x = current_screen_x + self.cell_size // 2
-        center_y = current_screen_y + self.cell_size // 2
-        marker_size = max(self.cell_size // 5, 5)  # Ensure marker is visible even with small cells
-        
-        # Draw player position
-        pygame.draw.circle(screen, player_color, (center_x, center_y), marker_size)
-        
+        marker_size = max(int(cell_size) // 5, 5)  # Ensure marker is visible even with small cells
+        pygame.draw.circle(screen, player_color, current_rect.center, marker_size)
+        screen.set_clip(None)
+
         # Draw legend
         legend_x = 20
         legend_y = SCREEN_HEIGHT - 120
-        
+
         legend_items = [
             ("Current Location", self.colors['current']),
             ("Visited Areas", self.colors['visited']),
             ("Unexplored", self.colors['unexplored']),
             ("Player", self.colors['player'])
         ]
-        
-        legend_title = self.font.render("Legend:", True, self.colors['text'])
+
+        legend_title = text_cache.render(self.font, "Legend:", True, self.colors['text'])
         screen.blit(legend_title, (legend_x, legend_y))
-        
+
         for i, (text, color) in enumerate(legend_items):
             y_pos = legend_y + 25 + i * 20
-            
+
             # Draw color sample
             pygame.draw.rect(screen, color, (legend_x, y_pos, 15, 15))
-            
+
             # Draw text
-            text_surf = self.font.render(text, True, self.colors['text'])
+            text_surf = text_cache.render(self.font, text, True, self.colors['text'])
             screen.blit(text_surf, (legend_x + 25, y_pos))
-        
+
         # Draw instructions with controller button info
         instructions = [
             "Press 'M' or LB to close map",
+            "Arrows/WASD or drag to pan, HOME to recenter",
+            "Mouse wheel or PAGE UP/DOWN to zoom",
             "Explore the world by crossing",
             "the borders of each area"
         ]
-        
+
         for i, text in enumerate(instructions):
-            instruction_text = self.font.render(text, True, self.colors['text'])
+            instruction_text = text_cache.render(self.font, text, True, self.colors['text'])
             x_pos = SCREEN_WIDTH - instruction_text.get_width() - 20
-            y_pos = SCREEN_HEIGHT - 80 + i * 20
-            screen.blit(instruction_text, (x_pos, y_pos))
\ No newline at end of file
+            y_pos = SCREEN_HEIGHT - 120 + i * 20
+            screen.blit(instruction_text, (x_pos, y_pos))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Particle engine benchmark.
+
+Keeps a steady population of particles alive (explosions, smoke, blood and
+death bursts, re-emitted as they die) and measures the per-frame cost of
+updating and drawing them: the list-of-dicts and BloodParticle code the
+game used before, against the NumPy particle engine.
+
+Run from the pygame directory:
+    python particle_benchmark.py [particle_count]
+"""
+
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GREEN
+
+FRAMES = 300
+DEFAULT_PARTICLES = 10000
+# Particles per death burst and blood spray when topping up the population
+BURST_SIZE = 100
+BLOOD_SIZE = 40
+# Walls for blood to stick to
+OBSTACLES = [pygame.Rect(x, y, 64, 64) for x in range(100, SCREEN_WIDTH, 300) for y in range(100, SCREEN_HEIGHT, 300)]
+
+
+class Obstacle:
+    """Minimal entity with a collision rect"""
+    def __init__(self, rect):
+        self.x, self.y = rect.x, rect.y
+        self.rect = rect
+
+    def get_rect(self):
+        return self.rect
+
+
+def random_point():
+    return random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)
+
+
+def run_engine(screen, target, obstacles):
+    """Average milliseconds per frame (update + draw) with the NumPy engine"""
+    from particle_engine import ParticleEngine, NUMPY_AVAILABLE
+    if not NUMPY_AVAILABLE:
+        return None
+
+    engine = ParticleEngine(capacity=max(target * 2, 1024))
+    # Measure the engine itself: no budget below the population asked for
+    engine.set_budget(engine.capacity)
+
+    def refill():
+        while engine.count < target:
+            x, y = random_point()
+            engine.emit_fire_explosion(x, y)
+            engine.emit_smoke_cloud(x, y)
+            engine.emit_burst(x, y, BURST_SIZE, 10, (4, 10), (0.8, 2.5), (15, 30), 30, (30, 150, 30), (100, 250, 100))
+            engine.emit_blood_cone(x, y, random.uniform(0, 2 * math.pi), BLOOD_SIZE, None)
+
+    def frame():
+        refill()
+        engine.update(obstacles)
+        screen.fill(GREEN)
+        engine.draw(screen)
+
+    return time_per_frame(frame), engine.count
+
+
+def run_lists(screen, target, obstacles):
+    """Average milliseconds per frame (update + draw) with the old list-based particles"""
+    from entities.blood_particle import BloodParticle, draw_blood_particles
+    from entities.player.particles import ParticleSystem
+    import entities.player.particles as particles_module
+
+    # Force the list code path
+    particles_module.particle_engine = None
+    system = ParticleSystem(None)
+
+    def refill():
+        while len(system.xp_particles) + len(system.blood_particles) < target:
+            x, y = random_point()
+            system.create_fire_explosion(x, y)
+            system.create_smoke_cloud(x, y)
+            for _ in range(BURST_SIZE):
+                angle = random.uniform(0, 2 * math.pi)
+                system.xp_particles.append({
+                    'x': x, 'y': y, 'vel_x': math.cos(angle), 'vel_y': math.sin(angle),
+                    'size': random.randint(4, 10), 'color': (60, 200, 60),
+                    'life': random.randint(15, 30), 'max_life': 30
+                })
+            for _ in range(BLOOD_SIZE):
+                angle = random.uniform(0, 2 * math.pi)
+                system.blood_particles.append(BloodParticle(x, y, math.cos(angle), math.sin(angle)))
+
+    def frame():
+        refill()
+        system.update(0, obstacles)
+        screen.fill(GREEN)
+        draw_blood_particles(screen, system.blood_particles)
+        system.draw_xp_particles(screen)
+
+    return time_per_frame(frame), len(system.xp_particles) + len(system.blood_particles)
+
+
+def time_per_frame(frame, frames=FRAMES):
+    """Average milliseconds per call of frame()"""
+    for _ in range(30):
+        frame()  # Warm up (fills the population and the sprite cache)
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PARTICLES
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    obstacles = [Obstacle(rect) for rect in OBSTACLES]
+    random.seed(0)
+
+    results = [("NumPy particle engine", run_engine(screen, target, obstacles)),
+               ("lists of dicts / BloodParticle (old)", run_lists(screen, target, obstacles))]
+
+    budget = 1000 / FPS
+    print(f"Particle update + draw per frame, ~{target} live particles, {len(obstacles)} obstacles "
+          f"({pygame.display.get_driver()} driver, {FRAMES} frames, {budget:.1f} ms budget at {FPS} FPS):")
+    for label, result in results:
+        if result is None:
+            print(f"  {label:<40} unavailable (NumPy not installed)")
+            continue
+        ms, count = result
+        print(f"  {label:<40} {ms:8.3f} ms  ({count} alive, {'OK' if ms <= budget else 'over budget'})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
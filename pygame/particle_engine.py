@@ -0,0 +1,519 @@
+import math
+import pygame
+from constants import FPS
+from particle_sprites import particle_sprites, MAX_SPRITES
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MAX_PARTICLES = 16384   # Preallocated slots; the budget can never exceed this
+
+# Emitter priorities: lower numbers are kept longest when over budget
+PRIORITY_GAMEPLAY = 0   # Blood (sticks and stays in the world)
+PRIORITY_FEEDBACK = 1   # XP sparkles, explosions, death bursts
+PRIORITY_COSMETIC = 2   # Smoke, fire trails, embers
+
+# Quality presets: emission scale (gameplay particles are never scaled) and particle budget
+# Format: {name: (emission_scale, budget)}
+QUALITY_PRESETS = {
+    'low': (0.25, 2000),
+    'medium': (0.5, 5000),
+    'high': (1.0, 10000),
+}
+QUALITY_ORDER = ['low', 'medium', 'high']
+DEFAULT_QUALITY = 'high'
+
+# Automatic budget: lowered while frames take longer than the target,
+# raised back to the preset's budget once they're comfortably under it
+TARGET_FRAME_MS = 1000 / FPS
+SLOW_FRAME_LIMIT = 15       # Consecutive slow frames before lowering the budget
+FAST_FRAME_LIMIT = 120      # Consecutive fast frames before raising it again
+FAST_FRAME_RATIO = 0.75     # A fast frame takes under this share of the target
+BUDGET_STEP_DOWN = 0.75
+BUDGET_STEP_UP = 1.1
+MIN_BUDGET = 500
+
+# What a particle does when it hits an obstacle
+KIND_SPARK = 0          # Fire, smoke, XP and death particles: pass through everything
+KIND_BLOOD = 1          # Enemy blood: sticks where it hits until its life runs out
+KIND_BLOOD_DECAL = 2    # Player/NPC blood: sticks and is baked into the block's decals
+
+# Sprite keys round colours and opacity more coarsely than the sprite cache
+# does on its own: thousands of particles with random colours and fades
+# then share a few hundred sprites instead of thrashing the cache
+COLOR_KEY_BITS = 31     # 8 levels per channel
+ALPHA_KEY_BITS = 31     # 8 levels of opacity
+
+BLOOD_GRAVITY = 0.2
+BLOOD_FRICTION = 0.95
+
+
+class ParticleEngine:
+    """
+    Structure-of-arrays particle engine backed by NumPy.
+
+    Every particle effect in the game (fire trails, explosions, smoke, XP
+    sparkles, blood and death bursts) lives in one set of preallocated arrays
+    instead of lists of dicts and BloodParticle objects. Emitters write
+    whole bursts at once, update() integrates every particle with a handful
+    of array operations (including blood sticking to obstacles), dead
+    particles are swap-removed so the live ones stay packed at the front,
+    and draw() hands every particle to one Surface.blits() call using the
+    shared circle sprites.
+
+    The number of live particles is capped by a budget: each emitter has a
+    priority, and a burst that doesn't fit evicts less important particles
+    (or is cut short). Quality presets scale emission counts and set the
+    budget, which is lowered automatically while frames run slow.
+    """
+    def __init__(self, capacity=MAX_PARTICLES, quality=DEFAULT_QUALITY):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng()
+
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vel_x = np.zeros(capacity, np.float32)
+        self.vel_y = np.zeros(capacity, np.float32)
+        self.gravity = np.zeros(capacity, np.float32)
+        self.drag = np.ones(capacity, np.float32)
+        self.life = np.zeros(capacity, np.int32)
+        # Life at which fading starts (0 = always opaque)
+        self.fade = np.zeros(capacity, np.float32)
+        # Circle radius and sprite size: sparks are drawn as radius=size on a
+        # 2*size sprite, blood and death particles as size//2 on a size sprite
+        self.radius = np.zeros(capacity, np.int16)
+        self.sprite_size = np.zeros(capacity, np.int16)
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.kind = np.zeros(capacity, np.int8)
+        self.stuck = np.zeros(capacity, np.bool_)
+        # id() of the entity that emitted the particle (blood skips colliding with it)
+        self.owner = np.zeros(capacity, np.int64)
+        self.priority = np.zeros(capacity, np.int8)
+
+        self.arrays = (self.x, self.y, self.vel_x, self.vel_y, self.gravity, self.drag, self.life, self.fade,
+                       self.radius, self.sprite_size, self.color, self.kind, self.stuck, self.owner, self.priority)
+
+        # Quality preset, and the budget it allows (max_budget) versus the
+        # budget currently in force after automatic lowering
+        self.quality = None
+        self.emission_scale = 1.0
+        self.max_budget = capacity
+        self.budget = capacity
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.set_quality(quality)
+
+        # Particle systems that receive decal blood when it sticks
+        # Format: {id(particle_system): ParticleSystem}
+        self.decal_owners = {}
+
+        # Sprites by packed key, in front of the shared sprite cache
+        # Format: {key: Surface}
+        self.sprites = {}
+
+        # Area of blood that stuck during the last update (for dirty-rect rendering)
+        self.stuck_rect = None
+
+        # Particles refused for lack of budget, and evicted to make room
+        self.dropped = 0
+        self.evicted = 0
+
+    def set_quality(self, quality):
+        """Switch to a quality preset (its emission scale and particle budget)"""
+        self.quality = quality
+        self.emission_scale, budget = QUALITY_PRESETS[quality]
+        self.set_budget(budget)
+
+    def cycle_quality(self):
+        """Switch to the next quality preset, wrapping from high back to low"""
+        index = (QUALITY_ORDER.index(self.quality) + 1) % len(QUALITY_ORDER)
+        self.set_quality(QUALITY_ORDER[index])
+        print(f"Particle quality: {self.quality} (budget {self.budget})")
+
+    def set_budget(self, budget):
+        """Set the most particles alive at once (evicting the least important ones over it)"""
+        self.max_budget = min(budget, self.capacity)
+        self.budget = self.max_budget
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.evict(self.count - self.budget)
+
+    def adjust_budget(self, frame_ms):
+        """
+        Lower the budget while frames run over target, and raise it back once they don't
+
+        Args:
+            frame_ms: Time the last frame took to update and draw, without the frame rate delay
+        """
+        if frame_ms > TARGET_FRAME_MS:
+            self.slow_frames += 1
+            self.fast_frames = 0
+            if self.slow_frames >= SLOW_FRAME_LIMIT and self.budget > MIN_BUDGET:
+                self.budget = max(MIN_BUDGET, int(self.budget * BUDGET_STEP_DOWN))
+                self.slow_frames = 0
+                self.evict(self.count - self.budget)
+                print(f"Frames over {TARGET_FRAME_MS:.1f} ms: particle budget lowered to {self.budget}")
+            return
+
+        self.slow_frames = 0
+        if frame_ms < TARGET_FRAME_MS * FAST_FRAME_RATIO and self.budget < self.max_budget:
+            self.fast_frames += 1
+            if self.fast_frames >= FAST_FRAME_LIMIT:
+                self.budget = min(self.max_budget, int(self.budget * BUDGET_STEP_UP))
+                self.fast_frames = 0
+        else:
+            self.fast_frames = 0
+
+    def evict(self, count, priority=-1):
+        """
+        Kill up to count particles less important than the given priority
+
+        Cosmetic particles go first, and within a priority the ones closest
+        to dying anyway.
+
+        Returns:
+            Number of particles evicted
+        """
+        if count <= 0:
+            return 0
+        n = self.count
+        candidates = np.flatnonzero(self.priority[:n] > priority)
+        if not len(candidates):
+            return 0
+        # Highest priority number first, then least life left
+        order = np.lexsort((self.life[candidates], -self.priority[candidates].astype(np.int16)))
+        victims = candidates[order[:count]]
+        self.life[victims] = 0
+        self.compact()
+        self.evicted += len(victims)
+        return len(victims)
+
+    def emit(self, x, y, vel_x=0.0, vel_y=0.0, life=1, fade=0.0, radius=1, sprite_size=2,
+             color=(255, 255, 255), gravity=0.0, drag=1.0, kind=KIND_SPARK, owner=0,
+             priority=PRIORITY_COSMETIC):
+        """
+        Add a burst of particles; every argument is a scalar or an array of the burst's length
+
+        The burst is scaled down by the quality preset (except gameplay
+        particles), then less important particles are evicted to fit it in
+        the budget; whatever still doesn't fit is dropped.
+
+        Returns:
+            Number of particles added
+        """
+        x = np.atleast_1d(x)
+        wanted = len(x)
+        if priority != PRIORITY_GAMEPLAY and self.emission_scale < 1:
+            wanted = math.ceil(wanted * self.emission_scale)
+
+        over = self.count + wanted - self.budget
+        if over > 0:
+            self.evict(over, priority)
+
+        start = self.count
+        count = max(0, min(wanted, self.budget - start))
+        self.dropped += wanted - count
+        if count <= 0:
+            return 0
+        end = start + count
+
+        for array, values in ((self.x, x), (self.y, y), (self.vel_x, vel_x), (self.vel_y, vel_y),
+                              (self.life, life), (self.fade, fade), (self.radius, radius),
+                              (self.sprite_size, sprite_size), (self.gravity, gravity), (self.drag, drag),
+                              (self.kind, kind), (self.owner, owner), (self.priority, priority)):
+            values = np.asarray(values)
+            array[start:end] = values[:count] if values.ndim else values
+        color = np.asarray(color)
+        self.color[start:end] = color[:count] if color.ndim == 2 else color
+        self.stuck[start:end] = False
+
+        self.count = end
+        return count
+
+    def emit_sparks(self, x, y, size, color, life, max_life=0, vel_x=0.0, vel_y=0.0, gravity=0.0, drag=1.0,
+                    priority=PRIORITY_COSMETIC):
+        """Add fire/smoke/XP style particles (radius = size, fading over max_life if given)"""
+        size = np.asarray(size)
+        return self.emit(x, y, vel_x, vel_y, life, max_life, size, size * 2, color, gravity, drag,
+                         priority=priority)
+
+    def emit_fire_trail(self, x, y, size, life, count=2):
+        """Add a projectile's fire trail: small orange-red particles that don't fade"""
+        green = self.rng.integers(50, 151, count)
+        color = np.column_stack((np.full(count, 255), green, np.zeros(count, np.int64)))
+        return self.emit_sparks(np.full(count, x, np.float32), y, size, color, life)
+
+    def emit_fire_explosion(self, x, y):
+        """Add a fire explosion: fiery particles spreading outward, fast embers and a central flash"""
+        rng = self.rng
+        count = int(rng.integers(15, 26))
+        angle = rng.uniform(0, 2 * math.pi, count)
+        dir_x, dir_y = np.cos(angle), np.sin(angle)
+        distance = rng.uniform(0, 8, count)
+        velocity = rng.uniform(0.8, 2.5, count)
+        color = np.column_stack((np.full(count, 255), rng.integers(50, 201, count), rng.integers(0, 51, count)))
+        self.emit_sparks(x + dir_x * distance, y + dir_y * distance, rng.integers(3, 9, count), color,
+                         rng.integers(10, 26, count), 25, dir_x * velocity, dir_y * velocity,
+                         priority=PRIORITY_FEEDBACK)
+
+        # Embers move faster and further
+        angle = rng.uniform(0, 2 * math.pi, 5)
+        velocity = rng.uniform(2.0, 3.5, 5)
+        color = np.column_stack((np.full(5, 255), np.full(5, 255), rng.integers(100, 201, 5)))
+        self.emit_sparks(np.full(5, x, np.float32), y, rng.integers(1, 4, 5), color,
+                         rng.integers(5, 16, 5), 15, np.cos(angle) * velocity, np.sin(angle) * velocity)
+
+        # Central flash
+        self.emit_sparks(x, y, int(rng.integers(10, 16)), (255, 255, 200), int(rng.integers(3, 9)), 8,
+                         priority=PRIORITY_FEEDBACK)
+
+    def emit_smoke_cloud(self, x, y, count=8):
+        """Add a small gray cloud that rises and dissipates"""
+        rng = self.rng
+        angle = rng.uniform(-2.5, 0.5, count)   # Mostly upward
+        gray = rng.integers(30, 81, count)
+        return self.emit_sparks(x + rng.uniform(-10, 10, count), y + rng.uniform(-5, 5, count),
+                                rng.integers(4, 9, count), np.column_stack((gray, gray, gray)),
+                                rng.integers(20, 36, count), 35, np.cos(angle) * 0.3, np.sin(angle) * 0.5)
+
+    def emit_xp(self, center_x, center_y, count):
+        """Add gold XP sparkles scattered around a point"""
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        distance = rng.uniform(10, 30, count)
+        return self.emit_sparks(center_x + np.cos(angle) * distance, center_y + np.sin(angle) * distance,
+                                rng.integers(2, 5, count), (255, 215, 0), rng.integers(10, 21, count),
+                                priority=PRIORITY_FEEDBACK)
+
+    def emit_blood_spray(self, center_x, center_y, count, decal_owner):
+        """Add blood spraying from a point in every direction, baked into decal_owner's decals when it sticks"""
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        return self.emit_blood(np.full(count, center_x, np.float32), center_y, np.cos(angle), np.sin(angle),
+                               decal_owner=decal_owner)
+
+    def emit_blood_cone(self, x, y, base_angle, count, owner, spread=0.7, offset=3.0):
+        """Add blood from an impact point, in a cone of +/- spread radians around base_angle"""
+        rng = self.rng
+        angle = base_angle + rng.uniform(-spread, spread, count)
+        return self.emit_blood(x + rng.uniform(-offset, offset, count), y + rng.uniform(-offset, offset, count),
+                               np.cos(angle), np.sin(angle), owner=owner)
+
+    def emit_blood(self, x, y, dir_x, dir_y, size=None, owner=None, decal_owner=None):
+        """
+        Add blood particles flying in the given directions (same physics as BloodParticle)
+
+        Args:
+            x, y, dir_x, dir_y: Start positions and unit directions (arrays)
+            size: Particle sizes (random 4-8 when None)
+            owner: Entity the blood comes from (it never sticks to it)
+            decal_owner: ParticleSystem whose block decals receive the blood when it sticks;
+                without one the blood stays stuck on the obstacle until its life runs out
+        """
+        count = len(np.atleast_1d(dir_x))
+        rng = self.rng
+        if size is None:
+            size = rng.integers(4, 9, count)
+        speed = rng.uniform(1.0, 4.0, count)
+        life = rng.integers(15, 31, count)
+        color = np.column_stack((rng.integers(120, 221, count), rng.integers(0, 31, count),
+                                 rng.integers(0, 31, count)))
+
+        if decal_owner is not None:
+            self.decal_owners[id(decal_owner)] = decal_owner
+            kind, owner_id = KIND_BLOOD_DECAL, id(decal_owner)
+        else:
+            kind, owner_id = KIND_BLOOD, id(owner) if owner is not None else 0
+
+        size = np.asarray(size)
+        return self.emit(x, y, dir_x * speed, dir_y * speed, life, life // 2, size // 2, size, color,
+                         BLOOD_GRAVITY, BLOOD_FRICTION, kind, owner_id, PRIORITY_GAMEPLAY)
+
+    def emit_burst(self, center_x, center_y, count, max_distance, size_range, speed_range,
+                   life_range, max_life, color_low, color_high, gray=False, blue_drop=None,
+                   gravity=-0.05, drag=0.95):
+        """
+        Add a death burst spreading out from a point in every direction
+
+        Args:
+            size_range, speed_range, life_range: (low, high) inclusive ranges
+            color_low, color_high: Per-channel colour range
+            gray: Use one random value for all three channels (smoke)
+            blue_drop: (low, high) taken off the blue channel (off-white bone fragments)
+        """
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        dir_x, dir_y = np.cos(angle), np.sin(angle)
+        distance = rng.uniform(0, max_distance, count)
+        size = rng.integers(size_range[0], size_range[1] + 1, count)
+        speed_x = rng.uniform(speed_range[0], speed_range[1], count)
+        speed_y = rng.uniform(speed_range[0], speed_range[1], count)
+
+        if gray:
+            value = rng.integers(color_low[0], color_high[0] + 1, count)
+            color = np.column_stack((value, value, value))
+            if blue_drop:
+                color[:, 2] -= rng.integers(blue_drop[0], blue_drop[1] + 1, count)
+        else:
+            color = rng.integers(color_low, np.asarray(color_high) + 1, (count, 3))
+
+        return self.emit(center_x + dir_x * distance, center_y + dir_y * distance,
+                         dir_x * speed_x, dir_y * speed_y,
+                         rng.integers(life_range[0], life_range[1] + 1, count), max_life,
+                         size // 2, size, color, gravity, drag, priority=PRIORITY_FEEDBACK)
+
+    def remove_owner(self, owner):
+        """Kill every particle an entity or particle system emitted"""
+        n = self.count
+        self.life[:n][self.owner[:n] == id(owner)] = 0
+        self.compact()
+
+    def update(self, obstacles=None):
+        """Move every particle one frame, stick blood to obstacles and drop dead particles"""
+        self.stuck_rect = None
+        n = self.count
+        if n == 0:
+            self.decal_owners.clear()
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        vel_x, vel_y = self.vel_x[:n], self.vel_y[:n]
+        life, stuck = self.life[:n], self.stuck[:n]
+        is_blood = self.kind[:n] != KIND_SPARK
+
+        # Sparks move, then slow down; blood slows down (and falls), then moves
+        new_vel_x = vel_x * self.drag[:n]
+        new_vel_y = (vel_y + self.gravity[:n]) * self.drag[:n]
+        new_x = x + np.where(is_blood, new_vel_x, vel_x)
+        new_y = y + np.where(is_blood, new_vel_y, vel_y)
+
+        # Flying blood that would overlap an obstacle sticks where it is
+        hit = np.zeros(n, np.bool_)
+        flying_blood = np.flatnonzero(is_blood & ~stuck)
+        if obstacles and len(flying_blood):
+            size = self.sprite_size[flying_blood]
+            left = (new_x[flying_blood] - size // 2).astype(np.int32)
+            top = (new_y[flying_blood] - size // 2).astype(np.int32)
+            right, bottom = left + size, top + size
+            owner = self.owner[flying_blood]
+            blood_hit = np.zeros(len(flying_blood), np.bool_)
+            for obstacle in obstacles:
+                rect = obstacle.get_rect()
+                if rect.width <= 0 or rect.height <= 0:
+                    continue
+                blood_hit |= ((left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)
+                              & (owner != id(obstacle)))
+            hit[flying_blood] = blood_hit
+
+        moving = ~stuck & ~hit
+        x[moving] = new_x[moving]
+        y[moving] = new_y[moving]
+        vel_x[moving] = new_vel_x[moving]
+        vel_y[moving] = new_vel_y[moving]
+        stuck |= hit
+
+        # Everything ages, except blood in the frame it sticks
+        life[~hit] -= 1
+
+        if hit.any():
+            self.bake_decals(np.flatnonzero(hit & (self.kind[:n] == KIND_BLOOD_DECAL)))
+
+        self.compact()
+
+    def bake_decals(self, indices):
+        """Hand decal blood that just stuck to its particle system's block decals"""
+        if not len(indices):
+            return
+        for i in indices.tolist():
+            size = int(self.sprite_size[i])
+            splat = (float(self.x[i]), float(self.y[i]), size, tuple(self.color[i].tolist()), int(self.life[i]))
+            particle_system = self.decal_owners.get(int(self.owner[i]))
+            if particle_system is not None:
+                particle_system.add_stuck_blood(splat)
+
+            splat_rect = pygame.Rect(int(splat[0]) - size, int(splat[1]) - size, size * 2, size * 2)
+            self.stuck_rect = splat_rect if self.stuck_rect is None else self.stuck_rect.union(splat_rect)
+
+            # Baked: the particle itself is done
+            self.life[i] = 0
+
+    def compact(self):
+        """Swap-remove dead particles: live particles from the end fill the holes"""
+        n = self.count
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if not len(dead):
+            return
+        new_count = n - len(dead)
+        holes = dead[dead < new_count]
+        if len(holes):
+            movers = np.flatnonzero(self.life[new_count:n] > 0) + new_count
+            for array in self.arrays:
+                array[holes] = array[movers]
+        self.count = new_count
+
+    def get_blits(self):
+        """
+        Get (sprite, position) pairs for every live particle
+
+        Sprites are looked up once per distinct (size, radius, colour, alpha)
+        bucket rather than once per particle.
+        """
+        n = self.count
+        life = self.life[:n]
+        fade = self.fade[:n]
+        alpha = np.where(fade > 0, np.minimum(255, 255 * life / np.maximum(fade, 1)), 255).astype(np.int64)
+
+        sprite_size = self.sprite_size[:n].astype(np.int64)
+        radius = self.radius[:n].astype(np.int64)
+        color = self.color[:n].astype(np.int64) | COLOR_KEY_BITS
+        keys = ((sprite_size << 40) | (radius << 32) | (color[:, 0] << 24) | (color[:, 1] << 16)
+                | (color[:, 2] << 8) | (alpha | ALPHA_KEY_BITS))
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprites = np.empty(len(unique_keys), dtype=object)
+        sprites[:] = [self.sprites.get(key) or self.get_sprite(key) for key in unique_keys.tolist()]
+
+        offset = sprite_size // 2
+        positions = zip((self.x[:n] - offset).astype(np.int32).tolist(),
+                        (self.y[:n] - offset).astype(np.int32).tolist())
+        return zip(sprites[inverse.ravel()].tolist(), positions)
+
+    def get_sprite(self, key):
+        """Fetch the circle sprite for a packed key from the shared sprite cache"""
+        if len(self.sprites) >= MAX_SPRITES:
+            self.sprites.clear()
+        sprite = particle_sprites.get_circle(
+            (key >> 32) & 0xFF, ((key >> 24) & 0xFF, (key >> 16) & 0xFF, (key >> 8) & 0xFF), key & 0xFF, key >> 40)
+        self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface):
+        """Draw every live particle with one Surface.blits() call"""
+        if self.count:
+            surface.blits(self.get_blits(), doreturn=False)
+
+    def get_draw_rect(self):
+        """Get the rect covering every live particle and any blood that just stuck (None if none)"""
+        n = self.count
+        bounds = self.stuck_rect
+        if n:
+            size = self.sprite_size[:n]
+            left = self.x[:n] - size // 2
+            top = self.y[:n] - size // 2
+            x0, y0 = int(left.min()) - 1, int(top.min()) - 1
+            rect = pygame.Rect(x0, y0, int((left + size).max()) + 2 - x0, int((top + size).max()) + 2 - y0)
+            bounds = rect if bounds is None else bounds.union(rect)
+        return bounds
+
+    def clear(self):
+        """Remove every particle (e.g. when changing blocks)"""
+        self.count = 0
+        self.decal_owners.clear()
+        self.stuck_rect = None
+
+
+# Singleton instance (None without NumPy: particles then use the list-based code)
+particle_engine = ParticleEngine() if NUMPY_AVAILABLE else None
@@ -0,0 +1,85 @@
+import pygame
+
+# Colour channels and opacity are bucketed by setting their low bits, so
+# 248-255 all become 255 (full opacity stays exact) and 0-7 become 7
+COLOR_BUCKET_BITS = 7   # Buckets of 8 values
+ALPHA_BUCKET_BITS = 7
+MAX_SPRITES = 8192      # Sprites kept before the oldest are dropped (a few MB)
+
+
+class ParticleSpriteCache:
+    """
+    Shared pre-rendered circle sprites for particle effects.
+
+    Blood, XP, fire, death, soul and dragon heart particles are all alpha
+    circles, and each used to be drawn by creating a new SRCALPHA surface per
+    particle per frame. Here each (size, radius, colour, alpha) circle is
+    rendered once, with colour and opacity rounded to buckets so the random
+    particle colours and per-frame fades map onto a small set of sprites,
+    and callers draw a whole list of particles with one Surface.blits() call.
+    """
+    def __init__(self):
+        # Format: {(size, radius, r, g, b, alpha): Surface}
+        self.sprites = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_circle(self, radius, color, alpha=255, size=None):
+        """
+        Get a circle sprite, rendering it on first use
+
+        Args:
+            radius: Circle radius in pixels
+            color: RGB colour (integer channels)
+            alpha: Opacity 0-255
+            size: Sprite width and height (default 2 * radius); the circle is
+                centered at (size // 2, size // 2), as the particle code drew it
+
+        Returns:
+            Shared SRCALPHA surface (callers must not draw onto it)
+        """
+        if size is None:
+            size = radius * 2
+
+        # Flat key with bucketed channels: this runs for every particle every frame
+        key = (size, radius,
+               color[0] | COLOR_BUCKET_BITS, color[1] | COLOR_BUCKET_BITS, color[2] | COLOR_BUCKET_BITS,
+               int(alpha) | ALPHA_BUCKET_BITS)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, key[2:], (size // 2, size // 2), radius)
+
+        # Drop the oldest sprite once the cache is full (dicts keep insertion order)
+        if len(self.sprites) >= MAX_SPRITES:
+            del self.sprites[next(iter(self.sprites))]
+        self.sprites[key] = sprite
+        return sprite
+
+    def get_stats(self):
+        """Get cache hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'sprites': len(self.sprites),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Drop every cached sprite"""
+        self.sprites.clear()
+
+
+# Singleton instance
+particle_sprites = ParticleSpriteCache()
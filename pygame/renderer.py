@@ -0,0 +1,210 @@
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN
+
+# Present the whole screen once the dirty area passes this share of it:
+# one flip is cheaper than many overlapping partial updates
+FULL_REDRAW_THRESHOLD = 0.5
+# Extra pixels around an entity's rect when it has no get_draw_rect()
+DEFAULT_MARGIN = 8
+# Particle lists the default bounds look for on an entity
+PARTICLE_ATTRIBUTES = ('particles', 'blood_particles', 'death_particles')
+
+
+def get_particle_bounds(particles):
+    """
+    Get the rect covering a list of particles
+
+    Works with particle dicts and objects (e.g. BloodParticle) alike, as long
+    as they have an x, y (center) and size; size is treated as a radius so
+    both circle and square particles fit.
+
+    Returns:
+        Rect, or None if there are no particles
+    """
+    bounds = None
+    for particle in particles:
+        if not particle:
+            continue
+        if isinstance(particle, dict):
+            x, y, size = particle['x'], particle['y'], particle['size']
+        else:
+            x, y, size = particle.x, particle.y, particle.size
+        rect = pygame.Rect(int(x - size) - 1, int(y - size) - 1, size * 2 + 2, size * 2 + 2)
+        bounds = rect if bounds is None else bounds.union(rect)
+    return bounds
+
+
+def get_draw_rect(entity):
+    """
+    Get the screen area an entity draws to
+
+    Entities whose effects reach past their rect (swords, particles, glows)
+    define get_draw_rect() themselves; anything else gets its position and
+    size plus DEFAULT_MARGIN, joined with its particle lists if it has any.
+    """
+    if hasattr(entity, 'get_draw_rect'):
+        return entity.get_draw_rect()
+
+    rect = pygame.Rect(int(entity.x), int(entity.y), entity.width, entity.height)
+    rect.inflate_ip(DEFAULT_MARGIN * 2, DEFAULT_MARGIN * 2)
+    for attribute in PARTICLE_ATTRIBUTES:
+        particles = getattr(entity, attribute, None)
+        if isinstance(particles, list):
+            particle_bounds = get_particle_bounds(particles)
+            if particle_bounds:
+                rect.union_ip(particle_bounds)
+    return rect
+
+
+class DirtyRectRenderer:
+    """
+    Optional dirty-rectangle presentation for the gameplay view.
+
+    With it enabled, a frame no longer redraws the whole ground: only the
+    areas drawn last frame are restored from the block's cached static layer,
+    everything dynamic is drawn on top, and just the union of last frame's
+    and this frame's areas is sent to the display with
+    pygame.display.update(rects). Block transitions, overlays and frames
+    whose dirty area passes FULL_REDRAW_THRESHOLD fall back to a full flip.
+    """
+    def __init__(self, threshold=FULL_REDRAW_THRESHOLD):
+        self.enabled = False
+        self.threshold = threshold
+        self.screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # Areas drawn this frame and the frame before
+        self.current_rects = []
+        self.previous_rects = []
+
+        # Background the previous rects were restored from; a new one
+        # (another block, or a re-baked layer) needs a full redraw
+        self.background = None
+        # Set when the screen can't be patched from the previous frame
+        # (overlays, transitions): the next frame redraws everything
+        self.full_redraw = True
+        # Whether the frame being drawn started from the whole background
+        self.redrawn_frame = True
+
+        # Per-frame report: share of the screen presented and rect count
+        self.coverage = 1.0
+        self.rect_count = 0
+        self.frames = 0
+        self.full_frames = 0
+        self.coverage_total = 0.0
+
+    def toggle(self):
+        """Switch dirty-rect mode on or off"""
+        self.enabled = not self.enabled
+        self.force_full_redraw()
+        if not self.enabled and self.frames:
+            stats = self.get_stats()
+            print(f"Dirty rects OFF (avg coverage {stats['average_coverage']:.0%}, "
+                  f"{stats['full_frame_rate']:.0%} full frames over {self.frames} frames)")
+        else:
+            print(f"Dirty rects: {'ON' if self.enabled else 'OFF'}")
+        self.reset_stats()
+
+    def force_full_redraw(self):
+        """
+        Present this whole frame and redraw the whole screen next frame
+        
+        Call it whenever something is drawn that isn't marked (overlays,
+        fades, debug boxes), so none of it is left behind once it's gone.
+        """
+        self.full_redraw = True
+
+    def begin_frame(self, surface, background):
+        """
+        Prepare the screen for drawing a gameplay frame
+
+        Args:
+            surface: The display surface
+            background: The current block's static layer (None to fill green)
+        """
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+
+        self.redrawn_frame = not self.enabled or self.full_redraw or background is None
+        self.full_redraw = False
+
+        if self.redrawn_frame:
+            if background is not None:
+                surface.blit(background, (0, 0))
+            else:
+                surface.fill(GREEN)
+        else:
+            # Erase last frame's dynamic drawing with the ground underneath it
+            for rect in self.previous_rects:
+                surface.blit(background, rect, rect)
+
+        self.current_rects = []
+
+    def mark(self, rect):
+        """Record an area drawn this frame"""
+        if rect:
+            rect = self.screen_rect.clip(rect)
+            if rect.width > 0 and rect.height > 0:
+                self.current_rects.append(rect)
+
+    def mark_entity(self, entity):
+        """Record the area an entity draws to"""
+        self.mark(get_draw_rect(entity))
+
+    def merge_rects(self, rects):
+        """Join overlapping rects so no area is updated (or counted) twice"""
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            # Absorb every merged rect this one touches, until none are left
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        """Send the frame to the display: a partial update, or a full flip"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+
+        rects = self.merge_rects(self.previous_rects + self.current_rects)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        coverage = sum(rect.width * rect.height for rect in rects) / screen_area
+
+        if self.redrawn_frame or self.full_redraw or coverage > self.threshold:
+            pygame.display.flip()
+            self.coverage = 1.0
+            self.rect_count = 1
+            self.full_frames += 1
+        else:
+            pygame.display.update(rects)
+            self.coverage = coverage
+            self.rect_count = len(rects)
+
+        self.frames += 1
+        self.coverage_total += self.coverage
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+
+    def get_stats(self):
+        """Get dirty coverage statistics since the mode was switched on"""
+        return {
+            'coverage': self.coverage,
+            'rects': self.rect_count,
+            'frames': self.frames,
+            'average_coverage': self.coverage_total / self.frames if self.frames else 0.0,
+            'full_frame_rate': self.full_frames / self.frames if self.frames else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset the coverage counters"""
+        self.frames = 0
+        self.full_frames = 0
+        self.coverage_total = 0.0
+
+
+# Singleton instance
+dirty_rect_renderer = DirtyRectRenderer()
@@ -2,6 +2,8 @@ import json
 import os
 import datetime
 import pygame
+from asset_cache import asset_cache
+from items.item_registry import item_registry
 
 class SaveManager:
     def __init__(self, game_world, player):
@@ -99,7 +101,7 @@ class SaveManager:
                 count = self.player.inventory.item_counts[item.name]
 
             item_data = {
-                "type": type(item).__name__,
+                "type": item.type_name,
                 "name": item.name,
                 "count": count
             }
@@ -219,26 +221,17 @@ class SaveManager:
             item_name = item_data.get("name")
             item_count = item_data.get("count", 1)
 
-            from items.health_potion import HealthPotion
-            from items.ancient_scroll import AncientScroll
-            from items.dragon_heart import DragonHeart
-
-            item = None
-            if item_type == "HealthPotion":
-                item = HealthPotion(0, 0)
-            elif item_type == "AncientScroll":
-                item = AncientScroll(0, 0)
-            elif item_type == "DragonHeart":
-                item = DragonHeart(0, 0)
-
+            item = item_registry.get_type(item_type)
             if item:
                 self.player.inventory.add_item(item)
 
-                if hasattr(item, 'stackable') and item.stackable and item_count > 1:
+                if item.stackable and item_count > 1:
                     self.player.inventory.item_counts[item.name] = item_count
+            else:
+                print(f"Unknown item type in save: {item_type} ({item_name})")
 
     def load_world_data(self, world_data):
-        self.game_world.blocks = {}
+        self.game_world.reset_blocks()
         self.game_world.next_block_id = world_data.get("next_block_id", 0)
         self.game_world.current_block_coords = tuple(world_data.get("current_block_coords", (0, 0)))
 
@@ -251,16 +244,20 @@ class SaveManager:
         from items.ancient_scroll import AncientScroll
         from items.dragon_heart import DragonHeart
 
+        # Track asset cache misses so we can confirm loading doesn't hit the disk once warm
+        misses_before = asset_cache.misses
+
         for coords_str, block_data in world_data.get("blocks", {}).items():
             x, y = map(int, coords_str.split(","))
 
             block_id = block_data.get("id", f"block_{self.game_world.next_block_id}")
             new_block = self.game_world.get_or_generate_block(x, y)
             new_block.block_id = block_id
-            new_block.entities = []
+            new_block.clear_entities()
 
             if block_data.get("visited", False):
                 new_block.mark_as_visited()
+                self.game_world.notify_block_updated(new_block)
 
             entity_mapping = {
                 "Grass": Grass,
@@ -339,3 +336,7 @@ class SaveManager:
                         entity.collected = entity_data.get("collected")
 
                 new_block.add_entity(entity)
+
+        stats = asset_cache.get_stats()
+        print(f"DEBUG: World loaded with {stats['misses'] - misses_before} asset cache misses "
+              f"(total hits: {stats['hits']}, misses: {stats['misses']}, entries: {stats['entries']})")
@@ -0,0 +1,105 @@
+class Scene:
+    """
+    A modal screen shown over gameplay: the map, character screen, death
+    screen or one of the dialogs.
+
+    Wraps the UI object's own methods. is_open() tells whether it is showing,
+    handle_event(event) and update() only run while it is the top scene, and
+    draw(surface) runs every frame it is on the stack. An opaque scene fills
+    the whole screen, so nothing below it needs drawing.
+    """
+    def __init__(self, name, is_open, handle_event, draw, update=None, opaque=False):
+        self.name = name
+        self.is_open = is_open
+        self.handle_event = handle_event
+        self.draw = draw
+        self.update = update
+        self.opaque = opaque
+
+
+class SceneStack:
+    """
+    Modal scenes stacked over the gameplay view.
+
+    Scenes are pushed as they open and popped as they close (sync() follows
+    the UI objects' own show/hide state, so callbacks that open or close them
+    need no changes). While any scene is open gameplay is frozen: the last
+    gameplay frame is drawn once into a backdrop, and every frame after that
+    just blits the backdrop, draws the HUD over it (the player's stats can
+    still change, e.g. by using an item) and draws the scenes on top. Only
+    the top scene receives events and updates.
+    """
+    def __init__(self, draw_gameplay, draw_hud=None):
+        """
+        Args:
+            draw_gameplay: Function drawing one gameplay frame to a surface,
+                           without the HUD, used to capture the backdrop
+            draw_hud: Function drawing the HUD to a surface, every frame
+        """
+        self.draw_gameplay = draw_gameplay
+        self.draw_hud = draw_hud
+        self.scenes = []  # Every registered scene, in the order they're pushed when opened together
+        self.stack = []   # Open scenes, bottom to top
+        self.backdrop = None
+
+    def register(self, scene):
+        """Add a scene that can be opened over gameplay"""
+        self.scenes.append(scene)
+
+    def sync(self):
+        """Pop scenes that have closed and push the ones that have opened"""
+        self.stack = [scene for scene in self.stack if scene.is_open()]
+        for scene in self.scenes:
+            if scene not in self.stack and scene.is_open():
+                self.stack.append(scene)
+
+        # Back to gameplay: the next modal scene captures a new backdrop
+        if not self.stack:
+            self.backdrop = None
+
+    def is_empty(self):
+        """Check if gameplay is the active scene"""
+        return not self.stack
+
+    def top(self):
+        """Get the scene receiving input, or None during gameplay"""
+        return self.stack[-1] if self.stack else None
+
+    def handle_event(self, event):
+        """Pass an event to the top scene; returns False during gameplay"""
+        scene = self.top()
+        if scene is None:
+            return False
+        scene.handle_event(event)
+        self.sync()
+        return True
+
+    def update(self):
+        """Update the top scene"""
+        scene = self.top()
+        if scene and scene.update:
+            scene.update()
+
+    def invalidate_backdrop(self):
+        """Redraw the gameplay backdrop next frame (the world changed under a scene)"""
+        self.backdrop = None
+
+    def draw(self, surface):
+        """Draw the frozen gameplay frame and the open scenes over it"""
+        # Start from the highest opaque scene; below it nothing shows
+        first = 0
+        for index, scene in enumerate(self.stack):
+            if scene.opaque:
+                first = index
+
+        if not self.stack[first].opaque:
+            if self.backdrop is None:
+                self.draw_gameplay(surface)
+                self.backdrop = surface.copy()
+            else:
+                surface.blit(self.backdrop, (0, 0))
+            if self.draw_hud:
+                self.draw_hud(surface)
+
+        for scene in self.stack[first:]:
+            scene.draw(surface)
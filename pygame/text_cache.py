@@ -0,0 +1,171 @@
+from collections import OrderedDict
+
+# Rendered text surfaces kept before the least recently used are evicted
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+# Measured strings / wrap layouts kept (they are tiny, so only the count is bounded)
+MAX_METRICS = 4096
+MAX_LAYOUTS = 512
+
+
+class TextCache:
+    """
+    Shared cache for rendered text, text sizes and word-wrapped layouts.
+
+    Most UI text (HUD controls, map labels, dialog options, character sheet
+    headings) is the same from one frame to the next, so font.render only
+    has to run the first time a (font, text, colour, antialias) combination
+    is drawn. Surfaces live in an LRU bounded by their pixel memory, so
+    ever-changing strings (timers, debug lines) cannot grow it without limit.
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+
+        # Rendered surfaces, least recently used first
+        # Format: {(font, text, antialias, color, background): (Surface, bytes)}
+        self.surfaces = OrderedDict()
+
+        # Format: {(font, text): (width, height)}
+        self.metrics = OrderedDict()
+
+        # Format: {(font, text, max_width): (line, ...)}
+        self.layouts = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.layout_hits = 0
+        self.layout_misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Render text, reusing the surface from an earlier identical call
+
+        Takes the same arguments as pygame.font.Font.render (plus the font).
+        The returned surface is shared, so callers must not draw onto it.
+        """
+        key = (font, text, antialias, tuple(color), tuple(background) if background else None)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        if background is None:
+            text_surface = font.render(text, antialias, color)
+        else:
+            text_surface = font.render(text, antialias, color, background)
+
+        size_bytes = text_surface.get_pitch() * text_surface.get_height()
+        self.surfaces[key] = (text_surface, size_bytes)
+        self.bytes_used += size_bytes
+        self.evict()
+
+        return text_surface
+
+    def evict(self):
+        """Drop least recently used surfaces until the cache fits in max_bytes"""
+        # Always keep the newest entry, even if it alone is over budget
+        while self.bytes_used > self.max_bytes and len(self.surfaces) > 1:
+            _, (_, size_bytes) = self.surfaces.popitem(last=False)
+            self.bytes_used -= size_bytes
+            self.evictions += 1
+
+    def size(self, font, text):
+        """Cached font.size(text)"""
+        key = (font, text)
+        text_size = self.metrics.get(key)
+        if text_size is None:
+            text_size = font.size(text)
+            self.metrics[key] = text_size
+            if len(self.metrics) > MAX_METRICS:
+                self.metrics.popitem(last=False)
+        return text_size
+
+    def wrap(self, font, text, max_width):
+        """
+        Word-wrap text to a pixel width, caching the layout
+
+        Words are measured once each (and the space once per font), so the
+        cost is one font.size per distinct word instead of one per word per
+        candidate line. Words longer than max_width get a line of their own.
+
+        Returns:
+            Tuple of lines (never empty)
+        """
+        key = (font, text, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            self.layout_hits += 1
+            return lines
+
+        self.layout_misses += 1
+        lines = self.build_layout(font, text, max_width)
+        self.layouts[key] = lines
+        if len(self.layouts) > MAX_LAYOUTS:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def build_layout(self, font, text, max_width):
+        """Split text into lines no wider than max_width"""
+        # The entire text may already fit on one line
+        if self.size(font, text)[0] <= max_width:
+            return (text,)
+
+        space_width = self.size(font, ' ')[0]
+        lines = []
+        current_line = []
+        current_width = 0
+
+        for word in text.split():
+            word_width = self.size(font, word)[0]
+            width = current_width + space_width + word_width if current_line else word_width
+
+            if width <= max_width:
+                current_line.append(word)
+                current_width = width
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        return tuple(lines) if lines else (text,)
+
+    def get_stats(self):
+        """Get cache hit/miss statistics"""
+        total = self.hits + self.misses
+        layout_total = self.layout_hits + self.layout_misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.surfaces),
+            'bytes': self.bytes_used,
+            'hit_rate': self.hits / total if total else 0.0,
+            'layout_hit_rate': self.layout_hits / layout_total if layout_total else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset hit/miss counters (e.g. to measure a single screen)"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.layout_hits = 0
+        self.layout_misses = 0
+
+    def clear(self):
+        """Drop every cached surface and layout (e.g. after fonts change)"""
+        self.surfaces.clear()
+        self.metrics.clear()
+        self.layouts.clear()
+        self.bytes_used = 0
+
+
+# Singleton instance
+text_cache = TextCache()
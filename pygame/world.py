@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
 from entities.grass import Grass
 from entities.rock import Rock
 from entities.enemy.skeleton import Skeleton
@@ -10,7 +11,9 @@ from entities.npc.link import Link  # Import Link NPC
 from items.health_potion import HealthPotion  # Import the HealthPotion class
 from items.ancient_scroll import AncientScroll  # Import the Ancient Scroll class
 from items.dragon_heart import DragonHeart  # Import the Dragon Heart class
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN
+from asset_cache import asset_cache
+from ground import ground_renderer
 
 # Define enemy tiers based on difficulty levels
 ENEMY_TIERS = {
@@ -45,6 +48,9 @@ ENEMY_TIERS = {
     ]
 }
 
+# Baked static layers kept for recently visited blocks (each is a full screen surface)
+MAX_STATIC_LAYERS = 3
+
 class WorldBlock:
     """Represents a single block/chunk of the world"""
     def __init__(self, block_id, x_coord, y_coord):
@@ -53,11 +59,22 @@ class WorldBlock:
         self.y_coord = y_coord  # Y coordinate in the world grid
         self.entities = []  # List of all entities in this block
         self.visited = False  # Whether the player has visited this block before
+        
+        # Entities that never move (grass, rocks) are baked into one surface;
+        # everything else is drawn every frame
+        self.static_entities = []
+        self.dynamic_entities = []
+        self.static_layer = None  # Built lazily, dropped when a static entity changes
         print(f"DEBUG: Created new WorldBlock with ID {block_id} at ({x_coord}, {y_coord})")
         
     def add_entity(self, entity):
         """Add an entity to this block"""
         self.entities.append(entity)
+        if self.is_static(entity):
+            self.static_entities.append(entity)
+            self.invalidate_static_layer()
+        else:
+            self.dynamic_entities.append(entity)
         # entity_type = type(entity).__name__
         # print(f"DEBUG: Added {entity_type} to block ({self.x_coord}, {self.y_coord})")
         
@@ -65,10 +82,56 @@ class WorldBlock:
         """Remove an entity from this block"""
         if entity in self.entities:
             self.entities.remove(entity)
+            if self.is_static(entity):
+                self.static_entities.remove(entity)
+                self.invalidate_static_layer()
+            else:
+                self.dynamic_entities.remove(entity)
+    
+    def clear_entities(self):
+        """Remove every entity from this block"""
+        self.entities = []
+        self.static_entities = []
+        self.dynamic_entities = []
+        self.invalidate_static_layer()
             
     def get_entities(self):
         """Get all entities in this block"""
         return self.entities
+    
+    def get_dynamic_entities(self):
+        """Get the entities that have to be drawn every frame"""
+        return self.dynamic_entities
+    
+    @staticmethod
+    def is_static(entity):
+        """Check if an entity never moves or animates (so it can be baked)"""
+        return hasattr(entity, 'is_static') and entity.is_static()
+    
+    def invalidate_static_layer(self):
+        """Drop the baked static layer so it is rebuilt on next draw"""
+        self.static_layer = None
+    
+    def render_static_layer(self, ground):
+        """
+        Bake the ground and every static entity into one screen-sized surface
+        
+        Args:
+            ground: Ground colour to fill with, or a GroundRenderer for tiled ground
+        """
+        static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface():
+            static_layer = static_layer.convert()
+        
+        if hasattr(ground, 'draw_block'):
+            ground.draw_block(static_layer, self.x_coord, self.y_coord)
+        else:
+            static_layer.fill(ground)
+        
+        for entity in self.static_entities:
+            entity.draw(static_layer)
+        
+        return static_layer
         
     def get_entities_by_type(self, entity_type):
         """Get all entities of a specific type in this block"""
@@ -86,9 +149,76 @@ class World:
     """Manages the entire game world made up of multiple blocks"""
     def __init__(self):
         self.blocks = {}  # Dictionary to store blocks by their coordinates (x, y)
+        # Callbacks taking the new block coordinates whenever the current block changes
+        self.block_listeners = []
+        # Callbacks taking a block whenever one is created or visited (the map paints it)
+        self.block_update_listeners = []
+        # Callbacks run when every block is replaced at once (loading a save)
+        self.blocks_reset_listeners = []
         self.current_block_coords = (0, 0)  # Start at origin block
         self.next_block_id = 0  # Counter for generating unique block IDs
         
+        # Ground under every block: tiled from the tileset, or a flat colour without it
+        self.ground = ground_renderer if ground_renderer.is_available() else GREEN
+        
+        # Blocks currently holding a baked static layer, least recently drawn first
+        # Format: {block: None}
+        self.static_layer_blocks = OrderedDict()
+        
+    @property
+    def current_block_coords(self):
+        """Coordinates of the block the player is in"""
+        return self._current_block_coords
+    
+    @current_block_coords.setter
+    def current_block_coords(self, coords):
+        changed = coords != getattr(self, '_current_block_coords', None)
+        self._current_block_coords = coords
+        if changed:
+            for callback in self.block_listeners:
+                callback(coords)
+    
+    def add_block_listener(self, callback):
+        """Call callback(block_coords) whenever the current block changes"""
+        if callback not in self.block_listeners:
+            self.block_listeners.append(callback)
+    
+    def remove_block_listener(self, callback):
+        """Stop notifying a callback"""
+        if callback in self.block_listeners:
+            self.block_listeners.remove(callback)
+    
+    def add_block_update_listener(self, callback):
+        """Call callback(block) whenever a block is created or visited"""
+        if callback not in self.block_update_listeners:
+            self.block_update_listeners.append(callback)
+    
+    def remove_block_update_listener(self, callback):
+        """Stop notifying a callback"""
+        if callback in self.block_update_listeners:
+            self.block_update_listeners.remove(callback)
+    
+    def notify_block_updated(self, block):
+        """Tell every listener that a block was created or visited"""
+        for callback in self.block_update_listeners:
+            callback(block)
+    
+    def add_blocks_reset_listener(self, callback):
+        """Call callback() whenever every block is replaced at once"""
+        if callback not in self.blocks_reset_listeners:
+            self.blocks_reset_listeners.append(callback)
+    
+    def remove_blocks_reset_listener(self, callback):
+        """Stop notifying a callback"""
+        if callback in self.blocks_reset_listeners:
+            self.blocks_reset_listeners.remove(callback)
+    
+    def reset_blocks(self):
+        """Drop every block (before loading a save's blocks) and tell the listeners"""
+        self.blocks = {}
+        for callback in self.blocks_reset_listeners:
+            callback()
+    
     def generate_block(self, x_coord, y_coord, player_entry_point=None):
         """Generate a new block at the specified coordinates"""
         # If block already exists, just return it
@@ -106,7 +236,9 @@ class World:
         self.blocks[block_key] = new_block
         
         # Generate content for the block (grass patches, etc.)
+        misses_before = asset_cache.misses
         self._populate_block(new_block, player_entry_point, x_coord, y_coord)
+        print(f"DEBUG: Block ({x_coord}, {y_coord}) generated with {asset_cache.misses - misses_before} asset cache misses")
         
         return new_block
     
@@ -192,6 +324,7 @@ class World:
         
         # Mark as populated
         block.mark_as_visited()
+        self.notify_block_updated(block)
     
     def place_special_items(self, item_type=None, coords=None):
         """Place special items like XP modifiers in specific world locations or random locations
@@ -459,7 +592,7 @@ class World:
     def _add_grass_patches(self, block, count, safe_area=None):
         """Add grass patches to a block"""
         min_distance_between_entities = 64
-        existing_entities = block.get_entities()  # Get all existing entities to check against
+        existing_entities = list(block.get_entities())  # Copy: add_entity already appends to the block
         
         attempts = 0
         grass_added = 0
@@ -495,7 +628,7 @@ class World:
     def _add_rock_patches(self, block, count, safe_area=None):
         """Add rock patches to a block"""
         min_distance_between_entities = 64
-        existing_entities = block.get_entities()  # Get all existing entities to check against
+        existing_entities = list(block.get_entities())  # Copy: add_entity already appends to the block
         
         attempts = 0
         rocks_added = 0
@@ -618,6 +751,7 @@ class World:
             print(f"DEBUG: Creating block at ({x_coord}, {y_coord}) with ID {block_id}")
             new_block = WorldBlock(block_id, x_coord, y_coord)
             self.blocks[block_key] = new_block
+            self.notify_block_updated(new_block)
             return new_block
         
         return self.blocks[block_key]
@@ -764,6 +898,45 @@ class World:
             return current_block.get_entities()
         return []
     
+    def get_current_dynamic_entities(self):
+        """Get the entities in the current block that are drawn every frame"""
+        current_block = self.get_current_block()
+        if current_block:
+            return current_block.get_dynamic_entities()
+        return []
+    
+    def get_static_layer(self, block=None):
+        """
+        Get the baked ground + static entity layer of a block (the current one by default)
+        
+        Layers are only kept for the MAX_STATIC_LAYERS most recently drawn blocks.
+        """
+        block = block or self.get_current_block()
+        if block is None:
+            return None
+        
+        if block.static_layer is None:
+            block.static_layer = block.render_static_layer(self.ground)
+            print(f"DEBUG: Baked static layer for block ({block.x_coord}, {block.y_coord}) "
+                  f"with {len(block.static_entities)} static entities")
+        
+        # Mark as most recently used, then drop layers of blocks left long ago
+        self.static_layer_blocks[block] = None
+        self.static_layer_blocks.move_to_end(block)
+        while len(self.static_layer_blocks) > MAX_STATIC_LAYERS:
+            old_block, _ = self.static_layer_blocks.popitem(last=False)
+            old_block.invalidate_static_layer()
+        
+        return block.static_layer
+    
+    def draw_static_layer(self, surface):
+        """Draw the current block's ground and static entities in one blit"""
+        static_layer = self.get_static_layer()
+        if static_layer:
+            surface.blit(static_layer, (0, 0))
+        else:
+            surface.fill(GREEN)
+    
     def get_block_description(self):
         """Get a description of the current block for display"""
         x, y = self.current_block_coords